@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+Audit d'accessibilité d'une arborescence de ressources (HTML, CSS, SVG)
+Usage: python accessibility_tester.py --crawl exemples_assets/ --jobs 4
+
+Chaque fichier est analysé dans un processus de travail :
+- pages HTML : cascade statique (feuilles liées locales, blocs <style>, attributs
+  style, var()) de la couleur, de la taille de police et du fond de chaque élément
+  affiché portant du texte (display, visibility, opacité nulle) ; les fonds
+  semi-transparents sont composés sur celui du parent et chaque arrêt d'un
+  dégradé est testé comme fond possible ;
+- feuilles CSS : chaque règle déclarant « color », sur son propre fond ou, à
+  défaut, sur la couleur de page ;
+- SVG : textes et fonds réels fournis par svg_accessibility.
+
+Les paires (texte, fond, classe de taille) sont dédupliquées pour tout l'arbre :
+chaque paire distincte n'est évaluée qu'une fois, en un seul calcul vectorisé,
+puis les résultats sont redistribués aux fichiers qui l'utilisent.
+
+Limites : pas de mise en page (un élément positionné est supposé sur le fond de
+son parent), les états dynamiques (:hover, :focus...) et pseudo-éléments sont
+ignorés dans la cascade des pages, une image de fond rend le fond approché et
+une animation est supposée finir opaque (résultat approché).
+"""
+
+import re
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+from accessibility_tester import AccessibilityTester, ReportAggregator
+from color_engine import contrast_ratio, luminance_array, parse_color, parse_color_alpha
+from font_loading_report import (FONT_SIZE_TOKEN, PAGE_EXTENSIONS, PageParser, RuleIndex, Stylesheet,
+                                 StylesheetCache, matches_selector, resolve_local, resolve_vars, split_top_level)
+from parallel import error_message, iter_pool_results
+from svg_accessibility import MAX_TEXT_LENGTH, audit_svg, blend, parse_font_size, parse_opacity, to_hex
+
+ASSET_EXTENSIONS = PAGE_EXTENSIONS | {'.css', '.svg'}
+
+# Propriétés conservées dans les règles CSS pour l'audit des couleurs
+COLOR_PROPERTIES = ('color', 'background', 'background-color', 'font', 'font-size', 'opacity',
+                    'display', 'visibility', 'animation', 'animation-name')
+
+# Styles par défaut des navigateurs pour les propriétés suivies
+USER_AGENT_STYLES = {
+    'h1': {'font-size': '2em'}, 'h2': {'font-size': '1.5em'}, 'h3': {'font-size': '1.17em'},
+    'h5': {'font-size': '0.83em'}, 'h6': {'font-size': '0.67em'}, 'small': {'font-size': 'smaller'},
+    'a': {'color': '#0000ee'}, 'mark': {'color': 'black', 'background-color': 'yellow'}
+}
+
+# États et pseudo-éléments : jamais supposés actifs dans la cascade statique d'une page
+DYNAMIC_SELECTOR = re.compile(r'::|:(?:hover|focus|focus-within|focus-visible|active|visited|target|'
+                              r'checked|disabled|before|after|first-line|first-letter)\b', re.I)
+COLOR_TOKEN = re.compile(r'#[0-9a-fA-F]{3,8}\b|rgba?\([^()]*\)|\b[a-zA-Z]+\b')
+
+DEFAULT_FONT_SIZE = 16.0
+MAX_SAMPLES = 3
+
+# ---------------------------------------------------------------------------
+# Couleurs CSS
+# ---------------------------------------------------------------------------
+
+def _css_paint(value):
+    """Couleur CSS -> (rgb 0-1, alpha) ; ValueError si non reconnue"""
+    rgb, alpha = parse_color_alpha(value)
+    return tuple(channel / 255.0 for channel in rgb), alpha
+
+def _background_paints(value):
+    """Valeur de background(-color) -> ([(rgb, alpha), ...], image présente)
+
+    Un dégradé donne un candidat par arrêt de couleur ; url() signale une image
+    dont le contenu n'est pas connu.
+    """
+    value = value.strip()
+    if value.lower() in ('none', 'transparent', 'initial', 'unset'):
+        return [], False
+    has_image = 'url(' in value.lower()
+    paints = []
+    for match in COLOR_TOKEN.finditer(re.sub(r'url\([^)]*\)', ' ', value)):
+        try:
+            paint = _css_paint(match.group(0))
+        except ValueError:
+            continue
+        if paint[1] > 0:
+            paints.append(paint)
+    return list(dict.fromkeys(paints)), has_image
+
+def _declared_font_size(value):
+    """Taille contenue dans un raccourci « font », None si absente"""
+    for token in split_top_level(value.replace('\t', ' '), ' '):
+        if token and FONT_SIZE_TOKEN.match(token):
+            return token.split('/')[0]
+    return None
+
+def _record(pairs, foreground, backdrop, font_size, is_large, sample, approximate):
+    """Ajoute une occurrence de paire aux paires d'un fichier"""
+    key = (to_hex(foreground), to_hex(backdrop), is_large)
+    entry = pairs.get(key)
+    if entry is None:
+        entry = pairs[key] = {'font_size': font_size, 'occurrences': 0, 'approximate': False, 'samples': []}
+    entry['font_size'] = min(entry['font_size'], font_size)
+    entry['occurrences'] += 1
+    entry['approximate'] = entry['approximate'] or approximate
+    if len(entry['samples']) < MAX_SAMPLES and sample not in entry['samples']:
+        entry['samples'].append(sample)
+
+# ---------------------------------------------------------------------------
+# Pages HTML
+# ---------------------------------------------------------------------------
+
+def compute_colors(elements, rules, background, warnings):
+    """Couleur (rgb, alpha), taille en px et fonds possibles calculés pour chaque élément"""
+    index = RuleIndex([rule for rule in rules if not DYNAMIC_SELECTOR.search(rule.selector)])
+    initial = {'custom': {}, 'color': ((0.0, 0.0, 0.0), 1.0), 'font-size': DEFAULT_FONT_SIZE,
+               'opacity': 1.0, 'backdrops': (background,), 'approximate': False, 'rendered': True, 'visible': True}
+
+    for element in elements:
+        parent = element.parent.computed if element.parent is not None and element.parent.computed else initial
+
+        matching = sorted((rule for rule in index.candidates(element) if matches_selector(element, rule.compounds)),
+                          key=lambda rule: (rule.specificity, rule.order))
+        layers = [USER_AGENT_STYLES.get(element.tag, {})]
+        layers.extend(rule.declarations for rule in matching)
+        layers.append(element.inline_style)
+
+        custom = dict(parent['custom'])
+        for layer in layers:
+            custom.update({name: value for name, value in layer.items() if name.startswith('--')})
+
+        # Le raccourci « background » remplace la couleur de fond déclarée avant lui
+        declared = {}
+        for layer in layers:
+            for name, value in layer.items():
+                if name in ('background', 'background-color'):
+                    declared['background-color'] = value
+                elif name == 'font':
+                    size = _declared_font_size(resolve_vars(value, custom))
+                    if size:
+                        declared['font-size'] = size
+                elif name in COLOR_PROPERTIES:
+                    declared[name] = value
+
+        computed = {'custom': custom, 'approximate': parent['approximate']}
+
+        color = resolve_vars(declared.get('color', 'inherit'), custom).strip()
+        computed['color'] = parent['color']
+        if color.lower() not in ('inherit', 'currentcolor', ''):
+            try:
+                computed['color'] = _css_paint(color)
+            except ValueError:
+                warnings.add(f"couleur non reconnue: {color}")
+
+        size = resolve_vars(declared.get('font-size', 'inherit'), custom)
+        if '(' in size:
+            # calc(), clamp()... : taille du parent, résultat approché
+            computed['approximate'] = True
+        computed['font-size'] = parse_font_size(size, parent['font-size'])
+
+        # display: none retire l'élément et ses descendants ; visibility est héritée
+        display = resolve_vars(declared.get('display', ''), custom).strip().lower()
+        computed['rendered'] = parent['rendered'] and display != 'none'
+        visibility = resolve_vars(declared.get('visibility', 'inherit'), custom).strip().lower()
+        computed['visible'] = parent['visible'] if visibility in ('inherit', '') else visibility == 'visible'
+
+        # L'opacité d'un élément s'applique à son fond comme à tout le texte qu'il contient.
+        # Une animation (apparition en fondu...) part souvent d'une opacité nulle : l'état
+        # final, supposé opaque, est audité et le résultat marqué approché
+        opacity = parse_opacity(resolve_vars(declared.get('opacity', '1'), custom))
+        animation = resolve_vars(declared.get('animation-name', declared.get('animation', 'none')), custom)
+        if animation.strip().lower() not in ('none', '') and opacity < 1:
+            opacity = 1.0
+            computed['approximate'] = True
+        computed['opacity'] = parent['opacity'] * opacity
+        if computed['opacity'] == 0:
+            computed['rendered'] = False
+
+        computed['backdrops'] = parent['backdrops']
+        fill = resolve_vars(declared.get('background-color', 'transparent'), custom)
+        if fill.strip().lower() != 'inherit':
+            paints, has_image = _background_paints(fill)
+            if paints:
+                computed['backdrops'] = tuple(dict.fromkeys(
+                    blend(rgb, alpha * computed['opacity'], below) for rgb, alpha in paints
+                    for below in parent['backdrops']))
+            if has_image:
+                computed['approximate'] = True
+        element.computed = computed
+
+def _page_pairs(path, root, tester, background, pairs, warnings):
+    parser = PageParser()
+    parser.feed(path.read_text(encoding='utf-8', errors='replace'))
+    parser.close()
+
+    cache = StylesheetCache(root, COLOR_PROPERTIES)
+    sheets = []
+    for entry in parser.stylesheets:
+        if entry[0] == 'inline':
+            sheets.append(Stylesheet(entry[1], path, root, COLOR_PROPERTIES))
+            continue
+        local = resolve_local(entry[1], path, root)
+        loaded = cache.load(local) if local is not None else []
+        if not loaded:
+            warnings.add(f"feuille non analysée: {entry[1]}")
+        sheets.extend(loaded)
+
+    rules = [rule for sheet in sheets for rule in sheet.rules]
+    for order, rule in enumerate(rules):
+        rule.order = order
+    compute_colors(parser.elements, rules, background, warnings)
+
+    for element in parser.elements:
+        if element.hidden or not element.text:
+            continue
+        if not element.computed['rendered'] or not element.computed['visible']:
+            continue
+        text = ' '.join(' '.join(element.text).split())
+        if not text:
+            continue
+        computed = element.computed
+        font_size = round(computed['font-size'], 2)
+        is_large = tester.is_large_text({'value': font_size, 'unit': 'px'})
+        label = element.tag + (f"#{element.id}" if element.id else '') + \
+            ''.join(f".{name}" for name in sorted(element.classes))
+        rgb, alpha = computed['color']
+        alpha *= computed['opacity']
+        for backdrop in computed['backdrops']:
+            _record(pairs, blend(rgb, alpha, backdrop), backdrop, font_size, is_large,
+                    {'element': label, 'text': text[:MAX_TEXT_LENGTH]}, computed['approximate'])
+
+# ---------------------------------------------------------------------------
+# Feuilles CSS et SVG
+# ---------------------------------------------------------------------------
+
+def _stylesheet_pairs(path, root, tester, background, pairs, warnings):
+    sheets = StylesheetCache(root, COLOR_PROPERTIES).load(path)
+    if not sheets:
+        return
+
+    # Propriétés personnalisées globales, @import compris
+    custom = {}
+    for sheet in sheets:
+        for rule in sheet.rules:
+            if rule.selector.strip() in (':root', 'html', 'body', '*'):
+                custom.update({name: value for name, value in rule.declarations.items() if name.startswith('--')})
+
+    # Une règle à plusieurs sélecteurs partage un seul dictionnaire de déclarations
+    selectors = {}
+    for rule in sheets[-1].rules:
+        selectors.setdefault(id(rule.declarations), (rule.declarations, []))[1].append(rule.selector)
+
+    for declarations, names in selectors.values():
+        if 'color' not in declarations:
+            continue
+        color = resolve_vars(declarations['color'], custom).strip()
+        if color.lower() in ('inherit', 'currentcolor', ''):
+            continue
+        try:
+            rgb, alpha = _css_paint(color)
+        except ValueError:
+            warnings.add(f"couleur non reconnue: {color}")
+            continue
+
+        size = declarations.get('font-size') or _declared_font_size(declarations.get('font', '')) or 'medium'
+        font_size = round(parse_font_size(resolve_vars(size, custom), DEFAULT_FONT_SIZE), 2)
+        is_large = tester.is_large_text({'value': font_size, 'unit': 'px'})
+
+        # Sans fond déclaré dans la règle, le texte est supposé sur la couleur de page
+        fill = declarations.get('background-color') or declarations.get('background') or ''
+        paints, has_image = _background_paints(resolve_vars(fill, custom))
+        backdrops = dict.fromkeys(blend(paint_rgb, paint_alpha, background) for paint_rgb, paint_alpha in paints)
+        approximate = has_image or not paints
+        for backdrop in backdrops or (background,):
+            _record(pairs, blend(rgb, alpha, backdrop), backdrop, font_size, is_large,
+                    {'element': ', '.join(names), 'text': None}, approximate)
+
+def _svg_pairs(path, root, tester, background, pairs, warnings):
+    report = audit_svg(str(path), tester, to_hex(background))
+    warnings.update(report['warnings'])
+    for text in report['texts']:
+        label = text['element'] + (f"#{text['id']}" if text['id'] else '')
+        _record(pairs, tuple(channel / 255.0 for channel in parse_color(text['foreground'])),
+                tuple(channel / 255.0 for channel in parse_color(text['backdrop'])),
+                text['font_size']['value'], text['is_large_text'],
+                {'element': label, 'text': text['text']}, text['approximate'])
+
+EXTRACTORS = {'.css': _stylesheet_pairs, '.svg': _svg_pairs}
+
+def _relative_name(path, root):
+    path = Path(path)
+    return str(path.relative_to(root)) if root and path.is_relative_to(root) else str(path)
+
+def extract_file_pairs(path, root, background='#ffffff'):
+    """Paires (texte, fond, grand texte) d'un fichier, avec occurrences et exemples
+
+    Exécutée dans un processus de travail : le résultat ne contient que des types simples.
+    """
+    path = Path(path)
+    tester = AccessibilityTester()
+    pairs = {}
+    warnings = set()
+    result = {'file': _relative_name(path, root), 'type': path.suffix.lower().lstrip('.')}
+    try:
+        extractor = EXTRACTORS.get(path.suffix.lower(), _page_pairs)
+        extractor(path, root, tester, tuple(channel / 255.0 for channel in parse_color(background)), pairs, warnings)
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['pairs'] = [{'foreground': foreground, 'background': backdrop, 'is_large_text': is_large, **entry}
+                       for (foreground, backdrop, is_large), entry in pairs.items()]
+    result['warnings'] = sorted(warnings)
+    return result
+
+# ---------------------------------------------------------------------------
+# Arborescence
+# ---------------------------------------------------------------------------
+
+def iter_assets(root):
+    """Fichiers HTML, CSS et SVG d'un dossier (ou le fichier lui-même), dans un ordre stable
+
+    Lève FileNotFoundError si le chemin n'existe pas.
+    """
+    root = Path(root)
+    if not root.exists():
+        raise FileNotFoundError(f"Chemin introuvable: {root}")
+    if root.is_file():
+        yield root
+        return
+    yield from sorted(path for path in root.rglob('*')
+                      if path.suffix.lower() in ASSET_EXTENSIONS and path.is_file())
+
+def _iter_extracted(paths, root, background, jobs):
+    """Résultats de extract_file_pairs dans l'ordre des fichiers, en parallèle si jobs > 1"""
+    def failed(path, error):
+        return {'file': _relative_name(path, root), 'type': path.suffix.lower().lstrip('.'), 'pairs': [],
+                'warnings': [], 'error': error_message(error)}
+
+    return iter_pool_results(partial(extract_file_pairs, root=root, background=background), paths, jobs, failed)
+
+def evaluate_pairs(foregrounds, backgrounds, is_large, wcag_levels):
+    """Contrastes et conformité (niveau -> masque) de paires distinctes, en un seul calcul"""
+    ratios = contrast_ratio(luminance_array(foregrounds), luminance_array(backgrounds))
+    is_large = np.asarray(is_large, dtype=bool)
+    compliance = {level: ratios >= np.where(is_large, thresholds['large'], thresholds['small'])
+                  for level, thresholds in wcag_levels.items()}
+    return ratios, compliance
+
+def crawl_assets(root, tester=None, background='#ffffff', jobs=1):
+    """Rapport agrégé d'une arborescence : synthèse sur les paires distinctes et constats par fichier"""
+    tester = tester or AccessibilityTester()
+    root = Path(root).resolve()
+    site_root = root if root.is_dir() else root.parent
+    background = '#%02x%02x%02x' % parse_color(background)
+
+    # Paires distinctes de tout l'arbre : (texte, fond, grand texte) -> position
+    unique = {}
+    occurrences = []
+    files_using = []
+    smallest = []
+    files = []
+    for extracted in _iter_extracted(list(iter_assets(root)), site_root, background, jobs):
+        references = []
+        for pair in extracted.pop('pairs'):
+            key = (pair['foreground'], pair['background'], pair['is_large_text'])
+            position = unique.get(key)
+            if position is None:
+                position = unique[key] = len(unique)
+                occurrences.append(0)
+                files_using.append(0)
+                smallest.append(pair['font_size'])
+            occurrences[position] += pair['occurrences']
+            files_using[position] += 1
+            smallest[position] = min(smallest[position], pair['font_size'])
+            references.append((position, pair))
+        files.append((extracted, references))
+
+    keys = list(unique)
+    ratios, compliance = evaluate_pairs([key[0] for key in keys], [key[1] for key in keys],
+                                        [key[2] for key in keys], tester.wcag_levels)
+    rounded = np.round(ratios, 2).tolist()
+    compliance = {level: mask.tolist() for level, mask in compliance.items()}
+
+    def pair_result(position, font_size):
+        foreground, backdrop, is_large = keys[position]
+        levels = {level: compliance[level][position] for level in compliance}
+        return {
+            'foreground': foreground,
+            'background': backdrop,
+            'contrast_ratio': rounded[position],
+            'font_size': {'value': font_size, 'unit': 'px'},
+            'is_large_text': is_large,
+            'wcag_compliance': levels,
+            'overall_compliant': all(levels.values())
+        }
+
+    aggregator = ReportAggregator()
+    pairs = []
+    for position, (foreground, backdrop, _) in enumerate(keys):
+        result = pair_result(position, smallest[position])
+        aggregator.add(f"{foreground}_on_{backdrop}_{smallest[position]}px", result)
+        pairs.append({**result, 'occurrences': occurrences[position], 'files': files_using[position]})
+
+    file_reports = []
+    for extracted, references in files:
+        findings = []
+        for position, pair in references:
+            if compliance['AA'][position]:
+                continue
+            findings.append({**pair_result(position, pair['font_size']), 'occurrences': pair['occurrences'],
+                             'approximate': pair['approximate'], 'samples': pair['samples']})
+        findings.sort(key=lambda finding: finding['contrast_ratio'])
+        file_reports.append({
+            **extracted,
+            'pairs_found': len(references),
+            'occurrences': sum(pair['occurrences'] for _, pair in references),
+            'aa_failures': len(findings),
+            'aaa_failures': sum(1 for position, _ in references if not compliance['AAA'][position]),
+            'findings': findings
+        })
+
+    summary = aggregator.summary()
+    summary.update({
+        'files_scanned': len(file_reports),
+        'files_with_errors': sum(1 for report in file_reports if 'error' in report),
+        'files_failing_aa': sum(1 for report in file_reports if report['aa_failures']),
+        'unique_pairs': len(keys),
+        'pair_occurrences': sum(occurrences)
+    })
+    return {
+        'root': str(root),
+        'background': background,
+        'summary': summary,
+        'recommendations': aggregator.recommendations(),
+        'pairs': pairs,
+        'files': file_reports
+    }
@@ -2,6 +2,7 @@
 """
 Testeur d'accessibilité pour designs et couleurs
 Usage: python accessibility_tester.py --colors "#2E5B91,#FFFFFF" --fonts "16px,18px"
+       python accessibility_tester.py --crawl site/ --jobs 4
 
 Analyse l'accessibilité WCAG 2.1 des combinaisons couleurs/polices
 """
@@ -12,6 +13,229 @@ import re
 from pathlib import Path
 import colorsys
 
+import numpy as np
+
+from color_engine import (parse_color, parse_color_alpha, color_luminance, color_contrast, contrast_matrix,
+                          luminance_array, nearest_contrast_colors, rgb_to_hex)
+
+# Paires corrigées par lot lors de la recherche de couleurs conformes
+SUGGESTION_CHUNK_SIZE = 16384
+
+class ContrastResults:
+    """Résultats de toutes les paires ordonnées × tailles, conservés en tableaux compacts
+
+    contrast[i, j] : couleur i sur couleur j ; compliance[niveau, classe, i, j] :
+    conformité par niveau WCAG et classe de taille (0 = petit texte, 1 = grand texte).
+    Les dictionnaires du format historique ne sont construits qu'à la demande.
+    """
+
+    def __init__(self, colors, font_sizes, is_large, wcag_levels):
+        self.colors = list(colors)
+        self.font_sizes = list(font_sizes)
+        self.levels = list(wcag_levels)
+        self.size_class = np.array(is_large, dtype=np.intp).reshape(-1)
+
+        self.contrast = contrast_matrix(self.colors) if self.colors else np.zeros((0, 0))
+        self.rounded = np.round(self.contrast, 2)
+        thresholds = np.array([[wcag_levels[level]['small'], wcag_levels[level]['large']] for level in self.levels])
+        self.compliance = self.contrast[None, None] >= thresholds.reshape(len(self.levels), 2, 1, 1)
+        # Une couleur n'est pas testée sur elle-même (même position dans la liste)
+        self.pair_mask = ~np.eye(len(self.colors), dtype=bool)
+
+    def __len__(self):
+        return int(self.pair_mask.sum()) * len(self.font_sizes)
+
+    def level_mask(self, level):
+        """Conformité (n, n, tailles) au niveau donné, False sur la diagonale"""
+        mask = self.compliance[self.levels.index(level)][self.size_class].transpose(1, 2, 0)
+        return mask & self.pair_mask[:, :, None]
+
+    def overall_mask(self):
+        """(n, n, tailles) : conforme à tous les niveaux"""
+        mask = self.compliance.all(axis=0)[self.size_class].transpose(1, 2, 0)
+        return mask & self.pair_mask[:, :, None]
+
+    def pair_indices(self, mask=None):
+        """Indices (i, j, taille) des entrées sélectionnées, dans l'ordre historique du rapport"""
+        selected = np.broadcast_to(self.pair_mask[:, :, None], (len(self.colors), len(self.colors),
+                                                                len(self.font_sizes)))
+        if mask is not None:
+            selected = selected & mask
+        return np.argwhere(selected)
+
+    def key(self, i, j, size_index):
+        font_size = self.font_sizes[size_index]
+        return f"{self.colors[i]}_on_{self.colors[j]}_{font_size['value']}{font_size['unit']}"
+
+    def keys(self, mask=None):
+        """Clés du format historique des entrées sélectionnées"""
+        suffixes = [f"{font_size['value']}{font_size['unit']}" for font_size in self.font_sizes]
+        colors = self.colors
+        return [f"{colors[i]}_on_{colors[j]}_{suffixes[size_index]}"
+                for i, j, size_index in self.pair_indices(mask).tolist()]
+
+    def result(self, i, j, size_index):
+        """Dictionnaire du format historique pour une entrée"""
+        size_class = self.size_class[size_index]
+        compliance = {level: bool(self.compliance[index, size_class, i, j]) for index, level in enumerate(self.levels)}
+        return {
+            'foreground': self.colors[i],
+            'background': self.colors[j],
+            'contrast_ratio': float(self.rounded[i, j]),
+            'font_size': self.font_sizes[size_index],
+            'is_large_text': bool(size_class),
+            'wcag_compliance': compliance,
+            'overall_compliant': all(compliance.values())
+        }
+
+    def iter_results(self, mask=None):
+        """(clé, dictionnaire) des entrées sélectionnées, construites une à une"""
+        for i, j, size_index in self.pair_indices(mask).tolist():
+            yield self.key(i, j, size_index), self.result(i, j, size_index)
+
+    def to_dict(self, mask=None):
+        return dict(self.iter_results(mask))
+
+    def best(self, count):
+        """Les meilleures entrées par contraste décroissant (ordre historique à égalité)"""
+        indices = self.pair_indices()
+        if not len(indices):
+            return []
+        ratios = self.rounded[indices[:, 0], indices[:, 1]]
+        order = np.argsort(-ratios, kind='stable')[:count]
+        return [self.result(*indices[position]) for position in order]
+
+class ReportAggregator:
+    """Résumé, recommandations et problèmes par couleur, accumulés en un seul passage"""
+
+    def __init__(self):
+        self.total = 0
+        self.compliant = 0
+        self.aa_compliant = 0
+        self.aaa_compliant = 0
+        self.low_contrast = []
+        self.medium_contrast = []
+        self.color_issues = {}
+
+    def add(self, key, result):
+        """Intègre un résultat au format historique"""
+        self.total += 1
+        self.compliant += result['overall_compliant']
+        self.aa_compliant += result['wcag_compliance']['AA']
+        self.aaa_compliant += result['wcag_compliance']['AAA']
+
+        # Identifier les problèmes courants
+        if result['contrast_ratio'] < 3.0:
+            self.low_contrast.append(key)
+        elif result['contrast_ratio'] < 4.5:
+            self.medium_contrast.append(key)
+
+        if not result['wcag_compliance']['AA']:
+            self.color_issues.setdefault(result['foreground'], []).append(result['background'])
+
+    @classmethod
+    def from_matrix(cls, results):
+        """Même agrégat calculé sur les masques d'un ContrastResults"""
+        aggregate = cls()
+        aggregate.total = len(results)
+        aggregate.compliant = int(results.overall_mask().sum())
+        aa_mask = results.level_mask('AA')
+        aggregate.aa_compliant = int(aa_mask.sum())
+        aggregate.aaa_compliant = int(results.level_mask('AAA').sum())
+
+        ratios = results.rounded[:, :, None]
+        aggregate.low_contrast = results.keys(ratios < 3.0)
+        aggregate.medium_contrast = results.keys((ratios >= 3.0) & (ratios < 4.5))
+        for i, j, _ in results.pair_indices(~aa_mask).tolist():
+            aggregate.color_issues.setdefault(results.colors[i], []).append(results.colors[j])
+        return aggregate
+
+    def summary(self):
+        return {
+            'total_combinations_tested': self.total,
+            'fully_compliant_combinations': self.compliant,
+            'aa_compliant': self.aa_compliant,
+            'aaa_compliant': self.aaa_compliant,
+            'compliance_percentage': round((self.compliant / self.total) * 100, 1) if self.total > 0 else 0
+        }
+
+    def recommendations(self):
+        recommendations = []
+
+        if self.low_contrast:
+            recommendations.append({
+                'type': 'critical',
+                'message': f"{len(self.low_contrast)} combinaisons ont un contraste très faible (< 3.0)",
+                'affected_combinations': self.low_contrast,
+                'suggestion': "Considérez des couleurs avec plus de contraste ou augmentez la taille de police"
+            })
+
+        if self.medium_contrast:
+            recommendations.append({
+                'type': 'warning',
+                'message': f"{len(self.medium_contrast)} combinaisons ne respectent pas WCAG AA",
+                'affected_combinations': self.medium_contrast,
+                'suggestion': "Augmentez le contraste ou utilisez pour du texte de grande taille uniquement"
+            })
+
+        # Recommandations spécifiques par couleur
+        for color, backgrounds in self.color_issues.items():
+            recommendations.append({
+                'type': 'color_specific',
+                'color': color,
+                'issue': f"Ne fonctionne pas bien avec {len(backgrounds)} couleurs de fond",
+                'backgrounds': backgrounds,
+                'suggestion': "Remplacez cette couleur par une alternative plus contrastée"
+            })
+
+        return recommendations
+
+DETAIL_FORMATS = ['json', 'jsonl', 'npz']
+
+def write_detailed_results(results, output_base, details_format, shard_size=0):
+    """Écrit les résultats détaillés à côté du rapport ; renvoie les fichiers créés
+
+    jsonl : une combinaison par ligne, construite et écrite au fil de l'eau,
+    répartie en fichiers de shard_size lignes si demandé.
+    npz : colonnes compactes (contrastes n×n, masques de conformité) d'un ContrastResults.
+    """
+    output_base = Path(output_base)
+    stem = output_base.with_suffix('') if output_base.suffix == '.json' else output_base
+
+    if details_format == 'npz':
+        if not isinstance(results, ContrastResults):
+            raise ValueError("Le format npz nécessite des résultats matriciels")
+        path = Path(f"{stem}.details.npz")
+        np.savez_compressed(path,
+                            colors=np.array(results.colors),
+                            font_sizes=np.array(json.dumps(results.font_sizes)),
+                            is_large_text=results.size_class.astype(bool),
+                            levels=np.array(results.levels),
+                            contrast=results.contrast,
+                            compliance=results.compliance)
+        return [path]
+
+    items = results.iter_results() if isinstance(results, ContrastResults) else results.items()
+    paths = []
+    output = None
+    written = 0
+    try:
+        for key, result in items:
+            if output is None or (shard_size and written == shard_size):
+                if output is not None:
+                    output.close()
+                shard = f".{len(paths):05d}" if shard_size else ''
+                paths.append(Path(f"{stem}.details{shard}.jsonl"))
+                output = open(paths[-1], 'w', encoding='utf-8')
+                written = 0
+            output.write(json.dumps(dict(key=key, **result), ensure_ascii=False))
+            output.write('\n')
+            written += 1
+    finally:
+        if output is not None:
+            output.close()
+    return paths
+
 class AccessibilityTester:
     def __init__(self):
         self.results = {}
@@ -22,63 +246,52 @@ class AccessibilityTester:
         }
 
     def parse_colors(self, color_string):
-        """Parse une chaîne de couleurs hex"""
+        """Parse une chaîne de couleurs hex (sans doublons, ordre d'apparition conservé)"""
         colors = []
-        for color in color_string.split(','):
+        # Les virgules internes de rgb()/rgba() ne séparent pas les couleurs
+        for color in re.split(r',(?![^()]*\))', color_string):
             color = color.strip()
-            if color.startswith('#'):
-                colors.append(color)
-            elif color.lower() in ['black', 'white']:
-                colors.append('#000000' if color == 'black' else '#FFFFFF')
-        return colors
+            if color.lower() in ['black', 'white']:
+                colors.append('#000000' if color.lower() == 'black' else '#FFFFFF')
+                continue
+            try:
+                rgb, alpha = parse_color_alpha(color)
+            except ValueError:
+                continue  # Couleur non reconnue ignorée
+            if alpha < 1.0:
+                # Le contraste d'une couleur translucide dépend du fond qu'elle recouvre
+                print(f"⚠️  Couleur non opaque ignorée: {color} (alpha {alpha:g})")
+                continue
+            colors.append(color)
+        # Un doublon produirait les mêmes clés de résultat : une seule entrée par couleur
+        return list(dict.fromkeys(colors))
 
     def parse_font_sizes(self, font_string):
-        """Parse une chaîne de tailles de police"""
+        """Parse une chaîne de tailles de police (sans doublons)"""
         sizes = []
+        seen = set()
         for size in font_string.split(','):
             size = size.strip()
             # Extraction de la valeur numérique
             match = re.match(r'(\d+(?:\.\d+)?)(px|pt|em|rem)', size)
             if match:
                 value, unit = match.groups()
-                sizes.append({'value': float(value), 'unit': unit})
+                if (float(value), unit) not in seen:
+                    seen.add((float(value), unit))
+                    sizes.append({'value': float(value), 'unit': unit})
         return sizes
 
     def hex_to_rgb(self, hex_color):
         """Convertit hex en RGB (0-1)"""
-        hex_color = hex_color.lstrip('#')
-        r = int(hex_color[0:2], 16) / 255.0
-        g = int(hex_color[2:4], 16) / 255.0
-        b = int(hex_color[4:6], 16) / 255.0
-        return (r, g, b)
+        return tuple(channel / 255.0 for channel in parse_color(hex_color))
 
     def rgb_to_luminance(self, rgb):
-        """Calcule la luminance relative d'une couleur RGB"""
-        r, g, b = rgb
-
-        # Conversion RGB vers linear RGB
-        def linearize(x):
-            return x / 12.92 if x <= 0.03928 else ((x + 0.055) / 1.055) ** 2.4
-
-        r = linearize(r)
-        g = linearize(g)
-        b = linearize(b)
-
-        # Calcul de la luminance
-        return 0.2126 * r + 0.7152 * g + 0.0722 * b
+        """Calcule la luminance relative d'une couleur RGB (0-1)"""
+        return color_luminance('#%02x%02x%02x' % tuple(round(channel * 255) for channel in rgb))
 
     def calculate_contrast_ratio(self, color1, color2):
-        """Calcule le ratio de contraste entre deux couleurs"""
-        rgb1 = self.hex_to_rgb(color1)
-        rgb2 = self.hex_to_rgb(color2)
-
-        l1 = self.rgb_to_luminance(rgb1)
-        l2 = self.rgb_to_luminance(rgb2)
-
-        lighter = max(l1, l2)
-        darker = min(l1, l2)
-
-        return (lighter + 0.05) / (darker + 0.05)
+        """Calcule le ratio de contraste entre deux couleurs (luminances mémorisées)"""
+        return color_contrast(color1, color2)
 
     def is_large_text(self, font_size):
         """Détermine si le texte est considéré comme 'large' selon WCAG"""
@@ -96,19 +309,26 @@ class AccessibilityTester:
 
         return False  # Par défaut, considérer comme small text
 
+    def check_color_accessibility_matrix(self, colors, font_sizes):
+        """Teste toutes les combinaisons en tableaux : contrastes n×n et masques WCAG diffusés"""
+        is_large = [self.is_large_text(font_size) for font_size in font_sizes]
+        return ContrastResults(colors, font_sizes, is_large, self.wcag_levels)
+
     def check_color_accessibility(self, colors, font_sizes):
         """Teste l'accessibilité de toutes les combinaisons couleurs/polices"""
         results = {}
 
+        # Contrastes calculés une fois pour la palette, indépendamment des tailles testées
+        contrasts = contrast_matrix(colors).tolist()
+        sizes = [(font_size, self.is_large_text(font_size)) for font_size in font_sizes]
+
         for i, color1 in enumerate(colors):
             for j, color2 in enumerate(colors):
                 if i != j:  # Éviter les combinaisons identiques
-                    contrast = self.calculate_contrast_ratio(color1, color2)
+                    contrast = contrasts[i][j]
 
                     # Test avec chaque taille de police
-                    for font_size in font_sizes:
-                        is_large = self.is_large_text(font_size)
-
+                    for font_size, is_large in sizes:
                         # Test WCAG compliance
                         compliance = {}
                         for level, thresholds in self.wcag_levels.items():
@@ -129,108 +349,106 @@ class AccessibilityTester:
 
         return results
 
-    def generate_accessibility_report(self, results):
-        """Génère un rapport d'accessibilité détaillé"""
+    def generate_accessibility_report(self, results, include_details=True):
+        """Génère un rapport d'accessibilité détaillé
+
+        include_details=False : résumé et recommandations seuls, les résultats
+        détaillés étant écrits à part (voir write_detailed_results).
+        """
+        aggregate = self._aggregate(results)
         report = {
-            'summary': self._generate_summary(results),
-            'detailed_results': results,
-            'recommendations': self._generate_recommendations(results),
+            'summary': aggregate.summary(),
+            'recommendations': aggregate.recommendations(),
             'wcag_levels': self.wcag_levels
         }
+        if include_details:
+            report['detailed_results'] = results.to_dict() if isinstance(results, ContrastResults) else results
+            # Ordre historique des clés du rapport
+            report = {key: report[key] for key in ('summary', 'detailed_results', 'recommendations', 'wcag_levels')}
 
         return report
 
+    def _aggregate(self, results):
+        """Agrégat des résultats : masques en mode matriciel, sinon un seul passage"""
+        if isinstance(results, ContrastResults):
+            return ReportAggregator.from_matrix(results)
+
+        aggregate = ReportAggregator()
+        for key, result in results.items():
+            aggregate.add(key, result)
+        return aggregate
+
     def _generate_summary(self, results):
         """Génère un résumé des résultats"""
-        total_combinations = len(results)
-        compliant_combinations = sum(1 for r in results.values() if r['overall_compliant'])
-        aa_compliant = sum(1 for r in results.values() if r['wcag_compliance']['AA'])
-        aaa_compliant = sum(1 for r in results.values() if r['wcag_compliance']['AAA'])
-
-        return {
-            'total_combinations_tested': total_combinations,
-            'fully_compliant_combinations': compliant_combinations,
-            'aa_compliant': aa_compliant,
-            'aaa_compliant': aaa_compliant,
-            'compliance_percentage': round((compliant_combinations / total_combinations) * 100, 1) if total_combinations > 0 else 0
-        }
+        return self._aggregate(results).summary()
 
     def _generate_recommendations(self, results):
         """Génère des recommandations d'amélioration"""
-        recommendations = []
-
-        # Identifier les problèmes courants
-        low_contrast = [r for r in results.values() if r['contrast_ratio'] < 3.0]
-        medium_contrast = [r for r in results.values() if 3.0 <= r['contrast_ratio'] < 4.5]
-
-        if low_contrast:
-            recommendations.append({
-                'type': 'critical',
-                'message': f"{len(low_contrast)} combinaisons ont un contraste très faible (< 3.0)",
-                'affected_combinations': [k for k, v in results.items() if v['contrast_ratio'] < 3.0],
-                'suggestion': "Considérez des couleurs avec plus de contraste ou augmentez la taille de police"
-            })
-
-        if medium_contrast:
-            recommendations.append({
-                'type': 'warning',
-                'message': f"{len(medium_contrast)} combinaisons ne respectent pas WCAG AA",
-                'affected_combinations': [k for k, v in results.items() if 3.0 <= v['contrast_ratio'] < 4.5],
-                'suggestion': "Augmentez le contraste ou utilisez pour du texte de grande taille uniquement"
-            })
-
-        # Recommandations spécifiques par couleur
-        color_issues = {}
-        for result in results.values():
-            if not result['wcag_compliance']['AA']:
-                fg = result['foreground']
-                bg = result['background']
-                if fg not in color_issues:
-                    color_issues[fg] = []
-                color_issues[fg].append(bg)
-
-        for color, backgrounds in color_issues.items():
-            recommendations.append({
-                'type': 'color_specific',
-                'color': color,
-                'issue': f"Ne fonctionne pas bien avec {len(backgrounds)} couleurs de fond",
-                'backgrounds': backgrounds,
-                'suggestion': "Remplacez cette couleur par une alternative plus contrastée"
-            })
-
-        return recommendations
-
-    def test_svg_accessibility(self, svg_file):
-        """Teste l'accessibilité d'un fichier SVG"""
+        return self._aggregate(results).recommendations()
+
+    def _failing_pairs(self, results, level):
+        """(avant-plan, fond, grand texte) distincts ne respectant pas le niveau WCAG"""
+        if isinstance(results, ContrastResults):
+            # Classes de taille dans l'ordre des tailles testées, comme les résultats détaillés
+            size_classes = list(dict.fromkeys(results.size_class.tolist()))
+            level_compliance = results.compliance[results.levels.index(level)][size_classes]
+            failing = ~level_compliance.transpose(1, 2, 0) & results.pair_mask[:, :, None]
+            return list(dict.fromkeys((results.colors[i], results.colors[j], bool(size_classes[k]))
+                                      for i, j, k in np.argwhere(failing).tolist()))
+
+        return list(dict.fromkeys((r['foreground'], r['background'], r['is_large_text'])
+                                  for r in results.values() if not r['wcag_compliance'][level]))
+
+    def suggest_compliant_colors(self, results, level='AA'):
+        """Pour chaque paire non conforme, l'avant-plan conforme le plus proche (ΔE OKLab)
+
+        La luminosité est résolue pour toutes les paires en échec à la fois ;
+        suggested_foreground vaut None si aucune teinte voisine n'atteint le niveau.
+        """
+        pairs = self._failing_pairs(results, level)
+        suggestions = []
+
+        for start in range(0, len(pairs), SUGGESTION_CHUNK_SIZE):
+            chunk = pairs[start:start + SUGGESTION_CHUNK_SIZE]
+            foregrounds = np.array([parse_color(foreground) for foreground, _, _ in chunk]) / 255.0
+            background_luminance = luminance_array([background for _, background, _ in chunk])
+            thresholds = [self.wcag_levels[level]['large' if is_large else 'small'] for _, _, is_large in chunk]
+
+            rgb, ratios, delta_e = nearest_contrast_colors(foregrounds, background_luminance, thresholds)
+            hex_colors = rgb_to_hex(rgb).tolist()
+
+            for (foreground, background, is_large), hex_color, ratio, distance in zip(
+                    chunk, hex_colors, ratios.tolist(), delta_e.tolist()):
+                found = distance != float('inf')
+                suggestions.append({
+                    'foreground': foreground,
+                    'background': background,
+                    'is_large_text': is_large,
+                    'level': level,
+                    'contrast_ratio': round(color_contrast(foreground, background), 2),
+                    'suggested_foreground': hex_color if found else None,
+                    'suggested_contrast_ratio': round(ratio, 2) if found else None,
+                    'delta_e': round(distance, 4) if found else None
+                })
+
+        return suggestions
+
+    def test_svg_accessibility(self, svg_file, background='#ffffff'):
+        """Teste l'accessibilité d'un fichier SVG : contraste de chaque texte avec son fond réel"""
         try:
-            import xml.etree.ElementTree as ET
-
-            tree = ET.parse(svg_file)
-            root = tree.getroot()
-
-            # Extraction des couleurs du SVG
-            colors = set()
-            for element in root.iter():
-                for attr in ['fill', 'stroke']:
-                    if attr in element.attrib:
-                        color = element.get(attr)
-                        if color and color.startswith('#'):
-                            colors.add(color)
+            from svg_accessibility import audit_svg
 
-            # Test des contrastes si texte présent
-            text_elements = [elem for elem in root.iter() if elem.tag.endswith('text')]
-
-            svg_results = {
-                'colors_found': list(colors),
-                'text_elements': len(text_elements),
-                'has_colors': len(colors) > 0
-            }
-
-            return svg_results
+            return audit_svg(svg_file, self, background)
 
         except Exception as e:
             return {'error': str(e)}
 
+    def test_assets_accessibility(self, root, background='#ffffff', jobs=1):
+        """Audite les pages HTML, feuilles CSS et SVG d'une arborescence (rapport agrégé)"""
+        from accessibility_crawl import crawl_assets
+
+        return crawl_assets(root, self, background, jobs)
+
     def generate_css_accessibility_guide(self, results, output_file):
         """Génère un guide CSS pour l'accessibilité"""
         css_guide = """/* Guide d'accessibilité CSS généré automatiquement */
@@ -241,7 +459,11 @@ class AccessibilityTester:
 """
 
         # Variables CSS pour les combinaisons conformes
-        compliant_combinations = [r for r in results.values() if r['wcag_compliance']['AA']]
+        if isinstance(results, ContrastResults):
+            indices = results.pair_indices(results.level_mask('AA'))[:10]
+            compliant_combinations = [results.result(*index) for index in indices]
+        else:
+            compliant_combinations = [r for r in results.values() if r['wcag_compliance']['AA']]
 
         for i, combo in enumerate(compliant_combinations[:10]):  # Top 10
             css_guide += f"  --accessible-combo-{i+1}-fg: {combo['foreground']};\n"
@@ -280,38 +502,96 @@ class AccessibilityTester:
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write(css_guide)
 
+def crawl_main(args):
+    """Mode --crawl : audit d'une arborescence et rapport agrégé"""
+    tester = AccessibilityTester()
+    report = tester.test_assets_accessibility(args.crawl, args.svg_background, max(args.jobs, 1))
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    summary = report['summary']
+    print(f"📂 {report['root']}: {summary['files_scanned']} fichiers, "
+          f"{summary['pair_occurrences']} textes, {summary['unique_pairs']} paires distinctes")
+    print(f"  WCAG AA compliant: {summary['aa_compliant']}/{summary['total_combinations_tested']}")
+    print(f"  WCAG AAA compliant: {summary['aaa_compliant']}/{summary['total_combinations_tested']}")
+    print(f"  Fichiers en échec AA: {summary['files_failing_aa']}")
+    print()
+
+    for file_report in report['files']:
+        if 'error' in file_report:
+            print(f"  ⚠️  {file_report['file']}: {file_report['error']}")
+        elif file_report['aa_failures']:
+            print(f"  ❌ {file_report['file']}: {file_report['aa_failures']}/{file_report['pairs_found']} paires sous AA")
+            for finding in file_report['findings'][:3]:
+                sample = finding['samples'][0] if finding['samples'] else {}
+                where = f" «{sample['text']}»" if sample.get('text') else f" ({sample['element']})" if sample else ""
+                print(f"     {finding['foreground']} sur {finding['background']} - "
+                      f"Ratio: {finding['contrast_ratio']}{where}")
+        elif file_report['pairs_found']:
+            print(f"  ✅ {file_report['file']}: {file_report['pairs_found']} paires conformes AA")
+        else:
+            print(f"  ·  {file_report['file']}: aucun texte coloré")
+
+    print(f"\n📁 Rapport agrégé: {args.output}")
+
 def main():
     """Point d'entrée principal"""
     parser = argparse.ArgumentParser(description="Testeur d'accessibilité WCAG 2.1")
-    parser.add_argument('--colors', '-c', required=True, help='Couleurs hex séparées par des virgules (ex: "#000,#fff,#2E5B91")')
+    parser.add_argument('--colors', '-c', help='Couleurs hex séparées par des virgules (ex: "#000,#fff,#2E5B91")')
     parser.add_argument('--fonts', '-f', default='14px,18px,24px', help='Tailles de police (ex: "14px,18px,24px")')
     parser.add_argument('--output', '-o', default='accessibility_report.json', help='Fichier de sortie du rapport')
     parser.add_argument('--css-guide', default='accessibility_guide.css', help='Fichier CSS d\'accessibilité généré')
     parser.add_argument('--svg', help='Fichier SVG à analyser')
+    parser.add_argument('--svg-background', default='#ffffff',
+                        help='Couleur de la page sous le SVG ou sous les fichiers analysés par --crawl')
+    parser.add_argument('--crawl', help='Dossier de ressources HTML/CSS/SVG à auditer (rapport agrégé par fichier)')
+    parser.add_argument('--jobs', '-j', type=int, default=1, help='Fichiers analysés en parallèle avec --crawl')
+    parser.add_argument('--suggest', nargs='?', const='AA', choices=['A', 'AA', 'AAA'],
+                        help='Propose la couleur conforme la plus proche pour chaque paire en échec (défaut : AA)')
+    parser.add_argument('--details', choices=DETAIL_FORMATS, default='json',
+                        help='Résultats détaillés : dans le rapport JSON, en JSON Lines ou en colonnes NumPy (.npz)')
+    parser.add_argument('--shard-size', type=int, default=0,
+                        help='Lignes par fichier JSON Lines (0 = un seul fichier)')
 
     args = parser.parse_args()
+    if not args.colors and not args.crawl:
+        parser.error("--colors ou --crawl est requis")
+    if args.crawl and not Path(args.crawl).exists():
+        parser.error(f"--crawl: chemin introuvable: {args.crawl}")
 
     print("🧐 Test d'accessibilité WCAG 2.1")
     print("=" * 50)
 
+    if args.crawl:
+        crawl_main(args)
+        return
+
     # Parsing des couleurs et polices
     colors = AccessibilityTester().parse_colors(args.colors)
     font_sizes = AccessibilityTester().parse_font_sizes(args.fonts)
 
     print(f"🎨 Couleurs testées: {', '.join(colors)}")
-    print(f"📝 Tailles de police: {', '.join([f['value']{f['unit'] for f in font_sizes])}")
+    print(f"📝 Tailles de police: {', '.join(str(f['value']) + f['unit'] for f in font_sizes)}")
     print()
 
     # Test d'accessibilité
     tester = AccessibilityTester()
-    results = tester.check_color_accessibility(colors, font_sizes)
+    results = tester.check_color_accessibility_matrix(colors, font_sizes)
+
+    # Génération du rapport (résultats détaillés écrits à part hors format json)
+    report = tester.generate_accessibility_report(results, include_details=args.details == 'json')
+    detail_files = []
+    if args.details != 'json':
+        detail_files = write_detailed_results(results, args.output, args.details, args.shard_size)
+        report['detailed_results_files'] = [path.name for path in detail_files]
 
-    # Génération du rapport
-    report = tester.generate_accessibility_report(results)
+    if args.suggest:
+        report['suggestions'] = tester.suggest_compliant_colors(results, args.suggest)
 
     # Test SVG si fourni
     if args.svg:
-        svg_results = tester.test_svg_accessibility(args.svg)
+        svg_results = tester.test_svg_accessibility(args.svg, args.svg_background)
         report['svg_analysis'] = svg_results
 
     # Sauvegarde du rapport
@@ -332,6 +612,19 @@ def main():
     print(f"  Taux de conformité: {summary['compliance_percentage']}%")
     print()
 
+    if args.svg:
+        svg_results = report['svg_analysis']
+        if 'error' in svg_results:
+            print(f"⚠️  SVG non analysé: {svg_results['error']}")
+        else:
+            print(f"🖼️  SVG {args.svg}: {svg_results['summary']['texts_checked']} textes, "
+                  f"{svg_results['summary']['aa_compliant']} conformes AA")
+            for text in svg_results['texts']:
+                if not text['wcag_compliance']['AA']:
+                    print(f"  ❌ «{text['text']}» {text['foreground']} sur {text['backdrop']} - "
+                          f"Ratio: {text['contrast_ratio']}")
+        print()
+
     # Recommandations critiques
     critical_recommendations = [r for r in report['recommendations'] if r['type'] == 'critical']
     if critical_recommendations:
@@ -341,8 +634,21 @@ def main():
             print(f"     Suggestion: {rec['suggestion']}")
         print()
 
+    if args.suggest:
+        suggestions = report['suggestions']
+        print(f"🎯 CORRECTIONS SUGGÉRÉES ({len(suggestions)} paires sous {args.suggest}):")
+        for suggestion in sorted(suggestions, key=lambda x: x['delta_e'] if x['delta_e'] is not None else float('inf'))[:5]:
+            size = "grand texte" if suggestion['is_large_text'] else "petit texte"
+            if suggestion['suggested_foreground']:
+                print(f"  {suggestion['foreground']} sur {suggestion['background']} ({size}) → "
+                      f"{suggestion['suggested_foreground']} - Ratio: {suggestion['suggested_contrast_ratio']} "
+                      f"(ΔE {suggestion['delta_e']})")
+            else:
+                print(f"  {suggestion['foreground']} sur {suggestion['background']} ({size}) → aucune teinte voisine conforme")
+        print()
+
     # Affichage des meilleures combinaisons
-    best_combinations = sorted(results.values(), key=lambda x: x['contrast_ratio'], reverse=True)[:5]
+    best_combinations = results.best(5)
 
     print("✅ MEILLEURES COMBINAISONS (top 5):")
     for combo in best_combinations:
@@ -351,7 +657,9 @@ def main():
         print(f"  {level} {combo['foreground']} sur {combo['background']} - Ratio: {combo['contrast_ratio']} {large_text}")
 
     print(f"\n📁 Rapports générés:")
-    print(f"  - {args.output} (rapport détaillé JSON)")
+    print(f"  - {args.output} (rapport {'détaillé ' if args.details == 'json' else ''}JSON)")
+    for path in detail_files:
+        print(f"  - {path} (résultats détaillés)")
     print(f"  - {args.css_guide} (guide CSS d'accessibilité)")
 
     if summary['compliance_percentage'] >= 80:
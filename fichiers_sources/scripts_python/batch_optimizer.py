@@ -1,41 +1,250 @@
 #!/usr/bin/env python3
 """
 Optimiseur de polices par lots avec FontTools
-Usage: python batch_optimizer.py input_dir/ output_dir/
+Usage: python batch_optimizer.py input_dir/ output_dir/ [--jobs N] [--force] [--subset latin,cyrillic]
 
 Optimise automatiquement une collection de polices pour le web et l'impression
 """
 
 import os
 import sys
+import copy
+import json
+import time
+import hashlib
+import threading
+import argparse
+from io import BytesIO
+from functools import lru_cache, partial
+from contextlib import contextmanager
 from pathlib import Path
 from fontTools.ttLib import TTFont
 from fontTools.subset import Subsetter, Options
 
-def optimize_font_for_web(font_path, output_path):
-    """Optimise une police pour le web"""
-    font = TTFont(font_path)
+from parallel import error_message, iter_pool_results
 
+# Profils de sous-ensembles web (syntaxe CSS unicode-range, découpage type Google Fonts)
+UNICODE_PROFILES = {
+    'latin': 'U+0000-00FF, U+0131, U+0152-0153, U+02BB-02BC, U+02C6, U+02DA, U+02DC, U+0304, U+0308, '
+             'U+0329, U+2000-206F, U+20AC, U+2122, U+2191, U+2193, U+2212, U+2215, U+FEFF, U+FFFD',
+    'latin-ext': 'U+0100-02BA, U+02BD-02C5, U+02C7-02CC, U+02CE-02D7, U+02DD-02FF, U+0304, U+0308, U+0329, '
+                 'U+1D00-1DBF, U+1E00-1E9F, U+1EF2-1EFF, U+2020, U+20A0-20AB, U+20AD-20C0, U+2113, '
+                 'U+2C60-2C7F, U+A720-A7FF',
+    'cyrillic': 'U+0301, U+0400-045F, U+0490-0491, U+04B0-04B1, U+2116',
+    'cyrillic-ext': 'U+0460-052F, U+1C80-1C8A, U+20B4, U+2DE0-2DFF, U+A640-A69F, U+FE2E-FE2F',
+    'greek': 'U+0370-0377, U+037A-037F, U+0384-038A, U+038C, U+038E-03A1, U+03A3-03FF',
+    'vietnamese': 'U+0102-0103, U+0110-0111, U+0128-0129, U+0168-0169, U+01A0-01A1, U+01AF-01B0, '
+                  'U+0300-0301, U+0303-0304, U+0308-0309, U+0323, U+0329, U+1EA0-1EF9, U+20AB'
+}
+DEFAULT_SUBSET_PROFILES = ['latin']
+
+# Réglages des sorties : toute modification invalide le cache incrémental
+WEB_SUBSET_OPTIONS = {'desubroutinize': True, 'ignore_missing_glyphs': True}
+# Brotli : qualité 0 (rapide) à 11 (compact) ; transformations WOFF2 (glyf/loca vont ensemble)
+WOFF2_OPTIONS = {'quality': 11, 'transform_tables': ['glyf', 'loca']}
+WOFF2_TRANSFORMABLE_TABLES = {'glyf', 'loca', 'hmtx'}
+CONTENT_HASH_LENGTH = 10
+
+# usWidthClass (OS/2) -> font-stretch CSS
+OS2_WIDTH_STRETCH = {1: '50%', 2: '62.5%', 3: '75%', 4: '87.5%', 5: '100%',
+                     6: '112.5%', 7: '125%', 8: '150%', 9: '200%'}
+
+MANIFEST_NAME = '.font_manifest.json'
+MANIFEST_VERSION = 4
+
+class FontSource:
+    """Police lue une seule fois sur disque et partagée par toutes les étapes"""
+
+    def __init__(self, font_path):
+        self.path = Path(font_path)
+        with open(self.path, 'rb') as f:
+            self.data = f.read()
+        self._font = None
+
+    @property
+    def font(self):
+        """TTFont analysé à la demande, tables décompilées au premier accès"""
+        if self._font is None:
+            self._font = TTFont(BytesIO(self.data))
+        return self._font
+
+    def copy_font(self):
+        """Copie indépendante du TTFont pour les étapes qui le modifient"""
+        return copy.deepcopy(self.font)
+
+def _as_source(source):
+    """Accepte un chemin ou une FontSource déjà chargée"""
+    return source if isinstance(source, FontSource) else FontSource(source)
+
+def parse_unicode_intervals(spec):
+    """Convertit 'U+0000-00FF, U+0131' en intervalles triés et disjoints [(début, fin), ...]"""
+    intervals = []
+    for part in spec.split(','):
+        part = part.strip().upper()
+        if not part:
+            continue
+        if not part.startswith('U+'):
+            raise ValueError(f"Plage unicode invalide: {part}")
+        part = part[2:]
+        if '?' in part:
+            # Joker CSS : U+4?? = U+400-4FF
+            start, end = int(part.replace('?', '0'), 16), int(part.replace('?', 'F'), 16)
+        elif '-' in part:
+            start, end = (int(bound, 16) for bound in part.split('-', 1))
+        else:
+            start = end = int(part, 16)
+        intervals.append((start, end))
+
+    # Intervalles chevauchants ou contigus fusionnés : recherche par bisection possible
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+@lru_cache(maxsize=64)
+def parse_unicode_range(spec):
+    """Convertit 'U+0000-00FF, U+0131' en ensemble figé de points de code"""
+    codepoints = set()
+    for start, end in parse_unicode_intervals(spec):
+        codepoints.update(range(start, end + 1))
+    return frozenset(codepoints)
+
+def format_unicode_range(codepoints):
+    """Convertit des points de code en descripteur CSS unicode-range compact"""
+    parts = []
+    ordered = sorted(codepoints)
+    index = 0
+    while index < len(ordered):
+        start = end = ordered[index]
+        while index + 1 < len(ordered) and ordered[index + 1] == end + 1:
+            index += 1
+            end = ordered[index]
+        parts.append(f"U+{start:04X}" if start == end else f"U+{start:04X}-{end:04X}")
+        index += 1
+    return ', '.join(parts)
+
+def build_subset_plan(profiles=None, text=None, corpus_ranges=None):
+    """Plan de découpage {nom de shard: unicode-range} à partir de profils, d'un texte ou d'un corpus"""
+    plan = {}
+    for profile in profiles if profiles is not None else DEFAULT_SUBSET_PROFILES:
+        if profile not in UNICODE_PROFILES:
+            raise ValueError(f"Profil inconnu: {profile} (disponibles: {', '.join(UNICODE_PROFILES)})")
+        plan[profile] = UNICODE_PROFILES[profile]
+    if text:
+        plan['text'] = format_unicode_range({ord(char) for char in text if not char.isspace()} | {0x20})
+    for locale, range_spec in (corpus_ranges or {}).items():
+        if range_spec:
+            plan[f"corpus-{locale}"] = range_spec
+    return plan
+
+def load_corpus_ranges(profile_path, locales=None):
+    """unicode-range par locale depuis un profil généré par glyph_profiler.py"""
+    with open(profile_path, 'r', encoding='utf-8') as f:
+        profile = json.load(f)
+
+    ranges = {}
+    for locale, info in profile.get('locales', {}).items():
+        if locales is None or locale in locales:
+            ranges[locale] = info['unicode_range']
+    return ranges
+
+def subset_font(source, codepoints):
+    """Copie de la police réduite aux points de code donnés (options web)"""
     # Configuration de la sous-ensemble
     options = Options()
-    options.desubroutinize = True
-    options.ignore_missing_glyphs = True
+    for name, value in WEB_SUBSET_OPTIONS.items():
+        setattr(options, name, value)
 
-    # Sous-ensemble pour les caractères latins de base
+    # Le subsetter modifie la police : on travaille sur une copie
+    font = _as_source(source).copy_font()
     subsetter = Subsetter(options)
-    subsetter.populate(glyphs=['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z',
-                               'A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z',
-                               '0', '1', '2', '3', '4', '5', '6', '7', '8', '9'])
+    subsetter.populate(unicodes=codepoints)
     subsetter.subset(font)
+    return font
 
-    # Sauvegarde optimisée
-    font.save(output_path)
+def read_face_info(font):
+    """Descripteurs @font-face lus dans les tables name, OS/2 et fvar"""
+    name_table = font['name']
+    family = (name_table.getDebugName(16) or name_table.getDebugName(1)
+              or Path(getattr(font.reader.file, 'name', 'Font')).stem)
 
-def optimize_font_for_print(font_path, output_path):
+    os2 = font['OS/2'] if 'OS/2' in font else None
+    weight = os2.usWeightClass if os2 else 400
+    italic = bool(os2.fsSelection & 0x01) if os2 else bool(font['head'].macStyle & 0x02)
+    oblique = bool(os2 and os2.fsSelection & 0x200)
+    style = 'italic' if italic else ('oblique' if oblique else 'normal')
+    stretch = OS2_WIDTH_STRETCH.get(os2.usWidthClass, '100%') if os2 else '100%'
+
+    face = {'family': family, 'weight': str(weight), 'style': style, 'stretch': stretch}
+
+    if 'fvar' in font:
+        # Police variable : plages couvertes par les axes restants
+        axes = {axis.axisTag: axis for axis in font['fvar'].axes}
+        if 'wght' in axes:
+            face['weight'] = f"{axes['wght'].minValue:g} {axes['wght'].maxValue:g}"
+        if 'wdth' in axes:
+            face['stretch'] = f"{axes['wdth'].minValue:g}% {axes['wdth'].maxValue:g}%"
+        if 'slnt' in axes:
+            # slnt est négatif vers la droite, CSS oblique positif
+            face['style'] = f"oblique {-axes['slnt'].maxValue:g}deg {-axes['slnt'].minValue:g}deg"
+        elif 'ital' in axes and axes['ital'].maxValue > 0:
+            face['style'] = 'italic'
+        face['variable'] = True
+
+    return face
+
+def optimize_font_for_web(source, output_stem, subset_plan=None, woff2_options=None):
+    """Optimise une police pour le web : un shard WOFF2 par profil couvert"""
+    source = _as_source(source)
+    subset_plan = subset_plan or build_subset_plan()
+    cmap = source.font.getBestCmap() or {}
+
+    shards = []
+    for shard_name, range_spec in subset_plan.items():
+        # Seuls les caractères réellement présents dans la police forment le shard
+        covered = parse_unicode_range(range_spec).intersection(cmap)
+        if not covered:
+            continue
+
+        font = subset_font(source, covered)
+        # head.modified garde la date source : mêmes entrées, mêmes octets, même nom de shard
+        font.recalcTimestamp = False
+
+        buffer = BytesIO()
+        try:
+            save_woff2(font, buffer, woff2_options)
+            extension = 'woff2'
+        except ImportError:
+            # Sans brotli : WOFF (zlib), toujours compressé pour le web
+            buffer = BytesIO()
+            font.flavor = 'woff'
+            font.save(buffer)
+            extension = 'woff'
+
+        # Nom dérivé du contenu : les URL peuvent être mises en cache indéfiniment
+        data = buffer.getvalue()
+        digest = hashlib.sha256(data).hexdigest()[:CONTENT_HASH_LENGTH]
+        shard_path = Path(f"{output_stem}.{shard_name}.{digest}.{extension}")
+        with open(shard_path, 'wb') as f:
+            f.write(data)
+
+        shards.append({
+            'name': shard_name,
+            'path': str(shard_path),
+            'unicode_range': format_unicode_range(covered),
+            'codepoints': len(covered)
+        })
+
+    return shards
+
+def optimize_font_for_print(source, output_path):
     """Optimise une police pour l'impression"""
-    font = TTFont(font_path)
+    font = _as_source(source).font
 
-    # Nettoyage des tables inutiles
+    # Nettoyage des tables inutiles (le WOFF2 supprime aussi DSIG, la police partagée reste valide)
     if 'DSIG' in font:
         del font['DSIG']  # Signature digitale pas nécessaire pour print
 
@@ -52,18 +261,78 @@ def add_basic_hinting(font):
     # Dans un vrai projet, utiliser ttfautohint
     pass
 
-def convert_to_woff2(font_path, output_path):
-    """Convertit une police en WOFF2"""
+def build_woff2_options(quality=None, transform_tables=None):
+    """Réglages WOFF2 validés : qualité Brotli et tables à transformer"""
+    options = dict(WOFF2_OPTIONS)
+    if quality is not None:
+        if not 0 <= quality <= 11:
+            raise ValueError(f"Qualité Brotli invalide: {quality} (0 à 11)")
+        options['quality'] = quality
+    if transform_tables is not None:
+        tables = sorted(set(transform_tables))
+        unknown = set(tables) - WOFF2_TRANSFORMABLE_TABLES
+        if unknown:
+            raise ValueError(f"Tables non transformables en WOFF2: {', '.join(sorted(unknown))}")
+        if ('glyf' in tables) != ('loca' in tables):
+            raise ValueError("Les tables glyf et loca doivent être transformées ensemble")
+        options['transform_tables'] = tables
+    return options
+
+_brotli_settings = threading.local()
+
+class _BrotliWithQuality:
+    """Module brotli dont compress() applique la qualité choisie par le thread courant"""
+
+    def __init__(self, brotli_module):
+        self._brotli = brotli_module
+
+    def compress(self, data, **kwargs):
+        kwargs.setdefault('quality', getattr(_brotli_settings, 'quality', 11))
+        return self._brotli.compress(data, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._brotli, name)
+
+@contextmanager
+def brotli_quality(quality):
+    """Fixe la qualité Brotli utilisée par l'encodeur WOFF2 de FontTools (11 en dur sinon)"""
+    from fontTools.ttLib import woff2
+
+    if not woff2.haveBrotli:
+        raise ImportError("No module named brotli")
+
+    if not isinstance(woff2.brotli, _BrotliWithQuality):
+        woff2.brotli = _BrotliWithQuality(woff2.brotli)
+
+    previous = getattr(_brotli_settings, 'quality', None)
+    _brotli_settings.quality = quality
     try:
-        from fontTools.ttLib.woff2 import compress
+        yield
+    finally:
+        _brotli_settings.quality = previous if previous is not None else 11
 
-        with open(font_path, 'rb') as f:
-            font_data = f.read()
+def save_woff2(font, output_file, woff2_options=None):
+    """Écrit un TTFont en WOFF2 directement dans un fichier ou un flux"""
+    from fontTools.ttLib.woff2 import WOFF2FlavorData
 
-        compressed_data = compress(font_data)
+    options = woff2_options or WOFF2_OPTIONS
+    original_flavor, original_data = font.flavor, font.flavorData
 
-        with open(output_path, 'wb') as f:
-            f.write(compressed_data)
+    try:
+        font.flavor = 'woff2'
+        font.flavorData = WOFF2FlavorData(transformedTables=options['transform_tables'])
+        with brotli_quality(options['quality']):
+            font.save(output_file)
+    finally:
+        font.flavor, font.flavorData = original_flavor, original_data
+
+def convert_to_woff2(source, output_path, woff2_options=None):
+    """Convertit une police en WOFF2"""
+    font = _as_source(source).font
+
+    try:
+        # Les tables non modifiées sont recopiées telles quelles depuis les octets source
+        save_woff2(font, output_path, woff2_options)
 
     except ImportError:
         print("Installation requise: pip install brotli")
@@ -71,8 +340,201 @@ def convert_to_woff2(font_path, output_path):
 
     return True
 
-def process_font_collection(input_dir, output_dir):
+def benchmark_woff2(font_path, qualities=range(0, 12), repeat=3):
+    """Temps de compression et taille WOFF2 pour chaque qualité Brotli et chaque transformation"""
+    source = FontSource(font_path)
+    font = source.font
+    font.ensureDecompiled()
+
+    results = []
+    for transform_tables in (['glyf', 'loca'], []):
+        options_base = build_woff2_options(transform_tables=transform_tables)
+        for quality in qualities:
+            options = dict(options_base, quality=quality)
+            durations = []
+            for _ in range(repeat):
+                buffer = BytesIO()
+                start = time.perf_counter()
+                save_woff2(font, buffer, options)
+                durations.append(time.perf_counter() - start)
+            results.append({
+                'quality': quality,
+                'transform_tables': transform_tables,
+                'seconds': min(durations),
+                'bytes': len(buffer.getvalue())
+            })
+
+    return {'source_bytes': len(source.data), 'results': results}
+
+def output_name(font_file, input_root=None):
+    """Nom des sorties d'une police : chemin relatif à input_root sans extension
+
+    Les sous-dossiers de l'entrée sont reproduits dans web/, print/ et woff2/ :
+    in/a/Inter.ttf et in/b/Inter.ttf ne produisent pas les mêmes fichiers.
+    """
+    font_file = Path(font_file)
+    if input_root is None:
+        return font_file.stem
+    return font_file.relative_to(input_root).with_suffix('').as_posix()
+
+def process_single_font(font_file, output_path, subset_plan=None, woff2_options=None, input_root=None):
+    """Optimise une police (web, print, WOFF2) et renvoie le résultat"""
+    font_file = Path(font_file)
+    output_path = Path(output_path)
+    name = output_name(font_file, input_root)
+
+    result = {
+        'original': str(font_file),
+        'bytes_in': font_file.stat().st_size,
+        'bytes_out': 0
+    }
+
+    try:
+        # Lecture unique : les trois sorties dérivent du même TTFont
+        source = FontSource(font_file)
+        result['sha256'] = hashlib.sha256(source.data).hexdigest()
+        result['face'] = read_face_info(source.font)
+
+        # Optimisation web
+        web_stem = output_path / 'web' / f"{name}_web"
+        print_output = output_path / 'print' / f"{name}_print{font_file.suffix}"
+        woff2_output = output_path / 'woff2' / f"{name}.woff2"
+        for path in (web_stem, print_output, woff2_output):
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+        result['web'] = optimize_font_for_web(source, web_stem, subset_plan, woff2_options)
+
+        # Optimisation print
+        optimize_font_for_print(source, str(print_output))
+        result['print'] = str(print_output)
+
+        # Conversion WOFF2
+        result['woff2'] = str(woff2_output)
+        result['woff2_ok'] = convert_to_woff2(source, str(woff2_output), woff2_options)
+
+        result['bytes_out'] = sum(path.stat().st_size for path in _output_paths(result) if path.exists())
+    except Exception as e:
+        # Une police défectueuse ne doit pas interrompre tout le lot
+        result['error'] = f"{type(e).__name__}: {e}"
+
+    return result
+
+def _output_paths(result):
+    """Tous les fichiers produits pour une police (shards web, print, WOFF2)"""
+    paths = [Path(shard['path']) for shard in result.get('web', [])]
+    paths += [Path(result[key]) for key in ('print', 'woff2') if key in result]
+    return paths
+
+def _failed_result(font_file, error):
+    """Résultat d'une police dont le processus de travail a échoué (mémoire, signal...)"""
+    return {'original': str(font_file), 'bytes_in': 0, 'bytes_out': 0, 'error': error_message(error)}
+
+def _iter_results(font_files, output_path, subset_plan, woff2_options, jobs, input_root=None):
+    """Traite les polices (dans un pool de processus si jobs > 1), résultats dans l'ordre d'entrée"""
+    worker = partial(process_single_font, output_path=output_path, subset_plan=subset_plan,
+                     woff2_options=woff2_options, input_root=input_root)
+    return iter_pool_results(worker, font_files, jobs, _failed_result)
+
+def settings_fingerprint(subset_plan, woff2_options=None):
+    """Empreinte des réglages d'optimisation, partie de la clé du cache"""
+    settings = {
+        'version': MANIFEST_VERSION,
+        'subset_plan': subset_plan,
+        'web_options': WEB_SUBSET_OPTIONS,
+        'woff2': woff2_options or WOFF2_OPTIONS
+    }
+    encoded = json.dumps(settings, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+def load_manifest(output_path):
+    """Charge le manifeste du cache incrémental (vide s'il est absent ou illisible)"""
+    manifest_file = Path(output_path) / MANIFEST_NAME
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {'version': MANIFEST_VERSION, 'fonts': {}}
+
+def save_manifest(output_path, manifest):
+    """Écrit le manifeste de façon atomique"""
+    manifest_file = Path(output_path) / MANIFEST_NAME
+    tmp_file = manifest_file.with_suffix('.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_file, manifest_file)
+
+def _file_sha256(path):
+    """Hash SHA-256 d'un fichier, lu par blocs"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def lookup_cached_font(entry, font_file, output_path, settings):
+    """Renvoie le résultat en cache si la source et les réglages n'ont pas changé"""
+    if not entry or entry.get('settings') != settings:
+        return None
+
+    # Les sorties sont enregistrées relativement au dossier de sortie
+    cached = _resolve_entry_outputs(entry, output_path)
+    if not all(path.exists() for path in _output_paths(cached)):
+        return None
+
+    stat = font_file.stat()
+    if (entry.get('size'), entry.get('mtime_ns')) != (stat.st_size, stat.st_mtime_ns):
+        # Date modifiée : seul le contenu fait foi
+        if _file_sha256(font_file) != entry.get('sha256'):
+            return None
+        entry['size'] = stat.st_size
+        entry['mtime_ns'] = stat.st_mtime_ns
+
+    cached['original'] = str(font_file)
+    cached['cached'] = True
+    return cached
+
+def _resolve_entry_outputs(entry, output_path):
+    """Chemins absolus des sorties d'une entrée de manifeste"""
+    return {
+        'web': [dict(shard, path=str(output_path / shard['path'])) for shard in entry.get('web', [])],
+        'print': str(output_path / entry['print']),
+        'woff2': str(output_path / entry['woff2']),
+        'face': entry.get('face')
+    }
+
+def _manifest_entry(result, font_file, output_path, settings):
+    """Construit l'entrée de manifeste d'une police traitée"""
+    stat = font_file.stat()
+    entry = {
+        'sha256': result['sha256'],
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'settings': settings,
+        'face': result['face']
+    }
+    entry['web'] = [dict(shard, path=Path(shard['path']).relative_to(output_path).as_posix())
+                    for shard in result['web']]
+    for key in ('print', 'woff2'):
+        entry[key] = Path(result[key]).relative_to(output_path).as_posix()
+    return entry
+
+def evict_stale_entries(manifest, current_keys, output_path):
+    """Supprime du manifeste (et du disque) les polices qui n'existent plus en entrée"""
+    evicted = [key for key in manifest['fonts'] if key not in current_keys]
+    for key in evicted:
+        entry = manifest['fonts'].pop(key)
+        for path in _output_paths(_resolve_entry_outputs(entry, output_path)):
+            path.unlink(missing_ok=True)
+    return evicted
+
+def process_font_collection(input_dir, output_dir, jobs=1, force=False, subset_plan=None,
+                            woff2_options=None):
     """Traite une collection complète de polices"""
+    subset_plan = subset_plan or build_subset_plan()
+    woff2_options = woff2_options or build_woff2_options()
     input_path = Path(input_dir)
     output_path = Path(output_dir)
 
@@ -82,64 +544,283 @@ def process_font_collection(input_dir, output_dir):
 
     output_path.mkdir(parents=True, exist_ok=True)
 
+    # Création des sous-dossiers
+    for directory in ['web', 'print', 'woff2']:
+        (output_path / directory).mkdir(exist_ok=True)
+
     font_extensions = {'.otf', '.ttf', '.woff', '.woff2'}
+    font_files = sorted(f for f in input_path.rglob('*') if f.suffix.lower() in font_extensions)
+
+    # Inter.ttf et Inter.otf d'un même dossier produiraient les mêmes sorties :
+    # seule la première est traitée (casse ignorée pour les systèmes de fichiers insensibles)
+    owners = {}
+    for font_file in font_files:
+        owner = owners.setdefault(output_name(font_file, input_path).lower(), font_file)
+        if owner is not font_file:
+            print(f"✗ {font_file.relative_to(input_path)} ignorée: mêmes fichiers de sortie que "
+                  f"{owner.relative_to(input_path)}")
+    font_files = sorted(owners.values())
+
+    # Cache incrémental : les polices inchangées réutilisent leurs sorties
+    manifest = load_manifest(output_path)
+    settings = settings_fingerprint(subset_plan, woff2_options)
+    font_keys = {font_file: font_file.relative_to(input_path).as_posix() for font_file in font_files}
+
+    evicted = evict_stale_entries(manifest, set(font_keys.values()), output_path)
+
+    cached_results = {}
+    if not force:
+        for font_file in font_files:
+            cached = lookup_cached_font(manifest['fonts'].get(font_keys[font_file]), font_file, output_path, settings)
+            if cached:
+                cached_results[font_file] = cached
+
+    to_process = [f for f in font_files if f not in cached_results]
 
     processed_fonts = []
+    failed_fonts = []
+    bytes_in = 0
+    bytes_out = 0
+    start = time.perf_counter()
 
-    for font_file in input_path.rglob('*'):
-        if font_file.suffix.lower() in font_extensions:
-            print(f"Traitement: {font_file.name}")
+    results = _iter_results(to_process, output_path, subset_plan, woff2_options, jobs, input_path)
 
-            # Création des sous-dossiers
-            web_dir = output_path / 'web'
-            print_dir = output_path / 'print'
-            woff2_dir = output_path / 'woff2'
+    for font_file in font_files:
+        if font_file in cached_results:
+            processed_fonts.append(cached_results[font_file])
+            continue
 
-            for directory in [web_dir, print_dir, woff2_dir]:
-                directory.mkdir(exist_ok=True)
+        result = next(results)
+        bytes_in += result['bytes_in']
+        bytes_out += result['bytes_out']
+        print(f"Traitement: {font_keys[font_file]}")
 
-            # Optimisation web
-            web_output = web_dir / f"{font_file.stem}_web{font_file.suffix}"
-            optimize_font_for_web(str(font_file), str(web_output))
+        if 'error' in result:
+            print(f"  ✗ Erreur: {result['error']}")
+            manifest['fonts'].pop(font_keys[font_file], None)
+            failed_fonts.append(result)
+            continue
 
-            # Optimisation print
-            print_output = print_dir / f"{font_file.stem}_print{font_file.suffix}"
-            optimize_font_for_print(str(font_file), str(print_output))
+        shards = ', '.join(f"{shard['name']} ({shard['codepoints']} car.)" for shard in result['web'])
+        print(f"  ✓ Shards web: {shards or 'aucun caractère couvert'}")
+        if result.pop('woff2_ok'):
+            print(f"  ✓ WOFF2 généré: {Path(result['woff2']).name}")
+            previous = manifest['fonts'].get(font_keys[font_file])
+            if previous:
+                # Shards d'un ancien plan de découpage devenus orphelins
+                current = set(_output_paths(result))
+                for path in _output_paths(_resolve_entry_outputs(previous, output_path)):
+                    if path not in current:
+                        path.unlink(missing_ok=True)
+            manifest['fonts'][font_keys[font_file]] = _manifest_entry(result, font_file, output_path, settings)
+        processed_fonts.append(result)
 
-            # Conversion WOFF2
-            woff2_output = woff2_dir / f"{font_file.stem}.woff2"
-            if convert_to_woff2(str(font_file), str(woff2_output)):
-                print(f"  ✓ WOFF2 généré: {woff2_output.name}")
+    save_manifest(output_path, manifest)
 
-            processed_fonts.append({
-                'original': str(font_file),
-                'web': str(web_output),
-                'print': str(print_output),
-                'woff2': str(woff2_output)
-            })
+    elapsed = time.perf_counter() - start
+    total = len(to_process)
+
+    print(f"\nDébit: {total} polices en {elapsed:.2f}s "
+          f"({total / elapsed if elapsed > 0 else 0:.1f} polices/s, {jobs} processus)")
+    print(f"Octets: {bytes_in} en entrée, {bytes_out} en sortie")
+    print(f"Cache: {len(cached_results)} police(s) inchangée(s) réutilisée(s), "
+          f"{len(evicted)} entrée(s) obsolète(s) supprimée(s)")
+    if failed_fonts:
+        print(f"Échecs: {len(failed_fonts)} police(s) ignorée(s)")
 
     return processed_fonts
 
+def load_instancing_plan(config_path, instance_names=None, axis_ranges=None):
+    """Instances à produire depuis variable_font_config.json : statiques (masters) et partielles
+
+    Chaque instance est {'name', 'limits'} ; une limite est une valeur (axe figé)
+    ou un couple (min, max) (plage d'axe restreinte).
+    """
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    masters = config.get('masters', {})
+    instancing = config.get('instancing', {})
+    static_names = instancing.get('static', list(masters))
+    partials = instancing.get('partial', {})
+
+    if instance_names is not None:
+        unknown = [name for name in instance_names if name not in masters and name not in partials]
+        if unknown:
+            raise ValueError(f"Instance inconnue: {', '.join(unknown)} "
+                             f"(disponibles: {', '.join(list(masters) + list(partials))})")
+        static_names = [name for name in instance_names if name in masters]
+        partials = {name: partials[name] for name in instance_names if name in partials}
+
+    axes = config.get('variable_axes', {})
+    instances = []
+    for name in static_names:
+        # Seules les coordonnées d'axes déclarés comptent (stem_width, contrast... sont ignorés)
+        limits = {tag: value for tag, value in masters[name].items() if tag in axes}
+        instances.append({'name': name, 'limits': limits, 'static': True})
+    for name, limits in partials.items():
+        instances.append({'name': name, 'limits': _parse_axis_limits(limits), 'static': False})
+    if axis_ranges:
+        name = '-'.join(f"{tag}{_format_limit(limit)}" for tag, limit in axis_ranges.items())
+        instances.append({'name': name, 'limits': axis_ranges, 'static': False})
+
+    return instances
+
+def _parse_axis_limits(limits):
+    """{'wght': [300, 700], 'ital': 0} -> {'wght': (300, 700), 'ital': 0}"""
+    return {tag: tuple(value) if isinstance(value, (list, tuple)) else value
+            for tag, value in limits.items()}
+
+def _format_limit(limit):
+    if isinstance(limit, tuple):
+        return f"{limit[0]:g}-{limit[1]:g}"
+    return f"{limit:g}"
+
+def parse_axis_ranges(spec):
+    """'wght=300:700,ital=0' -> {'wght': (300.0, 700.0), 'ital': 0.0}"""
+    ranges = {}
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        tag, _, value = part.partition('=')
+        if not value:
+            raise ValueError(f"Plage d'axe invalide: {part} (attendu: wght=300:700)")
+        if ':' in value:
+            minimum, maximum = (float(bound) for bound in value.split(':', 1))
+            ranges[tag.strip()] = (minimum, maximum)
+        else:
+            ranges[tag.strip()] = float(value)
+    return ranges
+
+def instantiate_font(source, limits, static=False):
+    """Instance statique ou partielle d'une police variable, bornée à ses axes fvar"""
+    from fontTools.varLib import instancer
+
+    font = _as_source(source).copy_font()
+    if 'fvar' not in font:
+        raise ValueError("La police n'est pas variable (table fvar absente)")
+
+    fvar_axes = {axis.axisTag: axis for axis in font['fvar'].axes}
+    axis_limits = {tag: limit for tag, limit in limits.items() if tag in fvar_axes}
+    if static:
+        # Instance statique : tout axe non précisé est figé à sa valeur par défaut
+        for tag, axis in fvar_axes.items():
+            axis_limits.setdefault(tag, axis.defaultValue)
+
+    return instancer.instantiateVariableFont(font, axis_limits, updateFontNames='STAT' in font)
+
+def process_font_instance(vf_file, instance, output_path, subset_plan=None, woff2_options=None):
+    """Génère une instance de police variable puis ses shards web et son WOFF2"""
+    vf_file = Path(vf_file)
+    output_path = Path(output_path)
+    instance_file = output_path / 'instances' / f"{vf_file.stem}-{instance['name']}.ttf"
+
+    result = {
+        'original': str(instance_file),
+        'instance': instance['name'],
+        'bytes_in': vf_file.stat().st_size,
+        'bytes_out': 0
+    }
+
+    try:
+        font = instantiate_font(vf_file, instance['limits'], instance['static'])
+        font.save(instance_file)
+        if 'fvar' in font:
+            result['axes'] = {axis.axisTag: [axis.minValue, axis.maxValue] for axis in font['fvar'].axes}
+
+        source = FontSource(instance_file)
+        result['sha256'] = hashlib.sha256(source.data).hexdigest()
+        result['face'] = read_face_info(source.font)
+
+        web_stem = output_path / 'web' / f"{instance_file.stem}_web"
+        result['web'] = optimize_font_for_web(source, web_stem, subset_plan, woff2_options)
+
+        woff2_output = output_path / 'woff2' / f"{instance_file.stem}.woff2"
+        result['woff2'] = str(woff2_output)
+        result['woff2_ok'] = convert_to_woff2(source, str(woff2_output), woff2_options)
+
+        result['bytes_out'] = sum(path.stat().st_size for path in _output_paths(result) if path.exists())
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+
+    return result
+
+def process_variable_font(vf_file, output_dir, instances, jobs=1, subset_plan=None, woff2_options=None):
+    """Produit toutes les instances d'une police variable, en parallèle si jobs > 1"""
+    subset_plan = subset_plan or build_subset_plan()
+    woff2_options = woff2_options or build_woff2_options()
+    output_path = Path(output_dir)
+
+    for directory in ['instances', 'web', 'woff2']:
+        (output_path / directory).mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    arguments = [(vf_file, instance, output_path, subset_plan, woff2_options) for instance in instances]
+
+    if jobs > 1 and len(instances) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(instances))) as executor:
+            results = list(executor.map(process_font_instance, *zip(*arguments)))
+    else:
+        results = [process_font_instance(*args) for args in arguments]
+
+    processed = []
+    for result in results:
+        print(f"Instance: {result['instance']}")
+        if 'error' in result:
+            print(f"  ✗ Échec: {result['error']}")
+            continue
+        axes = ', '.join(f"{tag} {low:g}-{high:g}" for tag, (low, high) in result.get('axes', {}).items())
+        print(f"  ✓ {'Variable (' + axes + ')' if axes else 'Statique'} : "
+              f"{len(result['web'])} shards, {result['bytes_out']} octets")
+        processed.append(result)
+
+    elapsed = time.perf_counter() - start
+    print(f"\n{len(processed)}/{len(instances)} instances en {elapsed:.2f}s "
+          f"(police variable: {Path(vf_file).stat().st_size} octets)")
+    return processed
+
+def _face_of(font_data):
+    """Descripteurs @font-face d'un résultat (repli sur le nom de fichier)"""
+    return font_data.get('face') or {'family': Path(font_data['original']).stem, 'weight': '400',
+                                     'style': 'normal', 'stretch': '100%'}
+
+def _shard_url(shard, css_dir):
+    return Path(os.path.relpath(shard['path'], css_dir)).as_posix()
+
 def generate_css_web_fonts(fonts_data, css_output):
-    """Génère un fichier CSS pour les polices web"""
-    css_content = """/* Web Fonts générés automatiquement */
-@font-face {
-    font-family: 'CustomFont';
-    src: url('./woff2/font.woff2') format('woff2'),
-         url('./web/font_web.woff') format('woff');
-    font-weight: normal;
-    font-style: normal;
-    font-display: swap;
-}
+    """Génère un fichier CSS pour les polices web (une règle @font-face par shard)"""
+    css_dir = Path(css_output).parent
+    css_content = "/* Web Fonts générés automatiquement */\n"
+
+    # Regroupement par famille, graisses croissantes : une famille = un bloc lisible
+    faces = sorted(fonts_data, key=lambda data: (_face_of(data)['family'],
+                                                 float(_face_of(data)['weight'].split()[0]),
+                                                 _face_of(data)['style'] != 'normal'))
+    current_family = None
 
-@font-face {
-    font-family: 'CustomFont';
-    src: url('./woff2/font-bold.woff2') format('woff2'),
-         url('./web/font-bold_web.woff') format('woff');
-    font-weight: bold;
-    font-style: normal;
+    for font_data in faces:
+        face = _face_of(font_data)
+        if face['family'] != current_family:
+            current_family = face['family']
+            css_content += f"\n/* ===== {current_family} ===== */\n"
+
+        for shard in font_data.get('web', []):
+            url = _shard_url(shard, css_dir)
+            font_format = 'woff2' if url.endswith('.woff2') else 'woff'
+            css_content += f"""
+/* {Path(font_data['original']).stem} — {shard['name']} */
+@font-face {{
+    font-family: '{face['family']}';
+    src: url('./{url}') format('{font_format}');
+    font-weight: {face['weight']};
+    font-style: {face['style']};
+    font-stretch: {face['stretch']};
     font-display: swap;
-}
+    unicode-range: {shard['unicode_range']};
+}}
 """
 
     with open(css_output, 'w', encoding='utf-8') as f:
@@ -147,32 +828,76 @@ def generate_css_web_fonts(fonts_data, css_output):
 
     print(f"CSS généré: {css_output}")
 
-def generate_html_test_page(fonts_data, html_output):
+def select_critical_faces(fonts_data, shard_names=None):
+    """Shards à précharger : par famille, la face la plus proche du texte courant (400, normal)"""
+    best = {}
+    for font_data in fonts_data:
+        face = _face_of(font_data)
+        weights = [float(value) for value in face['weight'].split()]
+        # Une police variable couvrant 400 est idéale ; sinon on prend la graisse la plus proche
+        distance = 0 if min(weights) <= 400 <= max(weights) else min(abs(w - 400) for w in weights)
+        score = (face['style'] != 'normal', distance)
+        if face['family'] not in best or score < best[face['family']][0]:
+            best[face['family']] = (score, font_data)
+
+    critical = []
+    for _, font_data in best.values():
+        shards = font_data.get('web', [])
+        if shard_names is not None:
+            shards = [shard for shard in shards if shard['name'] in shard_names]
+        # Par défaut seul le premier shard du plan (profil principal) est critique
+        critical.extend(shards if shard_names is not None else shards[:1])
+    return critical
+
+def generate_preload_hints(fonts_data, preload_output, css_dir, shard_names=None):
+    """Écrit les balises <link rel=preload> des faces critiques, à placer dans le <head>"""
+    links = []
+    for shard in select_critical_faces(fonts_data, shard_names):
+        url = _shard_url(shard, css_dir)
+        font_type = 'font/woff2' if url.endswith('.woff2') else 'font/woff'
+        links.append(f'<link rel="preload" href="./{url}" as="font" type="{font_type}" crossorigin>')
+
+    with open(preload_output, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(links) + '\n')
+
+    print(f"Préchargement généré: {preload_output} ({len(links)} fichier(s) critique(s))")
+    return links
+
+def generate_html_test_page(fonts_data, html_output, preload_links=None):
     """Génère une page HTML de test"""
-    html_content = """<!DOCTYPE html>
+    families = sorted({_face_of(font_data)['family'] for font_data in fonts_data}) or ['CustomFont']
+    face_samples = "".join(
+        f"""        <p style="font-family: '{face['family']}'; font-weight: {face['weight'].split()[-1]}; """
+        f"""font-style: {face['style'].split()[0]};">{face['family']} {face['weight']} {face['style']} — """
+        f"""Le renard brun rapide saute par-dessus le chien paresseux.</p>\n"""
+        for face in (_face_of(font_data) for font_data in fonts_data)
+    )
+    preload = "".join(f"    {link}\n" for link in preload_links or [])
+
+    html_content = f"""<!DOCTYPE html>
 <html lang="fr">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Test des polices optimisées</title>
-    <link rel="stylesheet" href="fonts.css">
+{preload}    <link rel="stylesheet" href="fonts.css">
     <style>
-        body {
-            font-family: 'CustomFont', Arial, sans-serif;
+        body {{
+            font-family: '{families[0]}', Arial, sans-serif;
             line-height: 1.6;
             max-width: 800px;
             margin: 2rem auto;
             padding: 2rem;
-        }
-        .test-section {
+        }}
+        .test-section {{
             margin: 2rem 0;
             padding: 1rem;
             border: 1px solid #ccc;
-        }
-        .font-weight-normal { font-weight: normal; }
-        .font-weight-bold { font-weight: bold; }
-        .font-size-small { font-size: 14px; }
-        .font-size-large { font-size: 48px; }
+        }}
+        .font-weight-normal {{ font-weight: normal; }}
+        .font-weight-bold {{ font-weight: bold; }}
+        .font-size-small {{ font-size: 14px; }}
+        .font-size-large {{ font-size: 48px; }}
     </style>
 </head>
 <body>
@@ -184,6 +909,10 @@ def generate_html_test_page(fonts_data, html_output):
         <p class="font-weight-bold">Le renard brun rapide saute par-dessus le chien paresseux. 0123456789</p>
     </div>
 
+    <div class="test-section">
+        <h2>Faces générées</h2>
+{face_samples}    </div>
+
     <div class="test-section">
         <h2>Tailles de police</h2>
         <p class="font-size-small">Texte petit - Parfait pour les légendes</p>
@@ -207,18 +936,100 @@ def generate_html_test_page(fonts_data, html_output):
 
 def main():
     """Point d'entrée principal"""
-    if len(sys.argv) != 3:
-        print("Usage: python batch_optimizer.py <input_dir> <output_dir>")
+    parser = argparse.ArgumentParser(description="Optimiseur de polices par lots")
+    parser.add_argument('input_dir', nargs='?',
+                        help='Dossier contenant les polices sources (police variable avec --variable-config)')
+    parser.add_argument('output_dir', nargs='?', help='Dossier de sortie')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Nombre de processus en parallèle (0 = tous les cœurs)')
+    parser.add_argument('--force', action='store_true',
+                        help='Ignore le cache incrémental et retraite toutes les polices')
+    parser.add_argument('--subset', default=','.join(DEFAULT_SUBSET_PROFILES),
+                        help=f"Profils unicode des shards web, séparés par des virgules "
+                             f"({', '.join(UNICODE_PROFILES)})")
+    parser.add_argument('--subset-text', metavar='FICHIER',
+                        help='Ajoute un shard couvrant exactement les caractères de ce texte')
+    parser.add_argument('--subset-profile', metavar='PROFIL',
+                        help='Profil glyph_profiler.py : un shard par locale du corpus')
+    parser.add_argument('--subset-locales',
+                        help='Locales du profil à retenir, séparées par des virgules (défaut : toutes)')
+    parser.add_argument('--preload', metavar='SHARDS',
+                        help='Shards préchargés pour les faces critiques (défaut : le premier du plan)')
+    parser.add_argument('--woff2-quality', type=int, default=WOFF2_OPTIONS['quality'],
+                        help='Qualité Brotli des fichiers WOFF2, de 0 (rapide) à 11 (compact)')
+    parser.add_argument('--woff2-transform', default=','.join(WOFF2_OPTIONS['transform_tables']),
+                        help="Tables à transformer en WOFF2 (glyf,loca / hmtx / none)")
+    parser.add_argument('--variable-config', metavar='CONFIG',
+                        help='variable_font_config.json : instancie la police variable input_dir')
+    parser.add_argument('--instances',
+                        help='Instances à produire, séparées par des virgules (défaut : toutes celles du fichier)')
+    parser.add_argument('--axis-range', metavar='AXES',
+                        help="Instance partielle supplémentaire, ex: wght=300:700,ital=0")
+    parser.add_argument('--benchmark-woff2', metavar='POLICE',
+                        help='Mesure taille et temps WOFF2 pour chaque qualité et transformation')
+
+    args = parser.parse_args()
+
+    if args.benchmark_woff2:
+        try:
+            benchmark = benchmark_woff2(args.benchmark_woff2)
+        except ImportError:
+            print("Installation requise: pip install brotli")
+            sys.exit(1)
+        print(f"Benchmark WOFF2: {args.benchmark_woff2} ({benchmark['source_bytes']} octets)")
+        print(f"{'Transformation':<16}{'Qualité':>8}{'Temps (ms)':>12}{'Octets':>10}{'Ratio':>8}")
+        for entry in benchmark['results']:
+            transform = ','.join(entry['transform_tables']) or 'aucune'
+            ratio = entry['bytes'] / benchmark['source_bytes'] * 100
+            print(f"{transform:<16}{entry['quality']:>8}{entry['seconds'] * 1000:>12.1f}"
+                  f"{entry['bytes']:>10}{ratio:>7.1f}%")
+        return
+
+    if not args.input_dir or not args.output_dir:
+        parser.error("input_dir et output_dir sont requis")
+
+    input_dir = args.input_dir
+    output_dir = args.output_dir
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    text = None
+    if args.subset_text:
+        with open(args.subset_text, 'r', encoding='utf-8', errors='replace') as f:
+            text = f.read()
+
+    try:
+        profiles = [name.strip() for name in args.subset.split(',') if name.strip()]
+        corpus_ranges = None
+        if args.subset_profile:
+            locales = args.subset_locales.split(',') if args.subset_locales else None
+            corpus_ranges = load_corpus_ranges(args.subset_profile, locales)
+        subset_plan = build_subset_plan(profiles, text, corpus_ranges)
+        transform = [t.strip() for t in args.woff2_transform.split(',') if t.strip() not in ('', 'none')]
+        woff2_options = build_woff2_options(args.woff2_quality, transform)
+    except (OSError, ValueError) as e:
+        print(f"Erreur: {e}")
         sys.exit(1)
 
-    input_dir = sys.argv[1]
-    output_dir = sys.argv[2]
+    if args.variable_config:
+        try:
+            instance_names = args.instances.split(',') if args.instances else None
+            axis_ranges = parse_axis_ranges(args.axis_range) if args.axis_range else None
+            instances = load_instancing_plan(args.variable_config, instance_names, axis_ranges)
+        except (OSError, ValueError) as e:
+            print(f"Erreur: {e}")
+            sys.exit(1)
 
-    print(f"Optimisation des polices depuis {input_dir} vers {output_dir}")
-    print("=" * 60)
+        print(f"Instanciation de {input_dir} vers {output_dir} ({len(instances)} instances)")
+        print("=" * 60)
+        processed_fonts = process_variable_font(input_dir, output_dir, instances, jobs=jobs,
+                                                subset_plan=subset_plan, woff2_options=woff2_options)
+    else:
+        print(f"Optimisation des polices depuis {input_dir} vers {output_dir}")
+        print("=" * 60)
 
-    # Traitement des polices
-    processed_fonts = process_font_collection(input_dir, output_dir)
+        # Traitement des polices
+        processed_fonts = process_font_collection(input_dir, output_dir, jobs=jobs, force=args.force,
+                                                  subset_plan=subset_plan, woff2_options=woff2_options)
 
     if processed_fonts:
         print(f"\nTraitement terminé: {len(processed_fonts)} polices optimisées")
@@ -226,14 +1037,17 @@ def main():
         # Génération des fichiers d'accompagnement
         css_file = Path(output_dir) / 'fonts.css'
         html_file = Path(output_dir) / 'test.html'
+        preload_file = Path(output_dir) / 'fonts-preload.html'
 
         generate_css_web_fonts(processed_fonts, css_file)
-        generate_html_test_page(processed_fonts, html_file)
+        preload_shards = args.preload.split(',') if args.preload else None
+        preload_links = generate_preload_hints(processed_fonts, preload_file, css_file.parent, preload_shards)
+        generate_html_test_page(processed_fonts, html_file, preload_links)
 
-        print("
-Fichiers générés:")
+        print("\nFichiers générés:")
         print(f"  - {len(processed_fonts)} polices optimisées")
         print(f"  - {css_file}")
+        print(f"  - {preload_file}")
         print(f"  - {html_file}")
 
         # Rapport de compression
@@ -242,7 +1056,7 @@ Fichiers générés:")
 
         if total_woff2 > 0:
             compression_ratio = (1 - total_woff2 / total_original) * 100
-            print(f"\nCompression WOFF2: {compression_ratio:.1f}% d".1f"pace économisé")
+            print(f"\nCompression WOFF2: {compression_ratio:.1f}% d'espace économisé")
     else:
         print("Aucune police trouvée à traiter")
 
@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+Moteur de couleurs vectorisé (NumPy) partagé par les générateurs de palettes
+Usage: python color_engine.py --benchmark 100000
+
+Convertit des tableaux entiers de couleurs en une seule passe :
+hex <-> RGB <-> HSL, RGB <-> RGB linéaire <-> OKLab/OKLCH, luminance relative
+et contraste WCAG. Les tableaux RGB sont de forme (..., 3), à valeurs dans [0, 1] ;
+la teinte HSL est en degrés [0, 360), saturation et luminosité dans [0, 1].
+OKLCH : luminosité perceptive L dans [0, 1], chroma C >= 0, teinte h en degrés.
+"""
+
+import re
+import time
+import argparse
+from functools import lru_cache
+
+import numpy as np
+
+# Coefficients de luminance relative (WCAG 2.x, primaires sRGB)
+LUMINANCE_WEIGHTS = np.array([0.2126, 0.7152, 0.0722])
+# Seuil de linéarisation retenu par WCAG 2.x
+SRGB_LINEAR_THRESHOLD = 0.03928
+
+# OKLab (Björn Ottosson) : RGB linéaire -> LMS, puis LMS^(1/3) -> Lab, et inverses
+_RGB_TO_LMS = np.array([[0.4122214708, 0.5363325363, 0.0514459929],
+                        [0.2119034982, 0.6806995451, 0.1073969566],
+                        [0.0883024619, 0.2817188376, 0.6299787005]])
+_LMS_TO_OKLAB = np.array([[0.2104542553, 0.7936177850, -0.0040720468],
+                          [1.9779984951, -2.4285922050, 0.4505937099],
+                          [0.0259040371, 0.7827717662, -0.8086757660]])
+_OKLAB_TO_LMS = np.array([[1.0, 0.3963377774, 0.2158037573],
+                          [1.0, -0.1055613458, -0.0638541728],
+                          [1.0, -0.0894841775, -1.2914855480]])
+_LMS_TO_RGB = np.array([[4.0767416621, -3.3077115913, 0.2309699292],
+                        [-1.2684380046, 2.6097574011, -0.3413193965],
+                        [-0.0041960863, -0.7034186147, 1.7076147010]])
+# Tolérance du test d'appartenance au gamut sRGB (erreurs d'arrondi des matrices)
+GAMUT_EPSILON = 1e-6
+
+# Entrées conservées par les caches de couleurs (analyse et luminance)
+COLOR_CACHE_SIZE = 4096
+
+# Mots-clés CSS de base acceptés par parse_color
+NAMED_COLORS = {
+    'black': (0, 0, 0), 'white': (255, 255, 255), 'gray': (128, 128, 128), 'grey': (128, 128, 128),
+    'silver': (192, 192, 192), 'red': (255, 0, 0), 'maroon': (128, 0, 0), 'orange': (255, 165, 0),
+    'yellow': (255, 255, 0), 'olive': (128, 128, 0), 'lime': (0, 255, 0), 'green': (0, 128, 0),
+    'aqua': (0, 255, 255), 'cyan': (0, 255, 255), 'teal': (0, 128, 128), 'blue': (0, 0, 255),
+    'navy': (0, 0, 128), 'fuchsia': (255, 0, 255), 'magenta': (255, 0, 255), 'purple': (128, 0, 128)
+}
+
+_RGB_FUNCTION = re.compile(r'^rgba?\(\s*([\d.]+%?)\s*[,\s]\s*([\d.]+%?)\s*[,\s]\s*([\d.]+%?)'
+                           r'\s*(?:[,/]\s*([\d.]+%?)\s*)?\)$')
+
+# int(..., 16) tolère signes et espaces : les chiffres sont vérifiés avant conversion
+# (#rrggbb, ou #rrggbbaa avec canal alpha)
+_HEX_STRING = re.compile(r'^[0-9a-f]{6}(?:[0-9a-f]{2})?$')
+
+_HEX_DIGITS = np.frombuffer(b'0123456789abcdef', dtype=np.uint8)
+
+def hex_to_rgb(hex_colors):
+    """'#2E5B91' ou tableau de chaînes hex -> RGB (..., 3) dans [0, 1]"""
+    colors = np.asarray(hex_colors, dtype='U8')
+    # Chaînes de largeur fixe vues comme points de code UCS-4 : aucune boucle Python
+    codes = colors.reshape(-1).view(np.uint32).reshape(-1, 8)
+    has_hash = codes[:, 0] == ord('#')
+    digits = np.where(has_hash[:, None], codes[:, 1:7], codes[:, :6])
+    overflow = np.where(has_hash, codes[:, 7], codes[:, 6] | codes[:, 7])
+    lengths = np.count_nonzero(digits, axis=1)
+
+    # Forme courte #RGB : chaque chiffre est doublé
+    short = lengths == 3
+    if short.any():
+        digits[short] = digits[short][:, [0, 0, 1, 1, 2, 2]]
+    if not ((lengths == 6) | short).all() or overflow.any():
+        raise ValueError("Couleur hex invalide (attendu: #RRGGBB ou #RGB)")
+
+    digits = digits.astype(np.int64)
+    # Casse repliée : seuls A-F deviennent a-f, aucun autre caractère n'y tombe
+    lowered = digits | 0x20
+    decimal = (digits >= ord('0')) & (digits <= ord('9'))
+    if not (decimal | ((lowered >= ord('a')) & (lowered <= ord('f')))).all():
+        raise ValueError("Couleur hex invalide (chiffres 0-9, a-f)")
+    nibbles = np.where(decimal, digits - ord('0'), lowered - ord('a') + 10)
+
+    rgb = (nibbles[:, 0::2] * 16 + nibbles[:, 1::2]) / 255.0
+    return rgb.reshape(colors.shape + (3,))
+
+def rgb_to_hex(rgb):
+    """RGB (..., 3) dans [0, 1] -> chaîne '#rrggbb' (ou tableau de chaînes)"""
+    rgb = np.asarray(rgb, dtype=float)
+    channels = np.rint(np.clip(rgb, 0.0, 1.0) * 255).astype(np.uint8).reshape(-1, 3)
+
+    # 7 octets ASCII par couleur, convertis d'un bloc en chaînes
+    encoded = np.empty((channels.shape[0], 7), dtype=np.uint8)
+    encoded[:, 0] = ord('#')
+    encoded[:, 1::2] = _HEX_DIGITS[channels >> 4]
+    encoded[:, 2::2] = _HEX_DIGITS[channels & 0x0F]
+    strings = encoded.view('S7').reshape(-1).astype('U7')
+
+    if rgb.ndim == 1:
+        return str(strings[0])
+    return strings.reshape(rgb.shape[:-1])
+
+def rgb_to_hsl(rgb):
+    """RGB (..., 3) -> HSL (..., 3)"""
+    rgb = np.asarray(rgb, dtype=float)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    max_val = rgb.max(axis=-1)
+    min_val = rgb.min(axis=-1)
+    diff = max_val - min_val
+
+    lightness = (max_val + min_val) / 2
+    chromatic = diff > 0
+    safe_diff = np.where(chromatic, diff, 1.0)
+
+    denominator = np.where(lightness > 0.5, 2 - max_val - min_val, max_val + min_val)
+    saturation = np.where(chromatic, diff / np.where(denominator == 0, 1.0, denominator), 0.0)
+
+    hue = np.where(max_val == r, 60 * ((g - b) / safe_diff) + 360,
+                   np.where(max_val == g, 60 * ((b - r) / safe_diff) + 120,
+                            60 * ((r - g) / safe_diff) + 240)) % 360
+    hue = np.where(chromatic, hue, 0.0)
+
+    return np.stack([hue, saturation, lightness], axis=-1)
+
+def hsl_to_rgb(hsl):
+    """HSL (..., 3) -> RGB (..., 3)"""
+    hsl = np.asarray(hsl, dtype=float)
+    hue = hsl[..., 0] / 360.0
+    saturation = np.clip(hsl[..., 1], 0.0, 1.0)
+    lightness = np.clip(hsl[..., 2], 0.0, 1.0)
+
+    q = np.where(lightness < 0.5, lightness * (1 + saturation), lightness + saturation - lightness * saturation)
+    p = 2 * lightness - q
+
+    # Les trois canaux en une passe : décalages de teinte +1/3, 0, -1/3
+    t = (hue[..., None] + np.array([1 / 3, 0.0, -1 / 3])) % 1.0
+    p, q = p[..., None], q[..., None]
+    rgb = np.where(t < 1 / 6, p + (q - p) * 6 * t,
+                   np.where(t < 1 / 2, q,
+                            np.where(t < 2 / 3, p + (q - p) * (2 / 3 - t) * 6, p)))
+    return rgb
+
+def srgb_to_linear(rgb):
+    """Composantes sRGB -> RGB linéaire"""
+    rgb = np.asarray(rgb, dtype=float)
+    return np.where(rgb <= SRGB_LINEAR_THRESHOLD, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+def linear_to_srgb(linear):
+    """RGB linéaire -> composantes sRGB"""
+    linear = np.clip(np.asarray(linear, dtype=float), 0.0, 1.0)
+    return np.where(linear <= SRGB_LINEAR_THRESHOLD / 12.92, linear * 12.92,
+                    1.055 * linear ** (1 / 2.4) - 0.055)
+
+def relative_luminance(rgb):
+    """Luminance relative WCAG d'un tableau RGB (..., 3) -> (...)"""
+    # Somme pondérée explicite plutôt qu'un produit matriciel : même arrondi quelle
+    # que soit la forme du tableau, donc même valeur en scalaire et en lot
+    linear = srgb_to_linear(rgb)
+    return (LUMINANCE_WEIGHTS[0] * linear[..., 0] + LUMINANCE_WEIGHTS[1] * linear[..., 1]
+            + LUMINANCE_WEIGHTS[2] * linear[..., 2])
+
+def contrast_ratio(luminance_a, luminance_b):
+    """Ratio de contraste WCAG, avec diffusion NumPy entre les deux opérandes"""
+    luminance_a = np.asarray(luminance_a, dtype=float)
+    luminance_b = np.asarray(luminance_b, dtype=float)
+    lighter = np.maximum(luminance_a, luminance_b)
+    darker = np.minimum(luminance_a, luminance_b)
+    return (lighter + 0.05) / (darker + 0.05)
+
+def linear_rgb_to_oklab(linear):
+    """RGB linéaire (..., 3) -> OKLab (..., 3)"""
+    lms = np.asarray(linear, dtype=float) @ _RGB_TO_LMS.T
+    return np.cbrt(lms) @ _LMS_TO_OKLAB.T
+
+def oklab_to_linear_rgb(lab):
+    """OKLab (..., 3) -> RGB linéaire (..., 3), non borné (hors gamut possible)"""
+    lms = (np.asarray(lab, dtype=float) @ _OKLAB_TO_LMS.T) ** 3
+    return lms @ _LMS_TO_RGB.T
+
+def oklab_to_oklch(lab):
+    lab = np.asarray(lab, dtype=float)
+    chroma = np.hypot(lab[..., 1], lab[..., 2])
+    hue = np.degrees(np.arctan2(lab[..., 2], lab[..., 1])) % 360
+    return np.stack([lab[..., 0], chroma, hue], axis=-1)
+
+def oklch_to_oklab(lch):
+    lch = np.asarray(lch, dtype=float)
+    hue = np.radians(lch[..., 2])
+    return np.stack([lch[..., 0], lch[..., 1] * np.cos(hue), lch[..., 1] * np.sin(hue)], axis=-1)
+
+def rgb_to_oklch(rgb):
+    """RGB (..., 3) -> OKLCH (..., 3)"""
+    return oklab_to_oklch(linear_rgb_to_oklab(srgb_to_linear(rgb)))
+
+def gamut_map_oklch(lch, iterations=16):
+    """Réduit la chroma (L et teinte conservées) jusqu'à entrer dans le gamut sRGB
+
+    Recherche dichotomique menée sur toutes les couleurs à la fois.
+    """
+    lch = np.asarray(lch, dtype=float)
+    lightness = np.clip(lch[..., 0], 0.0, 1.0)
+    chroma = np.maximum(lch[..., 1], 0.0)
+    hue = lch[..., 2]
+
+    def in_gamut(l, c, h):
+        linear = oklab_to_linear_rgb(oklch_to_oklab(np.stack([l, c, h], axis=-1)))
+        return ((linear >= -GAMUT_EPSILON) & (linear <= 1 + GAMUT_EPSILON)).all(axis=-1)
+
+    mapped = chroma.copy()
+    outside = ~in_gamut(lightness, chroma, hue)
+    if outside.any():
+        # Seules les couleurs hors gamut sont recherchées
+        l, h = lightness[outside], hue[outside]
+        low = np.zeros_like(l)
+        high = chroma[outside]
+        for _ in range(iterations):
+            middle = (low + high) / 2
+            fits = in_gamut(l, middle, h)
+            low = np.where(fits, middle, low)
+            high = np.where(fits, high, middle)
+        mapped[outside] = low
+
+    return np.stack([lightness, mapped, hue], axis=-1)
+
+def oklch_to_rgb(lch):
+    """OKLCH (..., 3) -> RGB (..., 3), ramené dans le gamut sRGB par réduction de chroma"""
+    return linear_to_srgb(oklab_to_linear_rgb(oklch_to_oklab(gamut_map_oklch(lch))))
+
+def luminance_for_contrast(ratio, reference_luminance, lighter):
+    """Luminance relative donnant exactement ce contraste avec la référence
+
+    lighter=True : couleur plus claire que la référence, sinon plus sombre.
+    """
+    ratio = np.asarray(ratio, dtype=float)
+    reference_luminance = np.asarray(reference_luminance, dtype=float)
+    return np.where(lighter, ratio * (reference_luminance + 0.05) - 0.05,
+                    (reference_luminance + 0.05) / ratio - 0.05)
+
+def solve_oklch_lightness(chroma, hue, target_luminance, lighter, iterations=16):
+    """Couleurs RGB de chroma et teinte données atteignant une luminance WCAG cible
+
+    Dichotomie vectorisée sur la luminosité OKLCH de toutes les cibles à la fois.
+    La luminance est évaluée sur la couleur quantifiée en 8 bits (celle qui sera
+    écrite en hex) et la borne retenue est toujours du côté de la cible demandé :
+    lighter=True garantit une luminance >= cible, sinon <= cible.
+    """
+    chroma, hue, target_luminance, lighter = np.broadcast_arrays(
+        np.asarray(chroma, dtype=float), np.asarray(hue, dtype=float),
+        np.asarray(target_luminance, dtype=float), np.asarray(lighter, dtype=bool))
+
+    def quantized_rgb(lightness):
+        rgb = oklch_to_rgb(np.stack([lightness, chroma, hue], axis=-1))
+        return np.rint(rgb * 255) / 255
+
+    # Invariant : luminance(low) < cible <= luminance(high)
+    low = np.zeros(chroma.shape)
+    high = np.ones(chroma.shape)
+    for _ in range(iterations):
+        middle = (low + high) / 2
+        reached = relative_luminance(quantized_rgb(middle)) >= target_luminance
+        high = np.where(reached, middle, high)
+        low = np.where(reached, low, middle)
+
+    return quantized_rgb(np.where(lighter, high, low))
+
+# ---------------------------------------------------------------------------
+# Couche canonique : analyse et luminance mémorisées, partagées par les outils
+# ---------------------------------------------------------------------------
+
+def _alpha_component(text):
+    """Canal alpha CSS ('0.5' ou '50%') -> [0, 1]"""
+    number = float(text.rstrip('%'))
+    if text.endswith('%'):
+        number /= 100
+    return min(max(number, 0.0), 1.0)
+
+@lru_cache(maxsize=COLOR_CACHE_SIZE)
+def parse_color_alpha(value):
+    """Couleur CSS -> ((r, g, b) en 0-255, alpha en 0-1)
+
+    Accepte '#2E5B91', '#fff', '#2e5b9180', '#fff8', 'rgb(46, 91, 145)',
+    'rgba(0, 0, 0, 0.1)', 'rgb(0 0 0 / 10%)', 'transparent' et les mots-clés
+    de base. Lève ValueError si la couleur n'est pas reconnue.
+    """
+    text = value.strip().lower()
+    if text in NAMED_COLORS:
+        return NAMED_COLORS[text], 1.0
+    if text == 'transparent':
+        return (0, 0, 0), 0.0
+
+    if text.startswith('#'):
+        digits = text[1:]
+        if len(digits) in (3, 4):
+            digits = ''.join(digit * 2 for digit in digits)
+        if _HEX_STRING.match(digits):
+            alpha = int(digits[6:], 16) / 255 if len(digits) == 8 else 1.0
+            return tuple(int(digits[i:i + 2], 16) for i in (0, 2, 4)), alpha
+
+    match = _RGB_FUNCTION.match(text)
+    if match:
+        channels = []
+        for channel in match.groups()[:3]:
+            number = float(channel.rstrip('%'))
+            channels.append(round(number * 255 / 100) if channel.endswith('%') else round(number))
+        if all(0 <= channel <= 255 for channel in channels):
+            alpha = match.group(4)
+            return tuple(channels), _alpha_component(alpha) if alpha is not None else 1.0
+
+    raise ValueError(f"Couleur invalide: {value!r}")
+
+@lru_cache(maxsize=COLOR_CACHE_SIZE)
+def parse_color(value):
+    """Couleur opaque -> RGB normalisé (r, g, b) en 0-255
+
+    Lève ValueError si la couleur n'est pas reconnue ou n'est pas opaque : un
+    contraste calculé sans son canal alpha serait faux. parse_color_alpha
+    renvoie l'alpha pour les appelants qui composent la couleur sur un fond.
+    """
+    rgb, alpha = parse_color_alpha(value)
+    if alpha < 1.0:
+        raise ValueError(f"Couleur non opaque: {value!r} (alpha {alpha:g})")
+    return rgb
+
+def normalize_hex(value):
+    """Forme hex canonique '#rrggbb' d'une couleur"""
+    return '#%02x%02x%02x' % parse_color(value)
+
+@lru_cache(maxsize=COLOR_CACHE_SIZE)
+def _rgb8_luminance(rgb):
+    return float(relative_luminance(np.array(rgb) / 255.0))
+
+def color_luminance(value):
+    """Luminance relative WCAG, calculée une seule fois par couleur RGB distincte"""
+    return _rgb8_luminance(parse_color(value))
+
+def color_contrast(color_a, color_b):
+    """Ratio de contraste WCAG entre deux couleurs (chaînes CSS)"""
+    return float(contrast_ratio(color_luminance(color_a), color_luminance(color_b)))
+
+def luminance_array(colors):
+    """Luminances (n,) d'une liste de couleurs, chaque valeur distincte passant par le cache"""
+    luminances = {color: color_luminance(color) for color in dict.fromkeys(colors)}
+    return np.array([luminances[color] for color in colors], dtype=float)
+
+def contrast_matrix(colors):
+    """Matrice (n, n) des ratios de contraste : [i, j] = couleur i sur couleur j"""
+    luminances = luminance_array(colors)
+    return contrast_ratio(luminances[:, None], luminances[None, :])
+
+def color_cache_info():
+    """Statistiques des caches d'analyse et de luminance"""
+    return {'parse': parse_color.cache_info()._asdict(), 'parse_alpha': parse_color_alpha.cache_info()._asdict(),
+            'luminance': _rgb8_luminance.cache_info()._asdict()}
+
+def nearest_contrast_colors(foreground_rgb, background_luminance, min_ratio):
+    """Couleur la plus proche (ΔE OKLab) de chaque avant-plan atteignant le contraste minimal
+
+    Chroma et teinte OKLCH de l'avant-plan sont conservées ; la luminosité est
+    résolue vers le clair et vers le sombre pour toutes les paires à la fois,
+    puis la solution réalisable la plus proche est retenue.
+    Renvoie (RGB (n, 3), contrastes obtenus (n,), ΔE (n,)) ; ΔE vaut inf si aucune
+    couleur de cette teinte n'atteint le contraste (le fond est alors trop médian).
+    """
+    foreground_rgb = np.asarray(foreground_rgb, dtype=float).reshape(-1, 3)
+    background_luminance = np.asarray(background_luminance, dtype=float).reshape(-1)
+    min_ratio = np.broadcast_to(np.asarray(min_ratio, dtype=float), background_luminance.shape)
+
+    lab = linear_rgb_to_oklab(srgb_to_linear(foreground_rgb))
+    lch = oklab_to_oklch(lab)
+
+    # Ligne 0 : solution plus claire que le fond, ligne 1 : plus sombre
+    lighter = np.array([[True], [False]])
+    targets = luminance_for_contrast(min_ratio, background_luminance, lighter)
+    candidates = solve_oklch_lightness(lch[:, 1], lch[:, 2], targets, lighter)
+
+    ratios = contrast_ratio(relative_luminance(candidates), background_luminance)
+    delta_e = np.linalg.norm(linear_rgb_to_oklab(srgb_to_linear(candidates)) - lab, axis=-1)
+    delta_e = np.where(ratios >= min_ratio, delta_e, np.inf)
+
+    best = np.argmin(delta_e, axis=0)
+    columns = np.arange(len(foreground_rgb))
+    return candidates[best, columns], ratios[best, columns], delta_e[best, columns]
+
+def hex_to_hsl(hex_colors):
+    return rgb_to_hsl(hex_to_rgb(hex_colors))
+
+def hsl_to_hex(hsl):
+    return rgb_to_hex(hsl_to_rgb(hsl))
+
+def hex_luminance(hex_colors):
+    return relative_luminance(hex_to_rgb(hex_colors))
+
+def hex_contrast(hex_a, hex_b):
+    """Ratio de contraste entre couleurs hex (scalaires ou tableaux compatibles)"""
+    return contrast_ratio(hex_luminance(hex_a), hex_luminance(hex_b))
+
+# ---------------------------------------------------------------------------
+# Référence scalaire (un appel par couleur), pour le benchmark
+# ---------------------------------------------------------------------------
+
+def _scalar_hex_to_hsl(hex_color):
+    hex_color = hex_color.lstrip('#')
+    r, g, b = (int(hex_color[i:i + 2], 16) / 255.0 for i in (0, 2, 4))
+    max_val, min_val = max(r, g, b), min(r, g, b)
+    diff = max_val - min_val
+    l = (max_val + min_val) / 2
+    if diff == 0:
+        return (0, 0, l)
+    s = diff / (2 - max_val - min_val) if l > 0.5 else diff / (max_val + min_val)
+    if max_val == r:
+        h = (60 * ((g - b) / diff) + 360) % 360
+    elif max_val == g:
+        h = (60 * ((b - r) / diff) + 120) % 360
+    else:
+        h = (60 * ((r - g) / diff) + 240) % 360
+    return (h, s, l)
+
+def _scalar_hsl_to_hex(hsl):
+    h, s, l = hsl
+
+    def hue_to_rgb(p, q, t):
+        t %= 1
+        if t < 1 / 6:
+            return p + (q - p) * 6 * t
+        if t < 1 / 2:
+            return q
+        if t < 2 / 3:
+            return p + (q - p) * (2 / 3 - t) * 6
+        return p
+
+    q = l * (1 + s) if l < 0.5 else l + s - l * s
+    p = 2 * l - q
+    channels = (hue_to_rgb(p, q, h / 360 + 1 / 3), hue_to_rgb(p, q, h / 360), hue_to_rgb(p, q, h / 360 - 1 / 3))
+    return '#' + ''.join(f"{round(channel * 255):02x}" for channel in channels)
+
+def _scalar_luminance(hex_color):
+    hex_color = hex_color.lstrip('#')
+    channels = [int(hex_color[i:i + 2], 16) / 255.0 for i in (0, 2, 4)]
+    linear = [c / 12.92 if c <= SRGB_LINEAR_THRESHOLD else ((c + 0.055) / 1.055) ** 2.4 for c in channels]
+    return 0.2126 * linear[0] + 0.7152 * linear[1] + 0.0722 * linear[2]
+
+def benchmark(count=100000, seed=0):
+    """Temps du chemin scalaire et du chemin vectorisé sur les mêmes couleurs"""
+    rng = np.random.default_rng(seed)
+    colors = list(rgb_to_hex(rng.random((count, 3))))
+
+    start = time.perf_counter()
+    scalar_hsl = [_scalar_hex_to_hsl(color) for color in colors]
+    scalar_hex = [_scalar_hsl_to_hex(hsl) for hsl in scalar_hsl]
+    scalar_lum = [_scalar_luminance(color) for color in colors]
+    scalar_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hsl = hex_to_hsl(colors)
+    vector_hex = hsl_to_hex(hsl)
+    vector_lum = hex_luminance(colors)
+    vector_seconds = time.perf_counter() - start
+
+    return {
+        'colors': count,
+        'scalar_seconds': scalar_seconds,
+        'vector_seconds': vector_seconds,
+        'speedup': scalar_seconds / vector_seconds if vector_seconds > 0 else float('inf'),
+        'max_hsl_error': float(np.abs(hsl - np.array(scalar_hsl)).max()),
+        'max_luminance_error': float(np.abs(vector_lum - np.array(scalar_lum)).max()),
+        'hex_mismatches': int(np.sum(vector_hex != np.array(scalar_hex)))
+    }
+
+def main():
+    """Point d'entrée principal"""
+    parser = argparse.ArgumentParser(description="Moteur de couleurs vectorisé")
+    parser.add_argument('--benchmark', type=int, default=100000, metavar='N',
+                        help='Nombre de couleurs aléatoires comparées (scalaire vs vectorisé)')
+
+    args = parser.parse_args()
+
+    results = benchmark(args.benchmark)
+    print(f"Benchmark sur {results['colors']} couleurs (hex -> HSL -> hex + luminance)")
+    print(f"  Scalaire:   {results['scalar_seconds'] * 1000:.1f} ms")
+    print(f"  Vectorisé:  {results['vector_seconds'] * 1000:.1f} ms (x{results['speedup']:.1f})")
+    print(f"  Écart max HSL: {results['max_hsl_error']:.2e}, luminance: {results['max_luminance_error']:.2e}, "
+          f"hex différents: {results['hex_mismatches']}")
+
+if __name__ == "__main__":
+    main()
@@ -6,248 +6,268 @@ Usage: python color_generator.py --primary "#2E5B91" --mood "professional"
 Génère des palettes complètes avec harmonie et accessibilité
 """
 
+import os
+import re
 import sys
+import csv
 import json
+import time
+import tarfile
+import zipfile
 import argparse
+from io import BytesIO
+from functools import partial
 from pathlib import Path
 
-class ColorSystem:
-    def __init__(self, primary_color, mood="neutral"):
-        self.primary = primary_color
-        self.mood = mood
-        self.palette = self.generate_palette()
+import numpy as np
 
-    def generate_palette(self):
-        """Génère une palette complète basée sur la couleur primaire"""
-        palette = {
-            'primary': self._expand_primary(),
-            'secondary': self._generate_secondary(),
-            'neutrals': self._generate_neutrals(),
-            'accents': self._generate_accents(),
-            'semantic': self._generate_semantic()
-        }
-        return palette
+from color_engine import (hex_to_hsl, hsl_to_hex, hex_to_rgb, rgb_to_hex, rgb_to_oklch, contrast_ratio,
+                          luminance_array, luminance_for_contrast, solve_oklch_lightness)
+from parallel import error_message, iter_pool_results
 
-    def _expand_primary(self):
-        """Développe la couleur primaire en variations"""
-        base_hue = self._hex_to_hsl(self.primary)
-
-        variations = {}
-        if self.mood in ['vibrant', 'energetic']:
-            variations['50'] = self._adjust_lightness(base_hue, 0.95)
-            variations['100'] = self._adjust_lightness(base_hue, 0.85)
-            variations['200'] = self._adjust_lightness(base_hue, 0.70)
-            variations['300'] = self._adjust_lightness(base_hue, 0.55)
-            variations['400'] = self._adjust_lightness(base_hue, 0.45)
-            variations['500'] = self.primary  # Base
-            variations['600'] = self._adjust_lightness(base_hue, 0.35)
-            variations['700'] = self._adjust_lightness(base_hue, 0.25)
-            variations['800'] = self._adjust_lightness(base_hue, 0.15)
-            variations['900'] = self._adjust_lightness(base_hue, 0.05)
-        else:
-            # Approche plus conservatrice
-            variations['50'] = self._adjust_lightness(base_hue, 0.98)
-            variations['100'] = self._adjust_lightness(base_hue, 0.90)
-            variations['200'] = self._adjust_lightness(base_hue, 0.75)
-            variations['300'] = self._adjust_lightness(base_hue, 0.60)
-            variations['400'] = self._adjust_lightness(base_hue, 0.50)
-            variations['500'] = self.primary
-            variations['600'] = self._adjust_lightness(base_hue, 0.40)
-            variations['700'] = self._adjust_lightness(base_hue, 0.30)
-            variations['800'] = self._adjust_lightness(base_hue, 0.20)
-            variations['900'] = self._adjust_lightness(base_hue, 0.10)
-
-        return variations
+PRIMARY_SHADES = ['50', '100', '200', '300', '400', '500', '600', '700', '800', '900']
 
-    def _generate_secondary(self):
-        """Génère des couleurs secondaires harmonieuses"""
-        base_hsl = self._hex_to_hsl(self.primary)
+# Luminosité HSL de chaque nuance (la nuance 500 reste la couleur primaire exacte)
+PRIMARY_LIGHTNESS = {
+    'vibrant': [0.95, 0.85, 0.70, 0.55, 0.45, None, 0.35, 0.25, 0.15, 0.05],
+    'conservative': [0.98, 0.90, 0.75, 0.60, 0.50, None, 0.40, 0.30, 0.20, 0.10]
+}
+
+# Échelle OKLCH : contraste minimal par nuance, contre le noir (nuances claires) ou
+# le blanc (nuances sombres) ; 600 est lisible en texte AA sur blanc, 700 en AAA
+PRIMARY_CONTRAST_TARGETS = {
+    'vibrant': [('black', 19.0), ('black', 16.0), ('black', 12.0), ('black', 8.5), ('black', 6.0), None,
+                ('white', 4.5), ('white', 7.0), ('white', 11.0), ('white', 16.0)],
+    'conservative': [('black', 19.5), ('black', 17.0), ('black', 13.5), ('black', 10.0), ('black', 7.0), None,
+                     ('white', 4.5), ('white', 7.0), ('white', 10.0), ('white', 14.0)]
+}
+
+# Position de chaque nuance entre la primaire (0) et le blanc ou le noir (1), en
+# contraste logarithmique : l'échelle reste monotone autour de la primaire
+PRIMARY_ANCHOR_POSITIONS = [0.95, 0.85, 0.70, 0.50, 0.25, None, 0.25, 0.50, 0.70, 0.85]
+
+SCALES = ['hsl', 'oklch']
 
-        # Calcul de couleurs complémentaires/analogues
-        secondary_colors = {}
+MOODS = ['neutral', 'professional', 'creative', 'energetic', 'warm', 'cool']
 
+class PaletteBatch:
+    """Palettes de plusieurs couleurs primaires d'une même ambiance, calculées en tableaux"""
+
+    def __init__(self, primaries, mood="neutral", scale="hsl"):
+        self.primaries = list(primaries)
+        self.mood = mood
+        self.scale = scale
+        self.primary_hsl = hex_to_hsl(self.primaries).reshape(-1, 3)
+
+    def generate_palettes(self):
+        """Une palette par couleur primaire, dans l'ordre d'entrée"""
+        primary = self._expand_primary()
+        secondary = self._generate_secondary()
+        neutrals = self._generate_neutrals()
+        accents = self._generate_accents()
+        # Les couleurs sémantiques s'appuient sur l'échelle de neutres (commune à l'ambiance)
+        semantic = self._generate_semantic(neutrals)
+
+        return [{
+            'primary': dict(zip(PRIMARY_SHADES, primary[index])),
+            'secondary': dict(zip(secondary[0], secondary[1][index])),
+            'neutrals': dict(neutrals),
+            'accents': dict(zip(accents[0], accents[1][index])),
+            'semantic': dict(semantic)
+        } for index in range(len(self.primaries))]
+
+    def _expand_primary(self):
+        """Développe chaque couleur primaire en variations : tableau (n, 10) de hex"""
+        style = 'vibrant' if self.mood in ['vibrant', 'energetic'] else 'conservative'
+        if self.scale == 'oklch':
+            return self._expand_primary_oklch(PRIMARY_CONTRAST_TARGETS[style])
+
+        # Approche plus conservatrice hors ambiances vibrantes
+        lightness = PRIMARY_LIGHTNESS[style]
+
+        # Toutes les nuances de toutes les marques converties en une passe
+        hsl = np.repeat(self.primary_hsl[:, None, :], len(PRIMARY_SHADES), axis=1)
+        for column, value in enumerate(lightness):
+            if value is not None:
+                hsl[:, column, 2] = value
+        shades = hsl_to_hex(hsl).tolist()
+
+        base_column = PRIMARY_SHADES.index('500')
+        for row, primary in zip(shades, self.primaries):
+            row[base_column] = primary  # Base
+        return shades
+
+    def _expand_primary_oklch(self, targets):
+        """Nuances de chroma et teinte OKLCH de la primaire, à contraste WCAG garanti
+
+        Le contraste visé par chaque nuance est le plus grand entre son minimum
+        fixe et sa position entre la primaire et le blanc ou le noir : les
+        nuances claires restent plus claires que la primaire, les sombres plus
+        sombres. Toutes les nuances de toutes les marques en une seule recherche.
+        """
+        columns = [column for column, target in enumerate(targets) if target is not None]
+        lighter = np.array([targets[column][0] == 'black' for column in columns])
+        ratios = np.array([targets[column][1] for column in columns])
+        positions = np.array([PRIMARY_ANCHOR_POSITIONS[column] for column in columns])
+        # Noir : luminance 0, blanc : luminance 1
+        references = np.where(lighter, 0.0, 1.0)
+
+        brand_luminance = luminance_array(self.primaries)[:, None]
+        brand_ratio = contrast_ratio(brand_luminance, references)
+        anchored = brand_ratio ** (1 - positions) * 21.0 ** positions
+        target_luminance = luminance_for_contrast(np.maximum(ratios, anchored), references, lighter)
+
+        lch = rgb_to_oklch(hex_to_rgb(self.primaries)).reshape(-1, 3)
+        rgb = solve_oklch_lightness(lch[:, 1:2], lch[:, 2:3], target_luminance, lighter)
+
+        shades = np.empty((len(self.primaries), len(targets)), dtype='U7')
+        shades[:, columns] = rgb_to_hex(rgb)
+        shades = shades.tolist()
+
+        base_column = PRIMARY_SHADES.index('500')
+        for row, primary in zip(shades, self.primaries):
+            row[base_column] = primary  # Base
+
+        broken = [self.primaries[row] for row in np.flatnonzero(~scales_monotonic(shades))]
+        if broken:
+            raise ValueError(f"Échelle OKLCH non monotone pour: {', '.join(broken[:5])}")
+        return shades
+
+    def _generate_secondary(self):
+        """Génère des couleurs secondaires harmonieuses : (noms, tableau (n, k) de hex)"""
+        # Calcul de couleurs complémentaires/analogues : (nom, teinte, saturation imposée)
         if self.mood == 'professional':
             # Palette business
-            secondary_colors['blue'] = self._adjust_hue(base_hsl, 220)
-            secondary_colors['gray'] = self._adjust_hue(base_hsl, 0, saturation=0.1)
+            specs = [('blue', 220, None), ('gray', 0, 0.1)]
         elif self.mood == 'creative':
             # Palette créative
-            secondary_colors['purple'] = self._adjust_hue(base_hsl, 270)
-            secondary_colors['teal'] = self._adjust_hue(base_hsl, 180)
+            specs = [('purple', 270, None), ('teal', 180, None)]
         elif self.mood == 'energetic':
             # Palette dynamique
-            secondary_colors['orange'] = self._adjust_hue(base_hsl, 30)
-            secondary_colors['lime'] = self._adjust_hue(base_hsl, 90)
+            specs = [('orange', 30, None), ('lime', 90, None)]
+        else:
+            specs = []
 
-        return secondary_colors
+        return self._hue_variants(specs)
 
     def _generate_neutrals(self):
-        """Génère une échelle de gris harmonieuse"""
-        neutrals = {}
-
-        # Grayscale avec teinte subtile basée sur la primaire
-        for i in range(50, 1000, 50):
-            lightness = 1 - (i - 50) / 950  # 1.0 à 0.05
-
-            if self.mood == 'warm':
-                neutral_hsl = (40, 0.05, lightness)  # Teinte chaude
-            elif self.mood == 'cool':
-                neutral_hsl = (220, 0.05, lightness)  # Teinte froide
-            else:
-                neutral_hsl = (0, 0, lightness)  # Neutre pur
-
-            neutrals[str(i)] = self._hsl_to_hex(neutral_hsl)
+        """Génère une échelle de gris harmonieuse (identique pour toute l'ambiance)"""
+        shades = np.arange(50, 1000, 50)
+        lightness = 1 - (shades - 50) / 950  # 1.0 à 0.05
+
+        # Grayscale avec teinte subtile basée sur l'ambiance
+        if self.mood == 'warm':
+            hue, saturation = 40, 0.05  # Teinte chaude
+        elif self.mood == 'cool':
+            hue, saturation = 220, 0.05  # Teinte froide
+        else:
+            hue, saturation = 0, 0  # Neutre pur
 
-        return neutrals
+        hsl = np.column_stack([np.full(len(shades), hue), np.full(len(shades), saturation), lightness])
+        return dict(zip((str(shade) for shade in shades), hsl_to_hex(hsl).tolist()))
 
     def _generate_accents(self):
-        """Génère des couleurs d'accent pour les CTAs"""
-        base_hsl = self._hex_to_hsl(self.primary)
-
-        accents = {}
-
-        # Couleurs d'accent basées sur la complémentaire
-        complement_hue = (base_hsl[0] + 180) % 360
-
+        """Génère des couleurs d'accent pour les CTAs : (noms, tableau (n, 3) de hex)"""
+        names = ['success', 'warning', 'error']
         if self.mood == 'professional':
-            accents['success'] = self._hsl_to_hex((120, 0.7, 0.5))  # Vert
-            accents['warning'] = self._hsl_to_hex((45, 0.8, 0.6))   # Orange
-            accents['error'] = self._hsl_to_hex((0, 0.8, 0.6))     # Rouge
-        else:
-            accents['success'] = self._adjust_hue(base_hsl, 120, saturation=0.8)
-            accents['warning'] = self._adjust_hue(base_hsl, 60, saturation=0.8)
-            accents['error'] = self._adjust_hue(base_hsl, 0, saturation=0.8)
+            hsl = np.array([(120, 0.7, 0.5),   # Vert
+                            (45, 0.8, 0.6),    # Orange
+                            (0, 0.8, 0.6)])    # Rouge
+            return names, [hsl_to_hex(hsl).tolist()] * len(self.primaries)
 
-        return accents
+        return self._hue_variants([('success', 120, 0.8), ('warning', 60, 0.8), ('error', 0, 0.8)])
 
-    def _generate_semantic(self):
+    def _generate_semantic(self, neutrals):
         """Génère des couleurs sémantiques pour interfaces"""
         semantic = {}
 
-        semantic['background'] = self.palette['neutrals']['50']
-        semantic['surface'] = self.palette['neutrals']['100']
-        semantic['text-primary'] = self.palette['neutrals']['900']
-        semantic['text-secondary'] = self.palette['neutrals']['600']
-        semantic['text-disabled'] = self.palette['neutrals']['400']
+        semantic['background'] = neutrals['50']
+        semantic['surface'] = neutrals['100']
+        semantic['text-primary'] = neutrals['900']
+        semantic['text-secondary'] = neutrals['600']
+        semantic['text-disabled'] = neutrals['400']
 
-        semantic['border'] = self.palette['neutrals']['200']
-        semantic['divider'] = self.palette['neutrals']['100']
+        semantic['border'] = neutrals['200']
+        semantic['divider'] = neutrals['100']
 
         return semantic
 
-    def _hex_to_hsl(self, hex_color):
-        """Convertit hex en HSL"""
-        hex_color = hex_color.lstrip('#')
-        r = int(hex_color[0:2], 16) / 255.0
-        g = int(hex_color[2:4], 16) / 255.0
-        b = int(hex_color[4:6], 16) / 255.0
-
-        max_val = max(r, g, b)
-        min_val = min(r, g, b)
-        diff = max_val - min_val
-
-        # Lightness
-        l = (max_val + min_val) / 2
-
-        if diff == 0:
-            # Achromatic (gray)
-            h = s = 0
-        else:
-            # Saturation
-            s = diff / (2 - max_val - min_val) if l > 0.5 else diff / (max_val + min_val)
-
-            # Hue
-            if max_val == r:
-                h = (60 * ((g - b) / diff) + 360) % 360
-            elif max_val == g:
-                h = (60 * ((b - r) / diff) + 120) % 360
-            else:
-                h = (60 * ((r - g) / diff) + 240) % 360
-
-        return (h, s, l)
-
-    def _hsl_to_hex(self, hsl):
-        """Convertit HSL en hex"""
-        h, s, l = hsl
-
-        if s == 0:
-            # Achromatic (gray)
-            r = g = b = int(l * 255)
-        else:
-            def hue_to_rgb(p, q, t):
-                if t < 0: t += 1
-                if t > 1: t -= 1
-                if t < 1/6: return p + (q - p) * 6 * t
-                if t < 1/2: return q
-                if t < 2/3: return p + (q - p) * (2/3 - t) * 6
-                return p
-
-            q = l * (1 + s) if l < 0.5 else l + s - l * s
-            p = 2 * l - q
-
-            r = hue_to_rgb(p, q, h / 360 + 1/3)
-            g = hue_to_rgb(p, q, h / 360)
-            b = hue_to_rgb(p, q, h / 360 - 1/3)
-
-        return f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
-
-    def _adjust_lightness(self, hsl, target_lightness):
-        """Ajuste la luminosité d'une couleur HSL"""
-        h, s, l = hsl
-        return (h, s, target_lightness)
-
-    def _adjust_hue(self, hsl, new_hue, saturation=None):
-        """Ajuste la teinte d'une couleur HSL"""
-        h, s, l = hsl
-        new_s = saturation if saturation is not None else s
-        return (new_hue, new_s, l)
-
-    def check_accessibility(self):
-        """Vérifie les ratios de contraste pour l'accessibilité"""
-        contrasts = {}
-
+    def _hue_variants(self, specs):
+        """Variantes de teinte des primaires (luminosité conservée), converties ensemble"""
+        names = [name for name, _, _ in specs]
+        if not specs:
+            return names, [[] for _ in self.primaries]
+        hsl = np.repeat(self.primary_hsl[:, None, :], len(specs), axis=1)
+        hsl[:, :, 0] = [hue for _, hue, _ in specs]
+        for column, (_, _, saturation) in enumerate(specs):
+            if saturation is not None:
+                hsl[:, column, 1] = saturation
+        return names, hsl_to_hex(hsl).tolist()
+
+def scales_monotonic(shades):
+    """Vrai pour chaque échelle (ligne de nuances 50 à 900) dont la luminance ne croît jamais
+
+    Seules la primaire noire ou blanche peuvent produire des nuances égales.
+    """
+    shades = np.asarray(shades)
+    if not shades.size:
+        return np.ones(len(shades), dtype=bool)
+    luminance = luminance_array(shades.ravel().tolist()).reshape(shades.shape)
+    return np.all(np.diff(luminance, axis=1) <= 0, axis=1)
+
+def check_palettes_accessibility(palettes):
+    """Ratios de contraste de chaque palette, toutes paires de toutes palettes en une passe"""
+    labels = []
+    foregrounds = []
+    backgrounds = []
+    for palette in palettes:
         # Test des combinaisons texte/fond principales
-        text_primary = self.palette['semantic']['text-primary']
-        background = self.palette['semantic']['background']
-        contrasts['primary_text'] = self._contrast_ratio(text_primary, background)
-
-        text_secondary = self.palette['semantic']['text-secondary']
-        contrasts['secondary_text'] = self._contrast_ratio(text_secondary, background)
+        background = palette['semantic']['background']
+        pairs = {
+            'primary_text': (palette['semantic']['text-primary'], background),
+            'secondary_text': (palette['semantic']['text-secondary'], background)
+        }
 
         # Test des couleurs d'accent
-        for accent_name, accent_color in self.palette['accents'].items():
-            contrasts[f'{accent_name}_on_white'] = self._contrast_ratio(accent_color, '#ffffff')
-            contrasts[f'{accent_name}_on_dark'] = self._contrast_ratio(accent_color, '#000000')
-
-        return contrasts
-
-    def _contrast_ratio(self, color1, color2):
-        """Calcule le ratio de contraste entre deux couleurs"""
-        def luminance(color):
-            # Conversion hex vers RGB
-            color = color.lstrip('#')
-            r = int(color[0:2], 16) / 255.0
-            g = int(color[2:4], 16) / 255.0
-            b = int(color[4:6], 16) / 255.0
+        for accent_name, accent_color in palette['accents'].items():
+            pairs[f'{accent_name}_on_white'] = (accent_color, '#ffffff')
+            pairs[f'{accent_name}_on_dark'] = (accent_color, '#000000')
+
+        labels.append(list(pairs))
+        for foreground, background_color in pairs.values():
+            foregrounds.append(foreground)
+            backgrounds.append(background_color)
+
+    # Fonds et neutres se répètent d'une palette à l'autre : luminances mémorisées
+    ratios = contrast_ratio(luminance_array(foregrounds), luminance_array(backgrounds)).tolist()
+    results = []
+    position = 0
+    for names in labels:
+        results.append(dict(zip(names, ratios[position:position + len(names)])))
+        position += len(names)
+    return results
 
-            # Conversion RGB vers linear RGB
-            def linearize(x):
-                return x / 12.92 if x <= 0.03928 else ((x + 0.055) / 1.055) ** 2.4
-
-            r = linearize(r)
-            g = linearize(g)
-            b = linearize(b)
-
-            # Calcul de la luminance
-            return 0.2126 * r + 0.7152 * g + 0.0722 * b
+class ColorSystem:
+    def __init__(self, primary_color, mood="neutral", palette=None, scale="hsl"):
+        self.primary = primary_color
+        self.mood = mood
+        self.scale = scale
+        self.palette = palette if palette is not None else self.generate_palette()
 
-        l1 = luminance(color1)
-        l2 = luminance(color2)
+    @classmethod
+    def batch(cls, primaries, mood="neutral", scale="hsl"):
+        """Systèmes de couleurs de plusieurs marques d'une même ambiance, calculés ensemble"""
+        primaries = list(primaries)
+        palettes = PaletteBatch(primaries, mood, scale).generate_palettes()
+        return [cls(primary, mood, palette, scale) for primary, palette in zip(primaries, palettes)]
 
-        lighter = max(l1, l2)
-        darker = min(l1, l2)
+    def generate_palette(self):
+        """Génère une palette complète basée sur la couleur primaire"""
+        return PaletteBatch([self.primary], self.mood, self.scale).generate_palettes()[0]
 
-        return (lighter + 0.05) / (darker + 0.05)
+    def check_accessibility(self):
+        """Vérifie les ratios de contraste pour l'accessibilité"""
+        return check_palettes_accessibility([self.palette])[0]
 
 def generate_css_variables(palette):
     """Génère des variables CSS pour la palette"""
@@ -296,28 +316,290 @@ def generate_scss_mixin(palette):
 
     return scss
 
+def render_color_system(color_system, contrasts, formats):
+    """Contenu des fichiers de sortie {extension: texte} d'un système de couleurs"""
+    outputs = {}
+
+    if 'json' in formats:
+        # Export JSON
+        output_data = {
+            'primary_color': color_system.primary,
+            'mood': color_system.mood,
+            'palette': color_system.palette,
+            'accessibility': {
+                'contrast_ratios': contrasts,
+                'wcag_compliance': {
+                    'AA': all(ratio >= 4.5 for ratio in contrasts.values()),
+                    'AAA': all(ratio >= 7.0 for ratio in contrasts.values())
+                }
+            }
+        }
+        outputs['json'] = json.dumps(output_data, indent=2, ensure_ascii=False)
+
+    if 'css' in formats:
+        # Export CSS
+        outputs['css'] = generate_css_variables(color_system.palette)
+
+    if 'scss' in formats:
+        # Export SCSS
+        outputs['scss'] = generate_scss_mixin(color_system.palette)
+
+    return outputs
+
+def _output_formats(format_name):
+    return ['json', 'css', 'scss'] if format_name == 'all' else [format_name]
+
+# ---------------------------------------------------------------------------
+# Mode lot : une palette par marque (tenant) en un seul processus
+# ---------------------------------------------------------------------------
+
+BATCH_CHUNK_SIZE = 1024
+PROGRESS_INTERVAL = 1.0
+HEX_COLOR = re.compile(r'^#[0-9a-fA-F]{6}$')
+TENANT_UNSAFE = re.compile(r'[^\w.-]+')
+JSON_LINES_SUFFIXES = ('.jsonl', '.ndjson')
+
+def iter_tenant_rows(batch_file):
+    """(ligne, tenant, primaire, ambiance) depuis un CSV à en-tête ou un fichier JSON Lines
+
+    Un tableau JSON (.json) est refusé : il faudrait le charger en entier, alors
+    que le lot est lu ligne à ligne. Lève ValueError.
+    """
+    path = Path(batch_file)
+    if path.suffix.lower() == '.json':
+        raise ValueError(f"{path}: tableau JSON non pris en charge, une marque par ligne en JSON Lines "
+                         f"({', '.join(JSON_LINES_SUFFIXES)})")
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.suffix.lower() in JSON_LINES_SUFFIXES:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError as e:
+                    yield line_number, None, None, None, f"JSON invalide: {e}"
+                    continue
+                if not isinstance(row, dict):
+                    yield line_number, None, None, None, f"objet JSON attendu, {type(row).__name__} trouvé"
+                    continue
+                yield line_number, row.get('tenant'), row.get('primary'), row.get('mood') or 'neutral', None
+        else:
+            # Ligne 1 = en-tête : tenant,primary,mood
+            for line_number, row in enumerate(csv.DictReader(f), 2):
+                yield line_number, row.get('tenant'), row.get('primary'), row.get('mood') or 'neutral', None
+
+def _validate_row(tenant, primary, mood):
+    if not tenant or not str(tenant).strip():
+        return "tenant manquant"
+    if not primary or not HEX_COLOR.match(str(primary).strip()):
+        return f"couleur primaire invalide: {primary!r} (attendu #RRGGBB)"
+    if mood not in MOODS:
+        return f"ambiance inconnue: {mood!r} ({', '.join(MOODS)})"
+    return None
+
+def generate_tenant_chunk(rows, formats, scale='hsl'):
+    """Rendu d'un bloc de lignes : palettes d'une même ambiance calculées ensemble
+
+    Renvoie [(ligne, tenant, {extension: texte} ou None, erreur ou None)] dans l'ordre d'entrée.
+    """
+    results = [None] * len(rows)
+    by_mood = {}
+
+    for position, (line_number, tenant, primary, mood, error) in enumerate(rows):
+        error = error or _validate_row(tenant, primary, mood)
+        if error:
+            results[position] = (line_number, tenant, None, error)
+        else:
+            by_mood.setdefault(mood, []).append((position, str(tenant).strip(), primary.strip()))
+
+    for mood, entries in by_mood.items():
+        try:
+            systems = ColorSystem.batch([primary for _, _, primary in entries], mood, scale)
+        except ValueError:
+            # Une primaire sans échelle valide : rendu ligne par ligne pour isoler l'erreur
+            systems, kept = [], []
+            for entry in entries:
+                try:
+                    systems.extend(ColorSystem.batch([entry[2]], mood, scale))
+                except ValueError as e:
+                    results[entry[0]] = (rows[entry[0]][0], entry[1], None, str(e))
+                    continue
+                kept.append(entry)
+            entries = kept
+        if not entries:
+            continue
+        contrasts = check_palettes_accessibility([system.palette for system in systems])
+        for (position, tenant, _), system, system_contrasts in zip(entries, systems, contrasts):
+            results[position] = (rows[position][0], tenant, render_color_system(system, system_contrasts, formats), None)
+
+    return results
+
+def _iter_chunks(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _chunk_errors(chunk, error):
+    """Une erreur par ligne d'un bloc dont le rendu a échoué"""
+    return [(line_number, tenant, None, error_message(error)) for line_number, tenant, _, _, _ in chunk]
+
+def _generate_chunk_safely(chunk, formats, scale):
+    try:
+        return generate_tenant_chunk(chunk, formats, scale)
+    except Exception as e:
+        return _chunk_errors(chunk, e)
+
+def iter_batch_results(rows, formats, jobs=1, chunk_size=BATCH_CHUNK_SIZE, scale='hsl'):
+    """Résultats dans l'ordre du fichier ; en parallèle, au plus jobs * 2 blocs en mémoire
+
+    Un bloc qui échoue (ValueError d'une échelle, processus mort...) donne une
+    erreur par ligne au lieu d'interrompre le lot.
+    """
+    worker = partial(_generate_chunk_safely, formats=formats, scale=scale)
+    for results in iter_pool_results(worker, _iter_chunks(rows, chunk_size), jobs, _chunk_errors):
+        yield from results
+
+class DirectoryWriter:
+    """Écrit <dossier>/<tenant>.<extension>"""
+
+    def __init__(self, output):
+        self.output = Path(output)
+        self.output.mkdir(parents=True, exist_ok=True)
+
+    def write(self, name, data):
+        with open(self.output / name, 'wb') as f:
+            f.write(data)
+
+    def close(self):
+        pass
+
+class ArchiveWriter:
+    """Écrit les fichiers au fil de l'eau dans une archive .zip, .tar ou .tar.gz"""
+
+    def __init__(self, output):
+        self.output = Path(output)
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        name = self.output.name.lower()
+        if name.endswith('.zip'):
+            self._zip = zipfile.ZipFile(self.output, 'w', compression=zipfile.ZIP_DEFLATED)
+            self._tar = None
+        else:
+            mode = 'w:gz' if name.endswith(('.tar.gz', '.tgz')) else 'w'
+            self._tar = tarfile.open(self.output, mode)
+            self._zip = None
+
+    def write(self, name, data):
+        if self._zip is not None:
+            self._zip.writestr(name, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            self._tar.addfile(info, BytesIO(data))
+
+    def close(self):
+        (self._zip or self._tar).close()
+
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz')
+
+def open_batch_writer(output):
+    if str(output).lower().endswith(ARCHIVE_SUFFIXES):
+        return ArchiveWriter(output)
+    return DirectoryWriter(output)
+
+def run_batch(batch_file, output, formats, jobs=1, scale='hsl', max_errors_shown=20):
+    """Génère tous les systèmes de couleurs d'un fichier de marques ; renvoie les statistiques"""
+    writer = open_batch_writer(output)
+    stats = {'generated': 0, 'errors': 0, 'bytes': 0}
+    seen = set()
+    start = last_report = time.perf_counter()
+
+    try:
+        results = iter_batch_results(iter_tenant_rows(batch_file), formats, jobs, scale=scale)
+        for line_number, tenant, outputs, error in results:
+            if error is None:
+                safe_name = TENANT_UNSAFE.sub('_', tenant)
+                if safe_name in seen:
+                    error = f"tenant en double: {tenant}"
+                seen.add(safe_name)
+
+            if error is not None:
+                stats['errors'] += 1
+                if stats['errors'] <= max_errors_shown:
+                    print(f"  ✗ ligne {line_number} ({tenant or '?'}): {error}")
+                continue
+
+            for extension, content in outputs.items():
+                data = content.encode('utf-8')
+                writer.write(f"{safe_name}.{extension}", data)
+                stats['bytes'] += len(data)
+            stats['generated'] += 1
+
+            now = time.perf_counter()
+            if now - last_report >= PROGRESS_INTERVAL:
+                last_report = now
+                print(f"  {stats['generated']} palettes ({stats['generated'] / (now - start):.0f}/s)")
+    finally:
+        writer.close()
+
+    stats['seconds'] = time.perf_counter() - start
+    return stats
+
 def main():
     """Point d'entrée principal"""
     parser = argparse.ArgumentParser(description="Générateur de système de couleurs")
-    parser.add_argument('--primary', '-p', required=True, help='Couleur primaire (hex)')
+    parser.add_argument('--primary', '-p', help='Couleur primaire (hex)')
     parser.add_argument('--mood', '-m', default='neutral',
-                       choices=['neutral', 'professional', 'creative', 'energetic', 'warm', 'cool'],
+                       choices=MOODS,
                        help='Ambiance de la palette')
     parser.add_argument('--output', '-o', default='color_system',
                        help='Nom de base pour les fichiers de sortie')
     parser.add_argument('--format', '-f', default='all',
                        choices=['json', 'css', 'scss', 'all'],
                        help='Format de sortie')
+    parser.add_argument('--scale', choices=SCALES, default='hsl',
+                       help="Échelle primaire : luminosités HSL fixes, ou OKLCH à contraste WCAG ciblé")
+    parser.add_argument('--batch', '-b', metavar='FICHIER',
+                       help='CSV (tenant,primary,mood) ou JSON Lines : une palette par marque ; '
+                            '--output est alors un dossier ou une archive .zip/.tar.gz')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Processus pour le mode lot (0 = tous les cœurs)')
 
     args = parser.parse_args()
 
+    if args.batch:
+        output = args.output if args.output != 'color_system' else 'color_systems'
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        print(f"Génération en lot depuis {args.batch} vers {output}")
+        try:
+            stats = run_batch(args.batch, output, _output_formats(args.format), jobs, args.scale)
+        except (OSError, ValueError) as e:
+            print(f"Erreur: {e}")
+            sys.exit(1)
+
+        rate = stats['generated'] / stats['seconds'] if stats['seconds'] > 0 else 0
+        print(f"\n🎨 {stats['generated']} systèmes de couleurs en {stats['seconds']:.2f}s ({rate:.0f}/s, {jobs} processus)")
+        print(f"📁 {stats['bytes']} octets écrits dans {output}")
+        if stats['errors']:
+            print(f"⚠️  {stats['errors']} ligne(s) ignorée(s)")
+            sys.exit(1)
+        return
+
+    if not args.primary:
+        parser.error("--primary est requis hors mode --batch")
+
     # Validation de la couleur hex
-    if not (args.primary.startswith('#') and len(args.primary) == 7):
+    if not HEX_COLOR.match(args.primary):
         print("Erreur: La couleur primaire doit être au format hex (#RRGGBB)")
         sys.exit(1)
 
     # Génération du système
-    color_system = ColorSystem(args.primary, args.mood)
+    color_system = ColorSystem(args.primary, args.mood, scale=args.scale)
 
     # Vérification accessibilité
     contrasts = color_system.check_accessibility()
@@ -325,51 +607,21 @@ def main():
     # Génération des fichiers de sortie
     base_name = args.output
 
-    if args.format in ['json', 'all']:
-        # Export JSON
-        output_data = {
-            'primary_color': args.primary,
-            'mood': args.mood,
-            'palette': color_system.palette,
-            'accessibility': {
-                'contrast_ratios': contrasts,
-                'wcag_compliance': {
-                    'AA': all(ratio >= 4.5 for ratio in contrasts.values()),
-                    'AAA': all(ratio >= 7.0 for ratio in contrasts.values())
-                }
-            }
-        }
-
-        with open(f'{base_name}.json', 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
-
-    if args.format in ['css', 'all']:
-        # Export CSS
-        css_content = generate_css_variables(color_system.palette)
-
-        with open(f'{base_name}.css', 'w', encoding='utf-8') as f:
-            f.write(css_content)
-
-    if args.format in ['scss', 'all']:
-        # Export SCSS
-        scss_content = generate_scss_mixin(color_system.palette)
-
-        with open(f'{base_name}.scss', 'w', encoding='utf-8') as f:
-            f.write(scss_content)
+    for extension, content in render_color_system(color_system, contrasts, _output_formats(args.format)).items():
+        with open(f'{base_name}.{extension}', 'w', encoding='utf-8') as f:
+            f.write(content)
 
     # Rapport console
     print(f"\n🎨 Système de couleurs généré pour {args.mood}")
     print(f"📁 Fichiers créés: {base_name}.*")
-    print("
-Couleur primaire:"    print(f"  {args.primary}")
+    print("\nCouleur primaire:")
+    print(f"  {args.primary}")
 
-    print("
-Palette générée:")
+    print("\nPalette générée:")
     for shade, color in color_system.palette['primary'].items():
         print(f"  Primary {shade}: {color}")
 
-    print("
-Accessibilité:")
+    print("\nAccessibilité:")
     for test, ratio in contrasts.items():
         status = "✅" if ratio >= 4.5 else "❌"
         print(f"  {status} {test}: {ratio:.2f}")
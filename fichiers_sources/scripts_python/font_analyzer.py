@@ -1,77 +1,194 @@
 #!/usr/bin/env python3
 """
 Analyseur de polices avec FontTools
-Usage: python font_analyzer.py font.otf
+Usage: python font_analyzer.py font.otf [--fields metrics,character_set]
+       python font_analyzer.py catalog fonts/ "autres/**/*.ttf" [--jobs N] [--output catalog.jsonl]
+       python font_analyzer.py index fonts.db fonts/ [--jobs N]
+       python font_analyzer.py query fonts.db --script Cyrillic --feature liga --feature kern
 
 Génère un rapport complet sur les métriques et caractéristiques d'une police
 """
 
+import os
 import sys
+import glob
 import json
+import sqlite3
+import hashlib
+import time
+import argparse
+import weakref
+from bisect import bisect_left, bisect_right
 from fontTools.ttLib import TTFont
+from fontTools.unicodedata import Blocks, Scripts
+from functools import partial
 from pathlib import Path
 
-def analyze_font(font_path):
-    """Analyse complète d'une police"""
-    font = TTFont(font_path)
-
-    # Métriques de base
-    metrics = {
-        'font_name': get_font_name(font),
-        'units_per_em': font['head'].unitsPerEm,
-        'ascender': font['hhea'].ascent,
-        'descender': font['hhea'].descent,
-        'line_gap': font['hhea'].lineGap,
-        'x_height': get_x_height(font),
-        'cap_height': get_cap_height(font),
-        'glyph_count': len(font.getGlyphNames()),
-        'character_set': get_character_set(font),
-        'openType_features': get_opentype_features(font),
-        'font_format': Path(font_path).suffix,
-        'file_size': Path(font_path).stat().st_size
-    }
+from parallel import error_message, iter_pool_results
+
+# Extraction de chaque champ du rapport : seules les tables lues par les
+# champs demandés sont décompilées (TTFont ouvert en mode lazy)
+FIELD_EXTRACTORS = {
+    'font_name': lambda font, path: get_font_name(font),
+    'style_name': lambda font, path: get_style_name(font),
+    'units_per_em': lambda font, path: font['head'].unitsPerEm,
+    'ascender': lambda font, path: font['hhea'].ascent,
+    'descender': lambda font, path: font['hhea'].descent,
+    'line_gap': lambda font, path: font['hhea'].lineGap,
+    'x_height': lambda font, path: get_x_height(font),
+    'cap_height': lambda font, path: get_cap_height(font),
+    'glyph_count': lambda font, path: font['maxp'].numGlyphs,
+    'character_set': lambda font, path: get_character_set(font),
+    'openType_features': lambda font, path: get_opentype_features(font),
+    'openType_layout': lambda font, path: get_opentype_layout(font),
+    'font_format': lambda font, path: Path(path).suffix,
+    'file_size': lambda font, path: Path(path).stat().st_size
+}
+
+# Groupes de champs utilisables avec --fields
+FIELD_GROUPS = {
+    'metrics': ['units_per_em', 'ascender', 'descender', 'line_gap', 'x_height', 'cap_height'],
+    'features': ['openType_features', 'openType_layout'],
+    'file': ['font_format', 'file_size']
+}
+
+def resolve_fields(field_spec):
+    """Convertit une liste 'metrics,character_set' en noms de champs valides"""
+    if not field_spec:
+        return list(FIELD_EXTRACTORS)
+
+    fields = []
+    for name in field_spec.split(','):
+        name = name.strip()
+        if not name:
+            continue
+        expanded = FIELD_GROUPS.get(name, [name])
+        for field in expanded:
+            if field not in FIELD_EXTRACTORS:
+                raise ValueError(f"Champ inconnu: {field} (disponibles: {', '.join(list(FIELD_EXTRACTORS) + list(FIELD_GROUPS))})")
+            if field not in fields:
+                fields.append(field)
+
+    # Ordre du rapport complet conservé
+    return [field for field in FIELD_EXTRACTORS if field in fields]
+
+def analyze_font(font_path, fields=None):
+    """Analyse complète d'une police, ou restreinte aux champs demandés"""
+    font = TTFont(font_path, lazy=True)
+
+    if fields is None:
+        fields = list(FIELD_EXTRACTORS)
+
+    try:
+        metrics = {field: FIELD_EXTRACTORS[field](font, font_path) for field in fields}
+    finally:
+        font.close()
 
     return metrics
 
+def benchmark_analysis(font_path, fields, repeat=5):
+    """Compare le temps d'une analyse complète et d'une analyse sélective"""
+    timings = {}
+    for label, selected in [('full', None), ('selective', fields)]:
+        durations = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            analyze_font(font_path, selected)
+            durations.append(time.perf_counter() - start)
+        timings[label] = min(durations)
+
+    timings['speedup'] = timings['full'] / timings['selective'] if timings['selective'] > 0 else 0
+    return timings
+
 def get_font_name(font):
     """Extrait le nom de la police"""
     name_table = font['name']
-    return name_table.getName(1, 3, 1, 0x409) or name_table.getName(1, 1, 1, 0x0) or "Unknown"
+    record = name_table.getName(1, 3, 1, 0x409) or name_table.getName(1, 1, 0, 0x0)
+    return record.toUnicode() if record else "Unknown"
+
+def get_style_name(font):
+    """Extrait le nom du style (Regular, Bold...)"""
+    name_table = font['name']
+    record = name_table.getName(2, 3, 1, 0x409) or name_table.getName(2, 1, 0, 0x0)
+    return record.toUnicode() if record else "Regular"
+
+# Hauteurs déjà calculées, par police (libérées avec le TTFont)
+_height_cache = weakref.WeakKeyDictionary()
 
 def get_x_height(font):
     """Estime la hauteur d'x"""
-    # Cherche le glyphe 'x' minuscule
-    if 'x' in font.getGlyphNames():
-        glyph = font['gly'][font.getGlyphNames().index('x')]
-        return glyph.yMax if hasattr(glyph, 'yMax') else 0
-    return 0
+    # OS/2 sxHeight, sinon hauteur du glyphe de 'x' (U+0078)
+    return _get_vertical_height(font, 'sxHeight', 0x0078)
 
 def get_cap_height(font):
     """Estime la hauteur des capitales"""
-    # Cherche le glyphe 'H' majuscule
-    if 'H' in font.getGlyphNames():
-        glyph = font['gly'][font.getGlyphNames().index('H')]
-        return glyph.yMax if hasattr(glyph, 'yMax') else 0
+    # OS/2 sCapHeight, sinon hauteur du glyphe de 'H' (U+0048)
+    return _get_vertical_height(font, 'sCapHeight', 0x0048)
+
+def _get_vertical_height(font, os2_field, codepoint):
+    """Hauteur mémorisée par police : OS/2 en priorité, puis boîte du glyphe"""
+    cache = _height_cache.setdefault(font, {})
+    if os2_field not in cache:
+        cache[os2_field] = _compute_vertical_height(font, os2_field, codepoint)
+    return cache[os2_field]
+
+def _compute_vertical_height(font, os2_field, codepoint):
+    """Calcule une hauteur à partir de OS/2 (version >= 2) ou du contour du glyphe"""
+    if 'OS/2' in font:
+        os2 = font['OS/2']
+        value = getattr(os2, os2_field, 0) if os2.version >= 2 else 0
+        if value > 0:
+            return value
+
+    # Recherche directe dans le cmap, sans parcourir l'ordre des glyphes
+    cmap = font['cmap'].getBestCmap() if 'cmap' in font else None
+    glyph_name = cmap.get(codepoint) if cmap else None
+    if glyph_name is None:
+        return 0
+
+    return _glyph_y_max(font, glyph_name)
+
+def _glyph_y_max(font, glyph_name):
+    """yMax d'un glyphe, depuis glyf ou CFF"""
+    if 'glyf' in font:
+        glyph = font['glyf'][glyph_name]
+        if glyph.numberOfContours == 0:
+            return 0
+        if not hasattr(glyph, 'yMax'):
+            glyph.recalcBounds(font['glyf'])
+        return glyph.yMax
+
+    if 'CFF ' in font or 'CFF2' in font:
+        from fontTools.pens.boundsPen import BoundsPen
+
+        glyph_set = font.getGlyphSet()
+        pen = BoundsPen(glyph_set)
+        glyph_set[glyph_name].draw(pen)
+        return pen.bounds[3] if pen.bounds else 0
+
     return 0
 
 def get_character_set(font):
     """Extrait le jeu de caractères supporté"""
     cmap = font['cmap'].getBestCmap()
     if cmap:
+        # Tri unique des points de code, partagé par toutes les analyses
+        codepoints = sorted(cmap)
         return {
-            'total_chars': len(cmap),
-            'ranges': get_unicode_ranges(cmap),
-            'scripts': identify_scripts(cmap)
+            'total_chars': len(codepoints),
+            'ranges': get_unicode_ranges(codepoints),
+            'scripts': identify_scripts(codepoints),
+            'blocks': identify_blocks(codepoints)
         }
     return {'total_chars': 0}
 
-def get_unicode_ranges(cmap):
-    """Identifie les blocs Unicode supportés"""
+def get_unicode_ranges(codepoints):
+    """Regroupe les points de code triés en plages contiguës"""
     ranges = []
     current_start = None
     current_end = None
 
-    for code in sorted(cmap.keys()):
+    for code in codepoints:
         if current_start is None:
             current_start = code
             current_end = code
@@ -87,45 +204,162 @@ def get_unicode_ranges(cmap):
 
     return ranges
 
-def identify_scripts(cmap):
-    """Identifie les scripts supportés"""
-    scripts = set()
-    for code in cmap.keys():
-        if 0x0000 <= code <= 0x007F:
-            scripts.add('Latin Basic')
-        elif 0x0080 <= code <= 0x00FF:
-            scripts.add('Latin Extended')
-        elif 0x0100 <= code <= 0x017F:
-            scripts.add('Latin Extended-A')
-        elif 0x0180 <= code <= 0x024F:
-            scripts.add('Latin Extended-B')
-        elif 0x1E00 <= code <= 0x1EFF:
-            scripts.add('Latin Extended Additional')
-        # Ajouter d'autres scripts selon les besoins
-    return list(scripts)
+def _count_per_range(codepoints, range_starts):
+    """Nombre de points de code dans chaque plage [start, start suivant[
+
+    Deux bisections par plage : le coût dépend du nombre de plages Unicode,
+    pas du nombre de caractères de la police.
+    """
+    if not codepoints:
+        return []
+
+    counts = []
+    first = bisect_right(range_starts, codepoints[0]) - 1
+    last = bisect_right(range_starts, codepoints[-1]) - 1
+
+    for index in range(max(first, 0), last + 1):
+        start = range_starts[index]
+        end = range_starts[index + 1] if index + 1 < len(range_starts) else 0x110000
+        count = bisect_left(codepoints, end) - bisect_left(codepoints, start)
+        if count:
+            counts.append((index, start, end, count))
+
+    return counts
+
+def identify_scripts(codepoints):
+    """Identifie les scripts Unicode supportés, avec leur part du jeu de caractères"""
+    totals = {}
+    for index, _, _, count in _count_per_range(codepoints, Scripts.RANGES):
+        code = Scripts.VALUES[index]
+        if code != 'Zzzz':  # Unknown
+            name = Scripts.NAMES.get(code, code)
+            totals[name] = totals.get(name, 0) + count
+
+    total_chars = len(codepoints)
+    return {
+        name: {'count': count, 'percentage': round(count / total_chars * 100, 2)}
+        for name, count in sorted(totals.items(), key=lambda item: -item[1])
+    }
+
+def identify_blocks(codepoints):
+    """Identifie les blocs Unicode supportés, avec leur taux de couverture"""
+    blocks = {}
+    for index, start, end, count in _count_per_range(codepoints, Blocks.RANGES):
+        name = Blocks.VALUES[index]
+        if name != 'No_Block':
+            blocks[name] = {'count': count, 'coverage': round(count / (end - start) * 100, 2)}
+    return blocks
+
+# Inventaires OpenType déjà calculés, par police
+_layout_cache = weakref.WeakKeyDictionary()
+
+# Types de lookup « Extension » dont le type réel est porté par la sous-table
+EXTENSION_LOOKUP_TYPES = {'GSUB': 7, 'GPOS': 9}
 
 def get_opentype_features(font):
-    """Extrait les features OpenType"""
+    """Extrait les tags de features OpenType (GSUB puis GPOS, sans doublon)"""
     features = []
-    if 'GPOS' in font:
-        features.append('Kerning')
-    if 'GSUB' in font:
-        features.append('Ligatures')
-        # Analyser les features disponibles
-        if font['GSUB'].table.FeatureList:
-            for feature in font['GSUB'].table.FeatureList.FeatureRecord:
-                features.append(feature.FeatureTag)
+    for table_info in get_opentype_layout(font)['tables'].values():
+        for tag in table_info['features']:
+            if tag not in features:
+                features.append(tag)
+    return features
+
+def get_opentype_layout(font):
+    """Inventaire GSUB/GPOS : features par script/langue, lookups et types"""
+    if font not in _layout_cache:
+        start = time.perf_counter()
+        tables = {}
+        for table_tag in ('GSUB', 'GPOS'):
+            if table_tag in font:
+                tables[table_tag] = _inventory_layout_table(font[table_tag].table, table_tag)
+        _layout_cache[font] = {
+            'tables': tables,
+            'elapsed_ms': round((time.perf_counter() - start) * 1000, 3)
+        }
+    return _layout_cache[font]
+
+def _inventory_layout_table(table, table_tag):
+    """Parcourt une seule fois ScriptList, FeatureList et LookupList d'une table"""
+    feature_records = table.FeatureList.FeatureRecord if table.FeatureList else []
+    lookups = table.LookupList.Lookup if table.LookupList else []
+
+    lookup_types = []
+    for lookup in lookups:
+        lookup_type = lookup.LookupType
+        if lookup_type == EXTENSION_LOOKUP_TYPES[table_tag] and lookup.SubTable:
+            lookup_type = lookup.SubTable[0].ExtensionLookupType
+        lookup_types.append(lookup_type)
+
+    # Un même tag peut avoir plusieurs enregistrements (un par langue)
+    features = {}
+    for record in feature_records:
+        indices = features.setdefault(record.FeatureTag, set())
+        indices.update(record.Feature.LookupListIndex)
+
+    scripts = {}
+    if table.ScriptList:
+        for script_record in table.ScriptList.ScriptRecord:
+            languages = {}
+            script = script_record.Script
+            lang_systems = [('dflt', script.DefaultLangSys)] if script.DefaultLangSys else []
+            lang_systems += [(lang.LangSysTag, lang.LangSys) for lang in script.LangSysRecord]
+
+            for lang_tag, lang_sys in lang_systems:
+                indices = list(lang_sys.FeatureIndex)
+                if lang_sys.ReqFeatureIndex != 0xFFFF:
+                    indices.insert(0, lang_sys.ReqFeatureIndex)
+                tags = []
+                for index in indices:
+                    if index < len(feature_records):
+                        tag = feature_records[index].FeatureTag
+                        if tag not in tags:
+                            tags.append(tag)
+                languages[lang_tag.strip()] = tags
+
+            scripts[script_record.ScriptTag.strip()] = languages
+
+    return {
+        'lookup_count': len(lookups),
+        'features': {
+            tag: {
+                'lookup_count': len(indices),
+                'lookup_types': sorted({lookup_types[i] for i in indices if i < len(lookup_types)})
+            }
+            for tag, indices in features.items()
+        },
+        'scripts': scripts
+    }
 
-    return list(set(features))
+def _format_layout_lines(layout):
+    """Lignes Markdown résumant l'inventaire GSUB/GPOS"""
+    lines = []
+    for table_tag, table_info in layout.get('tables', {}).items():
+        scripts = '; '.join(f"{script} ({', '.join(languages)})"
+                            for script, languages in table_info['scripts'].items())
+        lines.append(f"- **{table_tag}** : {len(table_info['features'])} features, "
+                     f"{table_info['lookup_count']} lookups — scripts : {scripts or 'aucun'}")
+    if 'elapsed_ms' in layout:
+        lines.append(f"- **Durée d'inventaire** : {layout['elapsed_ms']} ms")
+    return '\n'.join(lines)
 
 def generate_report(metrics, output_format='json'):
     """Génère un rapport formaté"""
     if output_format == 'json':
         return json.dumps(metrics, indent=2, ensure_ascii=False)
     elif output_format == 'markdown':
-        return format_markdown_report(metrics)
+        return format_markdown_report(_with_defaults(metrics))
     else:
-        return format_text_report(metrics)
+        return format_text_report(_with_defaults(metrics))
+
+def _with_defaults(metrics):
+    """Complète un rapport partiel (--fields) pour les formats texte"""
+    complete = {field: 'n/a' for field in FIELD_EXTRACTORS}
+    complete['character_set'] = {'total_chars': 'n/a', 'scripts': []}
+    complete['openType_features'] = []
+    complete['openType_layout'] = {}
+    complete.update(metrics)
+    return complete
 
 def format_markdown_report(metrics):
     """Format du rapport en Markdown"""
@@ -146,6 +380,7 @@ def format_markdown_report(metrics):
 
 ## Features OpenType
 {', '.join(metrics['openType_features'])}
+{_format_layout_lines(metrics['openType_layout'])}
 
 ## Format et taille
 - **Format** : {metrics['font_format']}
@@ -180,20 +415,425 @@ FORMAT: {metrics['font_format']} ({metrics['file_size']} octets)
 """
     return report
 
+FONT_EXTENSIONS = {'.otf', '.ttf', '.woff', '.woff2'}
+
+def iter_font_files(inputs):
+    """Liste triée et dédoublonnée des polices désignées par dossiers, fichiers ou globs"""
+    found = set()
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            candidates = path.rglob('*')
+        elif path.is_file():
+            candidates = [path]
+        else:
+            candidates = (Path(match) for match in glob.glob(item, recursive=True))
+
+        for candidate in candidates:
+            if candidate.suffix.lower() in FONT_EXTENSIONS and candidate.is_file():
+                found.add(candidate)
+
+    return sorted(found)
+
+def analyze_catalog_entry(font_path, fields=None):
+    """Analyse une police du catalogue ; les erreurs sont renvoyées, pas levées"""
+    entry = {'path': str(font_path)}
+    try:
+        entry.update(analyze_font(font_path, fields))
+    except Exception as e:
+        entry['error'] = f"{type(e).__name__}: {e}"
+    return entry
+
+def _failed_entry(font_file, error):
+    return {'path': str(font_file), 'error': error_message(error)}
+
+def iter_catalog(font_files, fields=None, jobs=1):
+    """Analyse les polices (en parallèle si jobs > 1) et produit les résultats dans l'ordre"""
+    # Nombre de tâches en vol borné : la mémoire ne dépend pas de la taille du catalogue
+    return iter_pool_results(partial(analyze_catalog_entry, fields=fields), font_files, jobs, _failed_entry,
+                             max_in_flight=jobs * 4)
+
+class CatalogSummary:
+    """Agrégats du catalogue, mis à jour au fil du flux de résultats"""
+
+    def __init__(self):
+        self.font_count = 0
+        self.errors = []
+        self.total_size = 0
+        self.formats = {}
+        self.families = {}
+        self.scripts = {}
+        self.features = {}
+
+    def add(self, entry):
+        """Intègre le résultat d'analyse d'une police"""
+        self.font_count += 1
+        if 'error' in entry:
+            self.errors.append({'path': entry['path'], 'error': entry['error']})
+            return
+
+        self.total_size += entry.get('file_size', 0)
+        if 'font_format' in entry:
+            self.formats[entry['font_format']] = self.formats.get(entry['font_format'], 0) + 1
+        if 'font_name' in entry:
+            self.families[entry['font_name']] = self.families.get(entry['font_name'], 0) + 1
+        for script in entry.get('character_set', {}).get('scripts', {}):
+            self.scripts[script] = self.scripts.get(script, 0) + 1
+        for feature in entry.get('openType_features', []):
+            self.features[feature] = self.features.get(feature, 0) + 1
+
+    def to_dict(self):
+        """Résumé sérialisable, classé par fréquence"""
+        def by_count(counts):
+            return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+
+        return {
+            'font_count': self.font_count,
+            'analyzed': self.font_count - len(self.errors),
+            'error_count': len(self.errors),
+            'total_size': self.total_size,
+            'formats': by_count(self.formats),
+            'family_count': len(self.families),
+            'scripts': by_count(self.scripts),
+            'openType_features': by_count(self.features),
+            'errors': self.errors
+        }
+
+def format_catalog_report(summary):
+    """Rapport Markdown agrégé pour tout le catalogue"""
+    report = f"""# Catalogue de polices
+
+## Vue d'ensemble
+- **Polices analysées** : {summary['analyzed']} / {summary['font_count']}
+- **Erreurs** : {summary['error_count']}
+- **Familles distinctes** : {summary['family_count']}
+- **Taille totale** : {summary['total_size']} octets
+
+## Formats
+"""
+    for font_format, count in summary['formats'].items():
+        report += f"- **{font_format}** : {count}\n"
+
+    report += "\n## Scripts couverts (nombre de polices)\n"
+    for script, count in summary['scripts'].items():
+        report += f"- **{script}** : {count}\n"
+
+    report += "\n## Features OpenType (nombre de polices)\n"
+    for feature, count in summary['openType_features'].items():
+        report += f"- **{feature}** : {count}\n"
+
+    if summary['errors']:
+        report += "\n## Erreurs\n"
+        for error in summary['errors']:
+            report += f"- `{error['path']}` : {error['error']}\n"
+
+    return report
+
+def catalog_main(argv):
+    """Mode catalogue : analyse de dossiers entiers en JSON Lines"""
+    parser = argparse.ArgumentParser(prog='font_analyzer.py catalog',
+                                     description="Analyse d'une bibliothèque de polices")
+    parser.add_argument('inputs', nargs='+', help='Dossiers, fichiers ou motifs glob (ex: "fonts/**/*.otf")')
+    parser.add_argument('--fields', help='Champs à extraire (voir le mode fichier unique)')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Nombre de processus en parallèle (0 = tous les cœurs)')
+    parser.add_argument('--output', '-o', default='-',
+                        help='Fichier JSON Lines des résultats (défaut : sortie standard)')
+    parser.add_argument('--report', default='catalog_report.md',
+                        help='Rapport agrégé Markdown (un fichier .json associé est aussi écrit)')
+
+    args = parser.parse_args(argv)
+
+    try:
+        fields = resolve_fields(args.fields)
+    except ValueError as e:
+        print(f"Erreur: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    font_files = iter_font_files(args.inputs)
+    if not font_files:
+        print("Aucune police trouvée à analyser", file=sys.stderr)
+        sys.exit(1)
+
+    # Les messages de progression vont sur stderr pour ne pas polluer le flux JSON Lines
+    print(f"Catalogue: {len(font_files)} polices, {jobs} processus", file=sys.stderr)
+
+    summary = CatalogSummary()
+    start = time.perf_counter()
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+
+    try:
+        for entry in iter_catalog(font_files, fields, jobs):
+            output.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            summary.add(entry)
+            if summary.font_count % 500 == 0:
+                print(f"  {summary.font_count}/{len(font_files)} polices analysées", file=sys.stderr)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = time.perf_counter() - start
+    summary_data = summary.to_dict()
+
+    report_path = Path(args.report)
+    with open(report_path, 'w', encoding='utf-8') as f:
+        f.write(format_catalog_report(summary_data))
+    with open(report_path.with_suffix('.json'), 'w', encoding='utf-8') as f:
+        json.dump(summary_data, f, indent=2, ensure_ascii=False)
+
+    print(f"Catalogue terminé en {elapsed:.2f}s "
+          f"({summary.font_count / elapsed if elapsed > 0 else 0:.1f} polices/s)", file=sys.stderr)
+    print(f"  - Résultats : {args.output if args.output != '-' else 'sortie standard'}", file=sys.stderr)
+    print(f"  - Rapport : {report_path} et {report_path.with_suffix('.json')}", file=sys.stderr)
+    if summary.errors:
+        print(f"  - Erreurs : {len(summary.errors)} police(s)", file=sys.stderr)
+
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fonts (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    family TEXT,
+    style TEXT,
+    font_format TEXT,
+    units_per_em INTEGER,
+    ascender INTEGER,
+    descender INTEGER,
+    line_gap INTEGER,
+    x_height INTEGER,
+    cap_height INTEGER,
+    glyph_count INTEGER,
+    total_chars INTEGER,
+    metrics_json TEXT
+);
+CREATE TABLE IF NOT EXISTS font_scripts (
+    font_id INTEGER NOT NULL REFERENCES fonts(id) ON DELETE CASCADE,
+    script TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    percentage REAL NOT NULL,
+    PRIMARY KEY (font_id, script)
+);
+CREATE TABLE IF NOT EXISTS font_features (
+    font_id INTEGER NOT NULL REFERENCES fonts(id) ON DELETE CASCADE,
+    feature TEXT NOT NULL,
+    PRIMARY KEY (font_id, feature)
+);
+CREATE INDEX IF NOT EXISTS idx_font_scripts_script ON font_scripts(script, font_id);
+CREATE INDEX IF NOT EXISTS idx_font_features_feature ON font_features(feature, font_id);
+CREATE INDEX IF NOT EXISTS idx_fonts_family ON fonts(family);
+"""
+
+def open_index(db_path):
+    """Ouvre (ou crée) l'index SQLite des métadonnées de polices"""
+    conn = sqlite3.connect(db_path)
+    conn.execute('PRAGMA foreign_keys = ON')
+    conn.execute('PRAGMA journal_mode = WAL')
+    conn.executescript(INDEX_SCHEMA)
+    return conn
+
+def _file_sha256(path):
+    """Hash SHA-256 d'un fichier, lu par blocs"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _index_feature_tags(features):
+    """Tags OpenType à indexer à partir du champ openType_features"""
+    return sorted(set(features))
+
+def store_index_entry(conn, entry, sha256, stat):
+    """Insère ou remplace les métadonnées d'une police dans l'index"""
+    conn.execute('DELETE FROM fonts WHERE path = ?', (entry['path'],))
+    character_set = entry.get('character_set', {})
+    cursor = conn.execute(
+        """INSERT INTO fonts (path, sha256, size, mtime_ns, family, style, font_format,
+                              units_per_em, ascender, descender, line_gap, x_height, cap_height,
+                              glyph_count, total_chars, metrics_json)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        (entry['path'], sha256, stat.st_size, stat.st_mtime_ns,
+         entry.get('font_name'), entry.get('style_name'), entry.get('font_format'),
+         entry.get('units_per_em'), entry.get('ascender'), entry.get('descender'),
+         entry.get('line_gap'), entry.get('x_height'), entry.get('cap_height'),
+         entry.get('glyph_count'), character_set.get('total_chars'),
+         json.dumps(entry, ensure_ascii=False)))
+    font_id = cursor.lastrowid
+
+    conn.executemany(
+        'INSERT INTO font_scripts (font_id, script, count, percentage) VALUES (?, ?, ?, ?)',
+        [(font_id, script, data['count'], data['percentage'])
+         for script, data in character_set.get('scripts', {}).items()])
+    conn.executemany(
+        'INSERT INTO font_features (font_id, feature) VALUES (?, ?)',
+        [(font_id, tag) for tag in _index_feature_tags(entry.get('openType_features', []))])
+
+def refresh_index(conn, font_files, jobs=1, prune=True):
+    """Met à jour l'index : seules les polices nouvelles ou modifiées sont réanalysées"""
+    known = {path: (sha256, size, mtime_ns) for path, sha256, size, mtime_ns
+             in conn.execute('SELECT path, sha256, size, mtime_ns FROM fonts')}
+    stats = {'unchanged': 0, 'touched': 0, 'analyzed': 0, 'errors': [], 'removed': 0}
+
+    to_analyze = []
+    hashes = {}
+    for font_file in font_files:
+        path = str(font_file.resolve())
+        stat = font_file.stat()
+        previous = known.get(path)
+
+        if previous and previous[1:] == (stat.st_size, stat.st_mtime_ns):
+            stats['unchanged'] += 1
+            continue
+
+        # Date ou taille modifiée : le contenu tranche
+        sha256 = _file_sha256(font_file)
+        if previous and previous[0] == sha256:
+            conn.execute('UPDATE fonts SET size = ?, mtime_ns = ? WHERE path = ?',
+                         (stat.st_size, stat.st_mtime_ns, path))
+            stats['touched'] += 1
+            continue
+
+        hashes[path] = sha256
+        to_analyze.append(Path(path))
+
+    for entry in iter_catalog(to_analyze, jobs=jobs):
+        if 'error' in entry:
+            stats['errors'].append(entry)
+            continue
+        store_index_entry(conn, entry, hashes[entry['path']], Path(entry['path']).stat())
+        stats['analyzed'] += 1
+
+    if prune:
+        # Polices supprimées du disque depuis la dernière indexation
+        missing = [(path,) for path in known if not Path(path).exists()]
+        conn.executemany('DELETE FROM fonts WHERE path = ?', missing)
+        stats['removed'] = len(missing)
+
+    conn.commit()
+    return stats
+
+def query_index(conn, scripts=(), features=(), family=None):
+    """Polices de l'index couvrant tous les scripts et toutes les features demandés"""
+    sql = 'SELECT path, family, style FROM fonts f WHERE 1 = 1'
+    params = []
+
+    for script in scripts:
+        sql += ' AND EXISTS (SELECT 1 FROM font_scripts s WHERE s.font_id = f.id AND s.script = ?)'
+        params.append(script)
+
+    if features:
+        placeholders = ', '.join('?' for _ in features)
+        sql += (f' AND (SELECT COUNT(*) FROM font_features o'
+                f' WHERE o.font_id = f.id AND o.feature IN ({placeholders})) = ?')
+        params.extend(features)
+        params.append(len(set(features)))
+
+    if family:
+        sql += ' AND family LIKE ?'
+        params.append(family)
+
+    sql += ' ORDER BY family, style, path'
+    return [{'path': path, 'family': fam, 'style': style}
+            for path, fam, style in conn.execute(sql, params)]
+
+def index_main(argv):
+    """Mode index : construction incrémentale de l'index SQLite"""
+    parser = argparse.ArgumentParser(prog='font_analyzer.py index',
+                                     description="Indexe une bibliothèque de polices dans SQLite")
+    parser.add_argument('database', help='Fichier SQLite de l\'index')
+    parser.add_argument('inputs', nargs='+', help='Dossiers, fichiers ou motifs glob')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Nombre de processus en parallèle (0 = tous les cœurs)')
+    parser.add_argument('--no-prune', action='store_true',
+                        help='Conserve les entrées des fichiers supprimés')
+
+    args = parser.parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    start = time.perf_counter()
+    conn = open_index(args.database)
+    try:
+        stats = refresh_index(conn, iter_font_files(args.inputs), jobs, prune=not args.no_prune)
+    finally:
+        conn.close()
+
+    print(f"Index {args.database} mis à jour en {time.perf_counter() - start:.2f}s")
+    print(f"  - Analysées : {stats['analyzed']}")
+    print(f"  - Inchangées : {stats['unchanged'] + stats['touched']}")
+    print(f"  - Supprimées : {stats['removed']}")
+    for entry in stats['errors']:
+        print(f"  ✗ {entry['path']} : {entry['error']}")
+
+def query_main(argv):
+    """Mode query : interrogation de l'index sans rouvrir les polices"""
+    parser = argparse.ArgumentParser(prog='font_analyzer.py query',
+                                     description="Interroge l'index SQLite des polices")
+    parser.add_argument('database', help='Fichier SQLite de l\'index')
+    parser.add_argument('--script', '-s', action='append', default=[],
+                        help='Script Unicode requis (ex: Cyrillic), répétable')
+    parser.add_argument('--feature', '-f', action='append', default=[],
+                        help='Feature OpenType requise (ex: liga), répétable')
+    parser.add_argument('--family', help='Filtre sur la famille (motif SQL LIKE)')
+
+    args = parser.parse_args(argv)
+
+    if not Path(args.database).exists():
+        print(f"Erreur: L'index {args.database} n'existe pas")
+        sys.exit(1)
+
+    conn = open_index(args.database)
+    try:
+        start = time.perf_counter()
+        results = query_index(conn, args.script, args.feature, args.family)
+        elapsed = time.perf_counter() - start
+    finally:
+        conn.close()
+
+    for result in results:
+        print(f"{result['family']} {result['style']}\t{result['path']}")
+    print(f"{len(results)} police(s) trouvée(s) en {elapsed * 1000:.1f} ms", file=sys.stderr)
+
 def main():
     """Point d'entrée principal"""
-    if len(sys.argv) != 2:
-        print("Usage: python font_analyzer.py <font_file>")
-        sys.exit(1)
+    subcommands = {'catalog': catalog_main, 'index': index_main, 'query': query_main}
+    if len(sys.argv) > 1 and sys.argv[1] in subcommands:
+        subcommands[sys.argv[1]](sys.argv[2:])
+        return
+
+    parser = argparse.ArgumentParser(description="Analyseur de polices")
+    parser.add_argument('font_file', help='Fichier de police à analyser')
+    parser.add_argument('--fields', help="Champs à extraire, séparés par des virgules "
+                                         "(ex: metrics,character_set). Par défaut : tous")
+    parser.add_argument('--benchmark', type=int, metavar='N', default=0,
+                        help='Compare analyse complète et sélective sur N répétitions')
+
+    args = parser.parse_args()
 
-    font_path = sys.argv[1]
+    font_path = args.font_file
 
     if not Path(font_path).exists():
         print(f"Erreur: Le fichier {font_path} n'existe pas")
         sys.exit(1)
 
     try:
-        metrics = analyze_font(font_path)
+        fields = resolve_fields(args.fields)
+    except ValueError as e:
+        print(f"Erreur: {e}")
+        sys.exit(1)
+
+    try:
+        if args.benchmark:
+            timings = benchmark_analysis(font_path, fields, args.benchmark)
+            print(f"Benchmark ({args.benchmark} répétitions, meilleur temps) :")
+            print(f"  - Analyse complète : {timings['full'] * 1000:.2f} ms")
+            print(f"  - Analyse sélective ({', '.join(fields)}) : {timings['selective'] * 1000:.2f} ms")
+            print(f"  - Accélération : x{timings['speedup']:.1f}")
+            return
+
+        metrics = analyze_font(font_path, fields)
 
         # Génération du rapport
         json_report = generate_report(metrics, 'json')
@@ -0,0 +1,868 @@
+#!/usr/bin/env python3
+"""
+Rapport de chargement des polices : octets par page et rendu bloquant
+Usage: python font_loading_report.py site/ --config web_project_config.json
+
+Analyse statique (sans navigateur) de pages HTML et de leurs feuilles CSS :
+les @font-face réellement téléchargées sont déduites des caractères affichés,
+des familles, graisses et styles calculés pour chaque élément, comme le ferait
+l'algorithme de sélection des polices CSS.
+"""
+
+import re
+import sys
+import glob
+import json
+import bisect
+import hashlib
+import argparse
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import urlsplit, unquote
+
+from batch_optimizer import parse_unicode_intervals
+
+PAGE_EXTENSIONS = {'.html', '.htm', '.xhtml'}
+
+# Styles par défaut des navigateurs pour les propriétés suivies
+USER_AGENT_STYLES = {
+    **{tag: {'font-weight': 'bold'} for tag in ('b', 'strong', 'th', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6')},
+    **{tag: {'font-style': 'italic'} for tag in ('em', 'i', 'cite', 'dfn', 'var', 'address')},
+    **{tag: {'font-family': 'monospace'} for tag in ('code', 'kbd', 'pre', 'samp', 'tt')},
+    # Les contrôles de formulaire n'héritent pas de la police sans « font: inherit »
+    **{tag: {'font-family': 'system-ui', 'font-weight': 'normal', 'font-style': 'normal'}
+       for tag in ('input', 'textarea', 'select', 'button')}
+}
+
+VOID_ELEMENTS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+                 'param', 'source', 'track', 'wbr'}
+HIDDEN_ELEMENTS = {'script', 'noscript', 'template', 'head', 'title', 'meta', 'link', 'style'}
+TEXT_ATTRIBUTES = ('placeholder', 'value')
+
+FONT_PROPERTIES = ('font-family', 'font-weight', 'font-style')
+# Propriétés conservées par défaut dans les règles (les propriétés personnalisées le sont toujours)
+TRACKED_PROPERTIES = FONT_PROPERTIES + ('font',)
+WEIGHT_KEYWORDS = {'normal': 400, 'bold': 700}
+FONT_SIZE_TOKEN = re.compile(
+    r'^(?:[\d.]+(?:px|em|rem|pt|pc|%|vw|vh|ex|ch|cm|mm|in|q)|xx-small|x-small|small|medium|large|'
+    r'x-large|xx-large|xxx-large|smaller|larger|var\(.*\)|calc\(.*\)|clamp\(.*\))(?:/.*)?$', re.I)
+SIZE_MULTIPLIERS = {'B': 1, 'KB': 1000, 'MB': 1000 ** 2, 'KIB': 1024, 'MIB': 1024 ** 2}
+
+# Composants d'un sélecteur simple : type, #id, .classe, [attribut], :pseudo(...)
+SELECTOR_PART = re.compile(r'(?P<tag>^[a-zA-Z*][\w-]*)|#(?P<id>[\w-]+)|\.(?P<cls>[\w-]+)'
+                           r'|(?P<attr>\[[^\]]*\])|(?P<pseudo>::?[\w-]+(?:\([^)]*\))?)')
+VAR_REFERENCE = re.compile(r'var\(\s*(--[\w-]+)\s*(?:,\s*([^()]*(?:\([^()]*\)[^()]*)*))?\)')
+URL_REFERENCE = re.compile(r'url\(\s*([\'"]?)(.*?)\1\s*\)(?:\s*format\(\s*[\'"]?([\w-]+)[\'"]?\s*\))?')
+
+# ---------------------------------------------------------------------------
+# Plages unicode
+# ---------------------------------------------------------------------------
+
+def _in_ranges(codepoint, intervals):
+    index = bisect.bisect_right(intervals, (codepoint, float('inf'))) - 1
+    return index >= 0 and intervals[index][0] <= codepoint <= intervals[index][1]
+
+# ---------------------------------------------------------------------------
+# CSS
+# ---------------------------------------------------------------------------
+
+class FontFace:
+    """Règle @font-face résolue : descripteurs et fichier local éventuel"""
+
+    def __init__(self, descriptors, stylesheet, site_root=None):
+        self.family = _unquote(descriptors.get('font-family', ''))
+        self.style = descriptors.get('font-style', 'normal').split()[0].lower()
+        self.display = descriptors.get('font-display', 'auto').lower()
+        self.weight = _parse_weight_range(descriptors.get('font-weight', '400'))
+        range_spec = descriptors.get('unicode-range')
+        self.unicode_range = range_spec.strip() if range_spec else None
+        try:
+            self.intervals = parse_unicode_intervals(range_spec) if range_spec else None
+        except ValueError:
+            # Descripteur invalide ignoré comme par les navigateurs : toute la police s'applique
+            self.intervals = None
+        self.stylesheet = stylesheet
+
+        # Premier src téléchargeable : le navigateur ignore local() et les formats inconnus
+        self.url = None
+        self.path = None
+        for _, url, _ in URL_REFERENCE.findall(descriptors.get('src', '')):
+            self.url = url
+            self.path = resolve_local(url, stylesheet, site_root)
+            break
+
+        self.bytes = self.path.stat().st_size if self.path and self.path.exists() else None
+
+    @property
+    def key(self):
+        """Identité de la face : deux déclarations identiques sont des doublons"""
+        return (self.family.lower(), self.weight, self.style, self.unicode_range)
+
+    def covers(self, codepoint):
+        return self.intervals is None or _in_ranges(codepoint, self.intervals)
+
+    def to_dict(self):
+        return {
+            'family': self.family,
+            'weight': ' '.join(f"{w:g}" for w in sorted(set(self.weight))),
+            'style': self.style,
+            'display': self.display,
+            'unicode_range': self.unicode_range,
+            'url': self.url,
+            'path': str(self.path) if self.path else None,
+            'bytes': self.bytes,
+            'stylesheet': str(self.stylesheet)
+        }
+
+class StyleRule:
+    """Règle de style ordinaire, un sélecteur par règle"""
+
+    def __init__(self, selector, declarations, order):
+        self.selector = selector
+        self.compounds = _parse_selector(selector)
+        self.specificity = _specificity(self.compounds)
+        self.declarations = declarations
+        self.order = order
+
+class Stylesheet:
+    """Feuille CSS analysée : règles de style, @font-face et @import"""
+
+    def __init__(self, text, path, site_root=None, properties=TRACKED_PROPERTIES):
+        self.path = path
+        self.site_root = site_root
+        self.properties = properties
+        self.rules = []
+        self.font_faces = []
+        self.imports = []
+        self._parse_block(_strip_comments(text))
+
+    def _parse_block(self, text):
+        position = 0
+        while True:
+            delimiter = _next_delimiter(text, position)
+            if delimiter == -1:
+                break
+
+            if text[delimiter] == ';':
+                statement = text[position:delimiter].strip()
+                if statement.lower().startswith('@import'):
+                    match = URL_REFERENCE.search(statement)
+                    url = match.group(2) if match else _unquote(statement[len('@import'):].split()[0])
+                    self.imports.append(url)
+                position = delimiter + 1
+                continue
+
+            prelude = text[position:delimiter].strip()
+            end = _find_matching_brace(text, delimiter)
+            body = text[delimiter + 1:end]
+            position = end + 1
+
+            lowered = prelude.lower()
+            if lowered.startswith('@font-face'):
+                self.font_faces.append(FontFace(_parse_declarations(body), self.path, self.site_root))
+            elif lowered.startswith(('@media', '@supports', '@layer', '@container', '@document')):
+                # Analyse statique : toutes les conditions sont supposées remplies
+                self._parse_block(body)
+            elif lowered.startswith('@'):
+                # @keyframes, @page... sans effet sur le choix des polices
+                continue
+            else:
+                declarations = _parse_declarations(body)
+                if not any(name in self.properties or name.startswith('--') for name in declarations):
+                    continue
+                for selector in split_top_level(prelude, ','):
+                    if selector.strip():
+                        self.rules.append(StyleRule(selector.strip(), declarations, 0))
+
+def _strip_comments(text):
+    return re.sub(r'/\*.*?\*/', '', text, flags=re.S)
+
+def _next_delimiter(text, start):
+    """Position du prochain « { » ou « ; » hors chaînes et parenthèses, -1 sinon"""
+    depth = 0
+    quote = None
+    for index in range(start, len(text)):
+        current = text[index]
+        if quote:
+            if current == quote and text[index - 1] != '\\':
+                quote = None
+        elif current in '"\'':
+            quote = current
+        elif current == '(':
+            depth += 1
+        elif current == ')':
+            depth = max(depth - 1, 0)
+        elif current in '{;' and depth == 0:
+            return index
+    return -1
+
+def _find_matching_brace(text, start):
+    depth = 0
+    quote = None
+    for index in range(start, len(text)):
+        current = text[index]
+        if quote:
+            if current == quote and text[index - 1] != '\\':
+                quote = None
+        elif current in '"\'':
+            quote = current
+        elif current == '{':
+            depth += 1
+        elif current == '}':
+            depth -= 1
+            if depth == 0:
+                return index
+    return len(text)
+
+def split_top_level(text, separator):
+    """Découpe text sur separator hors parenthèses et guillemets"""
+    parts = []
+    depth = 0
+    quote = None
+    current = []
+    for char in text:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char in '([':
+            depth += 1
+        elif char in ')]':
+            depth = max(depth - 1, 0)
+        elif char == separator and depth == 0:
+            parts.append(''.join(current))
+            current = []
+            continue
+        current.append(char)
+    parts.append(''.join(current))
+    return parts
+
+def _parse_declarations(body):
+    """'font-weight: 700; --x: 1' -> {'font-weight': '700', '--x': '1'} (!important retiré)"""
+    declarations = {}
+    for declaration in split_top_level(body, ';'):
+        name, separator, value = declaration.partition(':')
+        if not separator:
+            continue
+        name = name.strip()
+        name = name if name.startswith('--') else name.lower()
+        declarations[name] = re.sub(r'\s*!important\s*$', '', value.strip(), flags=re.I)
+    return declarations
+
+def _unquote(value):
+    return value.strip().strip('"\'').strip()
+
+def _parse_weight_range(value):
+    weights = []
+    for token in value.split():
+        token = token.lower()
+        if token in WEIGHT_KEYWORDS:
+            weights.append(float(WEIGHT_KEYWORDS[token]))
+        else:
+            try:
+                weights.append(float(token))
+            except ValueError:
+                continue
+    if not weights:
+        return (400.0, 400.0)
+    return (min(weights), max(weights))
+
+def resolve_local(url, base_file, site_root=None):
+    """Chemin local d'une URL ; None pour les ressources distantes ou data:"""
+    parts = urlsplit(url)
+    if parts.scheme or parts.netloc:
+        return None
+    path = unquote(parts.path)
+    if not path:
+        return None
+    if path.startswith('/'):
+        # URL absolue au site : résolue depuis la racine publiée
+        return (Path(site_root or Path(base_file).parent) / path.lstrip('/')).resolve()
+    return (Path(base_file).parent / path).resolve()
+
+# ---------------------------------------------------------------------------
+# Sélecteurs
+# ---------------------------------------------------------------------------
+
+def _parse_selector(selector):
+    """'nav .menu > a:hover' -> [(combinateur, {'tag','ids','classes'}), ...] de gauche à droite"""
+    tokens = re.split(r'\s*([>+~])\s*|\s+', selector.strip())
+    compounds = []
+    combinator = ' '
+    for token in tokens:
+        if token is None or token == '':
+            continue
+        if token in '>+~':
+            combinator = token
+            continue
+        compound = {'tag': None, 'ids': [], 'classes': [], 'other': 0}
+        for match in SELECTOR_PART.finditer(token):
+            if match.group('tag'):
+                compound['tag'] = match.group('tag').lower()
+            elif match.group('id'):
+                compound['ids'].append(match.group('id'))
+            elif match.group('cls'):
+                compound['classes'].append(match.group('cls'))
+            elif match.group('attr'):
+                compound['other'] += 1
+            elif match.group('pseudo'):
+                pseudo = match.group('pseudo').lower()
+                if pseudo == ':root':
+                    compound['tag'] = 'html'
+                if not pseudo.startswith('::'):
+                    compound['other'] += 1
+        compounds.append((combinator, compound))
+        combinator = ' '
+    return compounds
+
+def _specificity(compounds):
+    ids = sum(len(compound['ids']) for _, compound in compounds)
+    classes = sum(len(compound['classes']) + compound['other'] for _, compound in compounds)
+    types = sum(1 for _, compound in compounds if compound['tag'] not in (None, '*'))
+    return (ids, classes, types)
+
+def _matches_compound(element, compound):
+    # Pseudo-classes (:hover, :focus...) et attributs supposés vrais : estimation par excès
+    if compound['tag'] not in (None, '*') and compound['tag'] != element.tag:
+        return False
+    if any(element_id != element.id for element_id in compound['ids']):
+        return False
+    return all(name in element.classes for name in compound['classes'])
+
+def matches_selector(element, compounds):
+    """Correspondance de droite à gauche ; les combinateurs frères sont assimilés au parent"""
+    if not compounds or not _matches_compound(element, compounds[-1][1]):
+        return False
+    combinator = compounds[-1][0]
+    remaining = compounds[:-1]
+    if not remaining:
+        return True
+    if combinator == '>':
+        return element.parent is not None and matches_selector(element.parent, remaining)
+    if combinator in '+~':
+        # Frères non suivis par l'arbre : partie gauche supposée vraie (estimation par excès)
+        return True
+    current = element.parent
+    while current is not None:
+        if matches_selector(current, remaining):
+            return True
+        current = current.parent
+    return False
+
+# ---------------------------------------------------------------------------
+# HTML
+# ---------------------------------------------------------------------------
+
+class Element:
+    """Nœud HTML minimal : ce qu'il faut pour la cascade des propriétés de police"""
+
+    __slots__ = ('tag', 'id', 'classes', 'inline_style', 'parent', 'text', 'hidden', 'computed')
+
+    def __init__(self, tag, attrs, parent):
+        self.tag = tag
+        self.id = attrs.get('id')
+        self.classes = set((attrs.get('class') or '').split())
+        self.inline_style = _parse_declarations(attrs['style']) if attrs.get('style') else {}
+        self.parent = parent
+        self.text = []
+        self.hidden = tag in HIDDEN_ELEMENTS or 'hidden' in attrs or (parent is not None and parent.hidden)
+        self.computed = None
+
+class PageParser(HTMLParser):
+    """Construit l'arbre des éléments, les feuilles de style et les préchargements d'une page"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Element('#document', {}, None)
+        self.current = self.root
+        self.elements = []
+        self.stylesheets = []     # ('inline', texte) ou ('link', href, dans <head>)
+        self.preloads = []
+        self._style_text = None
+        self._in_head = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {name: value or '' for name, value in attrs}
+        if tag == 'head':
+            self._in_head = True
+        if tag == 'link':
+            rel = attrs.get('rel', '').lower().split()
+            if 'stylesheet' in rel and attrs.get('href'):
+                self.stylesheets.append(('link', attrs['href'], self._in_head))
+            elif 'preload' in rel and attrs.get('as') == 'font' and attrs.get('href'):
+                self.preloads.append(attrs['href'])
+        if tag == 'style':
+            self._style_text = []
+
+        element = Element(tag, attrs, self.current)
+        self.elements.append(element)
+        if tag in ('input', 'textarea'):
+            element.text.extend(attrs[name] for name in TEXT_ATTRIBUTES if attrs.get(name))
+        if tag not in VOID_ELEMENTS:
+            self.current = element
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS and self.current.tag == tag:
+            self.current = self.current.parent
+
+    def handle_endtag(self, tag):
+        if tag == 'head':
+            self._in_head = False
+        if tag == 'style' and self._style_text is not None:
+            self.stylesheets.append(('inline', ''.join(self._style_text)))
+            self._style_text = None
+        # Remonte jusqu'à l'élément ouvert correspondant (balises mal fermées tolérées)
+        node = self.current
+        while node is not None and node.tag != tag:
+            node = node.parent
+        if node is not None and node.parent is not None:
+            self.current = node.parent
+
+    def handle_data(self, data):
+        if self._style_text is not None:
+            self._style_text.append(data)
+        elif data.strip():
+            self.current.text.append(data)
+
+# ---------------------------------------------------------------------------
+# Cascade et sélection des polices
+# ---------------------------------------------------------------------------
+
+def resolve_vars(value, custom, depth=0):
+    """Substitue les var(--nom, repli) par les propriétés personnalisées de custom"""
+    if 'var(' not in value or depth > 8:
+        return value
+
+    def replace(match):
+        name, fallback = match.group(1), match.group(2)
+        if name in custom:
+            return custom[name]
+        return fallback.strip() if fallback else ''
+
+    return resolve_vars(VAR_REFERENCE.sub(replace, value), custom, depth + 1)
+
+def _expand_font_shorthand(value):
+    """font: italic 700 1rem/1.5 'Inter', sans-serif -> propriétés longues"""
+    if value.strip().lower() == 'inherit':
+        return {name: 'inherit' for name in FONT_PROPERTIES}
+    tokens = split_top_level(value.replace('\t', ' '), ' ')
+    tokens = [token for token in tokens if token]
+    for index, token in enumerate(tokens):
+        if FONT_SIZE_TOKEN.match(token):
+            expanded = {'font-family': ' '.join(tokens[index + 1:]) or 'serif',
+                        'font-style': 'normal', 'font-weight': 'normal'}
+            for prefix in tokens[:index]:
+                lowered = prefix.lower()
+                if lowered in ('italic', 'oblique'):
+                    expanded['font-style'] = lowered
+                elif lowered in ('bold', 'bolder', 'lighter') or lowered.isdigit():
+                    expanded['font-weight'] = lowered
+            return expanded
+    return {}
+
+def _compute_weight(value, parent_weight):
+    value = value.strip().lower()
+    if value == 'bolder':
+        return 400 if parent_weight < 350 else (700 if parent_weight < 550 else 900)
+    if value == 'lighter':
+        return 100 if parent_weight < 550 else (400 if parent_weight < 750 else 700)
+    if value in WEIGHT_KEYWORDS:
+        return WEIGHT_KEYWORDS[value]
+    try:
+        return float(value)
+    except ValueError:
+        return parent_weight
+
+def parse_family_list(value):
+    return [_unquote(family) for family in split_top_level(value, ',') if _unquote(family)]
+
+class RuleIndex:
+    """Règles indexées par le sélecteur le plus à droite (id, classe, type), comme les moteurs de rendu"""
+
+    def __init__(self, rules):
+        self.by_id, self.by_class, self.by_tag, self.universal = {}, {}, {}, []
+        for rule in rules:
+            if not rule.compounds:
+                continue
+            compound = rule.compounds[-1][1]
+            if compound['ids']:
+                self.by_id.setdefault(compound['ids'][0], []).append(rule)
+            elif compound['classes']:
+                self.by_class.setdefault(compound['classes'][0], []).append(rule)
+            elif compound['tag'] not in (None, '*'):
+                self.by_tag.setdefault(compound['tag'], []).append(rule)
+            else:
+                self.universal.append(rule)
+
+    def candidates(self, element):
+        rules = list(self.universal)
+        rules.extend(self.by_tag.get(element.tag, ()))
+        if element.id:
+            rules.extend(self.by_id.get(element.id, ()))
+        for name in element.classes:
+            rules.extend(self.by_class.get(name, ()))
+        return rules
+
+def compute_styles(elements, rules):
+    """Famille, graisse, style et propriétés personnalisées calculés pour chaque élément"""
+    index = RuleIndex(rules)
+    initial = {'font-family': ['serif'], 'font-weight': 400.0, 'font-style': 'normal', 'custom': {}}
+
+    for element in elements:
+        parent = element.parent.computed if element.parent is not None and element.parent.computed else initial
+
+        matching = sorted((rule for rule in index.candidates(element) if matches_selector(element, rule.compounds)),
+                          key=lambda rule: (rule.specificity, rule.order))
+        layers = [USER_AGENT_STYLES.get(element.tag, {})]
+        layers.extend(rule.declarations for rule in matching)
+        layers.append(element.inline_style)
+
+        # Propriétés personnalisées d'abord : var() peut apparaître dans n'importe quelle couche
+        custom = dict(parent['custom'])
+        for layer in layers:
+            custom.update({name: value for name, value in layer.items() if name.startswith('--')})
+
+        # Puis cascade dans l'ordre : un raccourci « font » écrase les propriétés longues antérieures
+        declared = {}
+        for layer in layers:
+            for name, value in layer.items():
+                if name == 'font':
+                    declared.update(_expand_font_shorthand(resolve_vars(value, custom)))
+                elif name in FONT_PROPERTIES:
+                    declared[name] = value
+
+        computed = {'custom': custom}
+        family = resolve_vars(declared.get('font-family', 'inherit'), custom)
+        computed['font-family'] = parent['font-family'] if family in ('inherit', '') else parse_family_list(family)
+        weight = resolve_vars(declared.get('font-weight', 'inherit'), custom)
+        computed['font-weight'] = parent['font-weight'] if weight in ('inherit', '') \
+            else _compute_weight(weight, parent['font-weight'])
+        style = resolve_vars(declared.get('font-style', 'inherit'), custom).split()
+        computed['font-style'] = parent['font-style'] if not style or style[0] == 'inherit' else style[0].lower()
+        element.computed = computed
+
+def _style_preference(desired):
+    if desired == 'italic':
+        return ('italic', 'oblique', 'normal')
+    if desired == 'oblique':
+        return ('oblique', 'italic', 'normal')
+    return ('normal', 'oblique', 'italic')
+
+def _weight_distance(desired, weight_range):
+    """Clé de tri de l'algorithme CSS de correspondance des graisses (plus petit = meilleur)"""
+    low, high = weight_range
+    if low <= desired <= high:
+        return (0, 0)
+    if 400 <= desired <= 500:
+        if desired < low <= 500:
+            return (1, low - desired)
+        if high < desired:
+            return (2, desired - high)
+        return (3, low - desired)
+    if desired < 400:
+        if high < desired:
+            return (1, desired - high)
+        return (2, low - desired)
+    if low > desired:
+        return (1, low - desired)
+    return (2, desired - high)
+
+def select_faces(faces_by_family, families, weight, style, codepoints):
+    """Faces téléchargées pour afficher ces caractères, en suivant la pile de familles"""
+    selected = []
+    remaining = set(codepoints)
+
+    for family in families:
+        if not remaining:
+            break
+        faces = faces_by_family.get(family.lower())
+        if not faces:
+            # Famille générique ou police système : supposée couvrir le reste sans téléchargement
+            break
+
+        # Style le plus proche puis graisse la plus proche ; les shards de cette face forment un groupe
+        for candidate_style in _style_preference(style):
+            styled = [face for face in faces if face.style == candidate_style]
+            if styled:
+                break
+        else:
+            styled = faces
+        best = min(_weight_distance(weight, face.weight) for face in styled)
+        group = [face for face in styled if _weight_distance(weight, face.weight) == best]
+
+        covered = set()
+        for face in group:
+            hits = {codepoint for codepoint in remaining if face.covers(codepoint)}
+            if hits:
+                selected.append(face)
+                covered |= hits
+        remaining -= covered
+
+    return selected
+
+# ---------------------------------------------------------------------------
+# Pages
+# ---------------------------------------------------------------------------
+
+class StylesheetCache:
+    """Feuilles CSS locales lues et analysées une seule fois pour tout le site"""
+
+    def __init__(self, site_root=None, properties=TRACKED_PROPERTIES):
+        self.site_root = site_root
+        self.properties = properties
+        self._sheets = {}
+
+    def load(self, path, seen=None):
+        """Feuille et ses @import locaux, dans l'ordre de la cascade"""
+        path = Path(path).resolve()
+        seen = seen if seen is not None else set()
+        if path in seen:
+            return []
+        seen.add(path)
+
+        if path not in self._sheets:
+            try:
+                text = path.read_text(encoding='utf-8', errors='replace')
+            except OSError:
+                self._sheets[path] = None
+            else:
+                self._sheets[path] = Stylesheet(text, path, self.site_root, self.properties)
+
+        sheet = self._sheets[path]
+        if sheet is None:
+            return []
+
+        sheets = []
+        for url in sheet.imports:
+            imported = resolve_local(url, path, self.site_root)
+            if imported is not None:
+                sheets.extend(self.load(imported, seen))
+        sheets.append(sheet)
+        return sheets
+
+def analyze_page(page_path, stylesheet_cache):
+    """Faces téléchargées, octets et points bloquants d'une page"""
+    page_path = Path(page_path).resolve()
+    parser = PageParser()
+    parser.feed(page_path.read_text(encoding='utf-8', errors='replace'))
+    parser.close()
+
+    sheets = []
+    external = []
+    blocking = []
+    for entry in parser.stylesheets:
+        if entry[0] == 'inline':
+            sheets.append(Stylesheet(entry[1], page_path, stylesheet_cache.site_root))
+            continue
+        _, href, in_head = entry
+        local = resolve_local(href, page_path, stylesheet_cache.site_root)
+        if local is None:
+            external.append(href)
+            if in_head:
+                blocking.append(f"Feuille distante bloquante, non analysée: {href}")
+            continue
+        loaded = stylesheet_cache.load(local)
+        if not loaded:
+            blocking.append(f"Feuille introuvable: {href}")
+        sheets.extend(loaded)
+
+    rules = []
+    faces_by_family = {}
+    declared_faces = []
+    for sheet in sheets:
+        rules.extend(sheet.rules)
+        for face in sheet.font_faces:
+            faces_by_family.setdefault(face.family.lower(), []).append(face)
+            declared_faces.append(face)
+    for order, rule in enumerate(rules):
+        rule.order = order
+
+    compute_styles(parser.elements, rules)
+
+    # Caractères affichés regroupés par (familles, graisse, style) calculés
+    usage = {}
+    for element in parser.elements:
+        if element.hidden or not element.text:
+            continue
+        computed = element.computed
+        key = (tuple(computed['font-family']), computed['font-weight'], computed['font-style'])
+        usage.setdefault(key, set()).update(ord(char) for text in element.text for char in text
+                                             if not char.isspace())
+    for codepoints in usage.values():
+        codepoints.add(0x20)
+
+    downloaded = {}
+    for (families, weight, style), codepoints in usage.items():
+        for face in select_faces(faces_by_family, families, weight, style, codepoints):
+            downloaded[id(face)] = face
+
+    preloaded = {resolve_local(href, page_path, stylesheet_cache.site_root) for href in parser.preloads}
+    preloaded.discard(None)
+    downloaded_paths = {face.path for face in downloaded.values() if face.path}
+
+    # Doublons : même descripteur déclaré plusieurs fois, ou même fichier sous plusieurs URL
+    duplicates = []
+    seen_keys = {}
+    for face in declared_faces:
+        if face.key in seen_keys and seen_keys[face.key].url != face.url:
+            duplicates.append(f"{face.family} {face.to_dict()['weight']} {face.style}: "
+                              f"{seen_keys[face.key].url} et {face.url}")
+        seen_keys.setdefault(face.key, face)
+
+    for face in downloaded.values():
+        if face.display in ('auto', 'block'):
+            blocking.append(f"font-display: {face.display} ({face.family} {face.to_dict()['weight']}): "
+                            f"texte invisible jusqu'au chargement")
+        if face.path and face.path not in preloaded and face.stylesheet != page_path:
+            blocking.append(f"Non préchargée, découverte après la feuille {face.stylesheet.name}: {face.url}")
+        if face.path and not face.path.exists():
+            blocking.append(f"Fichier de police introuvable: {face.url}")
+
+    faces = sorted((face.to_dict() for face in downloaded.values()), key=lambda data: data['url'] or '')
+    return {
+        'page': str(page_path),
+        'faces': faces,
+        'font_bytes': sum(face['bytes'] or 0 for face in faces),
+        'unknown_sizes': sum(1 for face in faces if face['bytes'] is None),
+        'declared_faces': len(declared_faces),
+        'unused_faces': sorted({face.url for face in declared_faces if id(face) not in downloaded and face.url}),
+        'duplicate_faces': duplicates,
+        'wasted_preloads': sorted(str(path) for path in preloaded - downloaded_paths),
+        'external_stylesheets': external,
+        'blocking': list(dict.fromkeys(blocking)),
+        'declared': declared_faces
+    }
+
+def parse_byte_size(value):
+    """'150KB' -> 150000 ; un entier est pris tel quel"""
+    if isinstance(value, (int, float)):
+        return int(value)
+    match = re.match(r'^\s*([\d.]+)\s*([KMk]?i?[Bb]?)\s*$', str(value))
+    if not match:
+        raise ValueError(f"Taille invalide: {value}")
+    unit = match.group(2).upper() or 'B'
+    if not unit.endswith('B'):
+        unit += 'B'
+    return int(float(match.group(1)) * SIZE_MULTIPLIERS[unit])
+
+def load_font_budget(config_path):
+    """Budget d'octets de polices par page (section optimization.fonts du projet web)"""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    budget = config.get('optimization', {}).get('fonts', {}).get('max_bytes_per_page')
+    return parse_byte_size(budget) if budget is not None else None
+
+def iter_pages(inputs):
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            yield from sorted(f for f in path.rglob('*') if f.suffix.lower() in PAGE_EXTENSIONS and f.is_file())
+        elif path.is_file():
+            yield path
+        else:
+            yield from (Path(match) for match in sorted(glob.glob(item, recursive=True))
+                        if Path(match).suffix.lower() in PAGE_EXTENSIONS)
+
+def build_site_report(pages, budget=None, site_root=None):
+    """Rapport par page et synthèse du site (faces jamais utilisées, fichiers dupliqués)"""
+    stylesheet_cache = StylesheetCache(site_root)
+    reports = []
+    declared = {}
+    used_urls = set()
+
+    for page in pages:
+        report = analyze_page(page, stylesheet_cache)
+        for face in report.pop('declared'):
+            if face.path:
+                declared.setdefault(face.path, face)
+        used_urls.update(face['path'] for face in report['faces'] if face['path'])
+        report['over_budget'] = budget is not None and report['font_bytes'] > budget
+        reports.append(report)
+
+    # Même contenu publié sous plusieurs noms : le cache navigateur ne le partage pas
+    by_hash = {}
+    for path in declared:
+        if path.exists():
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            by_hash.setdefault(digest, []).append(str(path))
+
+    return {
+        'budget': budget,
+        'pages': reports,
+        'site': {
+            'pages': len(reports),
+            'over_budget': sum(1 for report in reports if report['over_budget']),
+            'max_font_bytes': max((report['font_bytes'] for report in reports), default=0),
+            'never_used_faces': sorted(str(path) for path in declared if str(path) not in used_urls),
+            'duplicate_files': [paths for paths in by_hash.values() if len(paths) > 1]
+        }
+    }
+
+def format_site_report(site_report):
+    lines = []
+    budget = site_report['budget']
+    for report in site_report['pages']:
+        flag = '✗' if report['over_budget'] else '✓'
+        limit = f" / budget {budget}" if budget is not None else ''
+        lines.append(f"{flag} {report['page']}: {report['font_bytes']} octets de polices{limit}, "
+                     f"{len(report['faces'])}/{report['declared_faces']} faces téléchargées")
+        for face in report['faces']:
+            size = face['bytes'] if face['bytes'] is not None else '?'
+            lines.append(f"    {face['family']} {face['weight']} {face['style']}: {face['url']} ({size} octets)")
+        for label, key in (("Faces inutilisées", 'unused_faces'), ("Doublons", 'duplicate_faces'),
+                           ("Préchargements inutiles", 'wasted_preloads'), ("Rendu bloquant", 'blocking')):
+            for item in report[key]:
+                lines.append(f"    ! {label}: {item}")
+
+    site = site_report['site']
+    lines.append("")
+    lines.append(f"Pages: {site['pages']}, hors budget: {site['over_budget']}, "
+                 f"maximum: {site['max_font_bytes']} octets")
+    for path in site['never_used_faces']:
+        lines.append(f"  Face jamais téléchargée: {path}")
+    for paths in site['duplicate_files']:
+        lines.append(f"  Fichiers identiques: {', '.join(paths)}")
+    return '\n'.join(lines)
+
+def main():
+    """Point d'entrée principal"""
+    parser = argparse.ArgumentParser(description="Rapport statique de chargement des polices web")
+    parser.add_argument('inputs', nargs='+', help='Pages HTML, dossiers ou motifs glob')
+    parser.add_argument('--config', help='web_project_config.json (budget optimization.fonts.max_bytes_per_page)')
+    parser.add_argument('--budget', help='Budget par page, ex: 150KB (prioritaire sur --config)')
+    parser.add_argument('--root', help='Racine du site pour les URL absolues (défaut : premier dossier analysé)')
+    parser.add_argument('--output', '-o', help='Rapport JSON')
+    parser.add_argument('--fail-on-budget', action='store_true',
+                        help='Code de sortie 1 si une page dépasse le budget (CI)')
+
+    args = parser.parse_args()
+
+    try:
+        budget = parse_byte_size(args.budget) if args.budget else None
+        if budget is None and args.config:
+            budget = load_font_budget(args.config)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Erreur: {e}")
+        sys.exit(1)
+
+    pages = list(iter_pages(args.inputs))
+    if not pages:
+        print("Aucune page HTML trouvée")
+        sys.exit(1)
+
+    site_root = args.root or next((item for item in args.inputs if Path(item).is_dir()), None)
+    site_report = build_site_report(pages, budget, site_root)
+    print(format_site_report(site_report))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(site_report, f, indent=2, ensure_ascii=False)
+        print(f"\nRapport sauvegardé: {args.output}")
+
+    if args.fail_on_budget and site_report['site']['over_budget']:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Service local de sous-ensemble de polices à la demande
+Usage: python font_server.py polices/ --port 8765
+
+GET /fonts/<id>.woff2?text=Bonjour        -> WOFF2 réduit aux caractères du texte
+GET /fonts/<id>.woff2?range=U+0000-00FF   -> WOFF2 réduit à la plage unicode
+GET /fonts                                -> polices disponibles
+GET /stats                                -> compteurs du cache
+
+Les sous-ensembles sont mis en cache en mémoire (LRU bornée en octets) puis sur
+disque ; les requêtes simultanées sur une même clé froide ne la calculent qu'une fois.
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from pathlib import Path
+from urllib.parse import urlsplit, parse_qs
+
+from batch_optimizer import (FontSource, WOFF2_OPTIONS, build_woff2_options, format_unicode_range,
+                             parse_unicode_range, save_woff2, subset_font)
+
+FONT_EXTENSIONS = {'.ttf', '.otf'}
+MAX_TEXT_LENGTH = 10000
+CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+class UnknownFontError(KeyError):
+    """Identifiant de police absent de la bibliothèque"""
+
+def default_cache_dir(fonts_dir):
+    """Cache disque hors de la bibliothèque de polices (sinon analysé comme polices par les outils)
+
+    ~/.cache/font_server/<empreinte du dossier> (ou $XDG_CACHE_HOME), un dossier par bibliothèque.
+    """
+    base = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+    digest = hashlib.sha256(str(Path(fonts_dir).resolve()).encode()).hexdigest()[:16]
+    return base / 'font_server' / digest
+
+class LRUByteCache:
+    """Cache LRU en mémoire borné par la taille totale des valeurs"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+            return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            self._entries[key] = data
+            self.size += len(data)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def __len__(self):
+        return len(self._entries)
+
+class SubsetService:
+    """Sous-ensembles WOFF2 à la demande : mémoire, puis disque, puis calcul unique par clé"""
+
+    def __init__(self, fonts_dir, cache_dir=None, memory_bytes=64 << 20, woff2_options=None):
+        self.fonts_dir = Path(fonts_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir(self.fonts_dir)
+        self.woff2_options = woff2_options or WOFF2_OPTIONS
+        self.memory = LRUByteCache(memory_bytes)
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'builds': 0, 'coalesced': 0, 'errors': 0}
+
+        self._font_paths = {path.stem: path for path in sorted(self.fonts_dir.iterdir())
+                            if path.suffix.lower() in FONT_EXTENSIONS}
+        self._fonts = {}
+        self._loading = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._options_tag = json.dumps(self.woff2_options, sort_keys=True)
+
+    def font_ids(self):
+        return list(self._font_paths)
+
+    def _load_font(self, font_id):
+        """FontSource entièrement décompilée : les copies concurrentes ne la modifient plus
+
+        L'analyse se fait hors du verrou global : un chargement à froid ne bloque
+        que les requêtes sur la même police, qui attendent son résultat.
+        """
+        with self._lock:
+            entry = self._fonts.get(font_id)
+            if entry is not None:
+                return entry
+            path = self._font_paths.get(font_id)
+            if path is None:
+                raise UnknownFontError(font_id)
+            future = self._loading.get(font_id)
+            leader = future is None
+            if leader:
+                future = self._loading[font_id] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            source = FontSource(path)
+            source.font.ensureDecompiled()
+            entry = {
+                'source': source,
+                'cmap': frozenset(source.font.getBestCmap() or {}),
+                'sha256': hashlib.sha256(source.data).hexdigest()
+            }
+            with self._lock:
+                self._fonts[font_id] = entry
+            future.set_result(entry)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._loading[font_id]
+        return entry
+
+    def resolve(self, font_id, text=None, unicode_range=None):
+        """Clé de cache et points de code couverts par la requête"""
+        font = self._load_font(font_id)
+
+        requested = set()
+        if text:
+            requested.update(ord(char) for char in text)
+        if unicode_range:
+            requested.update(parse_unicode_range(unicode_range))
+
+        # Deux requêtes couvrant les mêmes glyphes partagent le même sous-ensemble
+        covered = font['cmap'].intersection(requested)
+        if not covered:
+            raise ValueError("Aucun caractère demandé n'est présent dans la police")
+
+        key = hashlib.sha256(
+            f"{font['sha256']}|{format_unicode_range(covered)}|{self._options_tag}".encode()
+        ).hexdigest()
+        return key, covered
+
+    def get_subset(self, font_id, text=None, unicode_range=None):
+        """Octets WOFF2 du sous-ensemble et clé de cache (utilisée comme ETag)"""
+        key, covered = self.resolve(font_id, text, unicode_range)
+
+        data = self.memory.get(key)
+        if data is not None:
+            self._count('memory_hits')
+            return data, key
+
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+
+        if not leader:
+            self._count('coalesced')
+            return future.result(), key
+
+        try:
+            data = self._read_disk(key)
+            if data is not None:
+                self._count('disk_hits')
+            else:
+                data = self._build(font_id, covered)
+                self._write_disk(key, data)
+                self._count('builds')
+            self.memory.put(key, data)
+            future.set_result(data)
+        except Exception as e:
+            self._count('errors')
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+        return data, key
+
+    def _count(self, name):
+        # Compteurs mis à jour par les fils du serveur HTTP
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def snapshot_stats(self):
+        with self._stats_lock:
+            return dict(self.stats)
+
+    def _build(self, font_id, covered):
+        font = subset_font(self._load_font(font_id)['source'], covered)
+        buffer = BytesIO()
+        save_woff2(font, buffer, self.woff2_options)
+        return buffer.getvalue()
+
+    def _disk_path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.woff2"
+
+    def _read_disk(self, key):
+        try:
+            with open(self._disk_path(key), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _write_disk(self, key, data):
+        """Écriture atomique : un lecteur concurrent ne voit jamais de fichier partiel"""
+        path = self._disk_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+class SubsetRequestHandler(BaseHTTPRequestHandler):
+    """Routes HTTP du service (connexions persistantes HTTP/1.1)"""
+
+    protocol_version = 'HTTP/1.1'
+    service = None
+    verbose = False
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+
+        if url.path == '/stats':
+            stats = dict(self.service.snapshot_stats(), memory_entries=len(self.service.memory),
+                         memory_bytes=self.service.memory.size)
+            return self._send_json(200, stats)
+        if url.path.rstrip('/') == '/fonts':
+            return self._send_json(200, {'fonts': self.service.font_ids()})
+        if not (url.path.startswith('/fonts/') and url.path.endswith('.woff2')):
+            return self._send_json(404, {'error': 'Route inconnue'})
+
+        font_id = url.path[len('/fonts/'):-len('.woff2')]
+        query = parse_qs(url.query)
+        text = query.get('text', [''])[0]
+        # parse_qs décode « + » en espace : U+0041 non encodé arrive sous la forme « U 0041 »
+        unicode_range = query.get('range', [''])[0].replace('U ', 'U+').replace('u ', 'u+')
+
+        if not text and not unicode_range:
+            return self._send_json(400, {'error': 'Paramètre text ou range requis'})
+        if len(text) > MAX_TEXT_LENGTH:
+            return self._send_json(413, {'error': f'Texte limité à {MAX_TEXT_LENGTH} caractères'})
+
+        try:
+            data, key = self.service.get_subset(font_id, text, unicode_range)
+        except UnknownFontError:
+            return self._send_json(404, {'error': f'Police inconnue: {font_id}'})
+        except ValueError as e:
+            return self._send_json(400, {'error': str(e)})
+        except Exception as e:
+            return self._send_json(500, {'error': str(e)})
+
+        etag = f'"{key}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'font/woff2')
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('Cache-Control', CACHE_CONTROL)
+        self.send_header('ETag', etag)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.verbose:
+            super().log_message(format, *args)
+
+def benchmark_service(service, font_id, texts, requests_count=1000):
+    """Latences (ms) des requêtes servies depuis le cache mémoire"""
+    for text in texts:
+        service.get_subset(font_id, text)
+
+    durations = []
+    for index in range(requests_count):
+        start = time.perf_counter()
+        service.get_subset(font_id, texts[index % len(texts)])
+        durations.append((time.perf_counter() - start) * 1000)
+
+    durations.sort()
+    return {
+        'requests': requests_count,
+        'p50_ms': durations[len(durations) // 2],
+        'p99_ms': durations[int(len(durations) * 0.99)],
+        'max_ms': durations[-1]
+    }
+
+def main():
+    """Point d'entrée principal"""
+    parser = argparse.ArgumentParser(description="Service de sous-ensemble de polices à la demande")
+    parser.add_argument('fonts_dir', help='Dossier des polices (identifiant = nom du fichier sans extension)')
+    parser.add_argument('--host', default='127.0.0.1', help='Adresse d\'écoute')
+    parser.add_argument('--port', type=int, default=8765, help='Port d\'écoute')
+    parser.add_argument('--cache-dir', help='Cache disque (défaut : ~/.cache/font_server/<empreinte de fonts_dir>)')
+    parser.add_argument('--memory-mb', type=int, default=64, help='Taille du cache mémoire en Mo')
+    parser.add_argument('--woff2-quality', type=int, default=WOFF2_OPTIONS['quality'],
+                        help='Qualité Brotli, de 0 (rapide) à 11 (compact)')
+    parser.add_argument('--woff2-transform', default=','.join(WOFF2_OPTIONS['transform_tables']),
+                        help="Tables à transformer en WOFF2 (glyf,loca / hmtx / none)")
+    parser.add_argument('--benchmark', metavar='ID_POLICE',
+                        help='Mesure les latences du cache chaud pour cette police puis quitte')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Journalise chaque requête')
+
+    args = parser.parse_args()
+
+    try:
+        transform = [t.strip() for t in args.woff2_transform.split(',') if t.strip() not in ('', 'none')]
+        woff2_options = build_woff2_options(args.woff2_quality, transform)
+        service = SubsetService(args.fonts_dir, args.cache_dir, args.memory_mb << 20, woff2_options)
+    except (OSError, ValueError) as e:
+        print(f"Erreur: {e}")
+        sys.exit(1)
+
+    if args.benchmark:
+        texts = ['Bonjour', 'Hello World', 'Typographie 2024', 'Äpfel & Öl', 'ABCDEFGHIJ']
+        try:
+            results = benchmark_service(service, args.benchmark, texts)
+        except UnknownFontError:
+            print(f"Police inconnue: {args.benchmark}")
+            sys.exit(1)
+        print(f"Cache chaud ({results['requests']} requêtes): p50 {results['p50_ms']:.3f} ms, "
+              f"p99 {results['p99_ms']:.3f} ms, max {results['max_ms']:.3f} ms")
+        return
+
+    SubsetRequestHandler.service = service
+    SubsetRequestHandler.verbose = args.verbose
+    server = ThreadingHTTPServer((args.host, args.port), SubsetRequestHandler)
+    server.daemon_threads = True
+
+    print(f"Service de polices sur http://{args.host}:{args.port}/fonts ({len(service.font_ids())} polices)")
+    print(f"Cache disque: {service.cache_dir}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nArrêt du service")
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Profileur d'usage des caractères pour le sous-ensemble des polices web
+Usage: python glyph_profiler.py corpus/ --output glyph_profile.json
+
+Parcourt de gros corpus texte/HTML/JSON par blocs et construit un histogramme
+des points de code par locale, exploitable par batch_optimizer.py (--subset-profile).
+La mémoire reste bornée quel que soit le fichier : le HTML comme le JSON sont
+analysés en flux, sans document chargé en entier.
+"""
+
+import re
+import sys
+import html
+import glob
+import json
+import time
+import codecs
+import argparse
+from collections import Counter
+from pathlib import Path
+
+from batch_optimizer import format_unicode_range
+
+CHUNK_SIZE = 1 << 20  # 1 Mo par lecture : mémoire bornée quelle que soit la taille du fichier
+
+TEXT_EXTENSIONS = {'.txt', '.md', '.csv', '.po', '.srt'}
+HTML_EXTENSIONS = {'.html', '.htm', '.xhtml', '.svg', '.xml'}
+JSON_EXTENSIONS = {'.json', '.jsonl', '.ndjson'}
+
+# Segment de chemin reconnu comme locale : fr, en-US, pt_BR, zh-Hant...
+LOCALE_PATTERN = re.compile(r'^[a-z]{2,3}(?:[-_][A-Za-z]{2,4})?$')
+
+# Balises du HTML : blocs script/style et commentaires ignorés en entier,
+# les autres balises ne contribuent que par leurs attributs affichés
+HTML_TOKEN = re.compile(
+    r'(?P<block><(?P<raw>script|style)\b[^>]*>.*?</(?P=raw)\s*>)'
+    r'|(?P<comment><!--.*?-->)'
+    r'|(?P<unclosed><(?:script|style)\b|<!--)'
+    r'|(?P<tag><[^>]*>)',
+    re.S | re.I)
+HTML_VISIBLE_ATTRIBUTE = re.compile(r'\b(?:alt|title|placeholder)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')', re.I)
+MAX_HTML_CARRY = 16 * CHUNK_SIZE
+
+# Chaîne JSON complète ; le « : » qui suit désigne une clé
+JSON_STRING = re.compile(r'"([^"\\]*(?:\\.[^"\\]*)*)"\s*(:?)', re.S)
+JSON_STRING_TAIL = re.compile(r'([^"\\]*(?:\\.[^"\\]*)*)"', re.S)
+JSON_ESCAPE_TAIL = re.compile(r'\\(?:u[dD][89abAB][0-9a-fA-F]{2}(?:\\u?[0-9a-fA-F]{0,3})?|u[0-9a-fA-F]{0,3})?$')
+MAX_JSON_CARRY = 16 * CHUNK_SIZE
+
+class _HTMLTextStream:
+    """Extrait le texte visible d'un flux HTML bloc par bloc (expressions régulières, sans DOM)"""
+
+    def __init__(self, on_text):
+        self.on_text = on_text
+        self.pending = ''
+
+    def feed(self, chunk):
+        data = self.pending + chunk
+        position = 0
+
+        for match in HTML_TOKEN.finditer(data):
+            if match.group('unclosed'):
+                # Bloc script/style ou commentaire non terminé : repris au bloc suivant
+                break
+            self._emit(data[position:match.start()])
+            tag = match.group('tag')
+            if tag and '=' in tag:
+                for double, single in HTML_VISIBLE_ATTRIBUTE.findall(tag):
+                    self._emit(double or single)
+            position = match.end()
+        else:
+            # Balise coupée en fin de bloc : conservée pour le bloc suivant
+            cut = data.find('<', position)
+            if cut == -1:
+                # Entité (&eacute;) éventuellement coupée en fin de bloc
+                cut = len(data)
+                ampersand = data.rfind('&', max(position, cut - 32))
+                if ampersand != -1 and ';' not in data[ampersand:]:
+                    cut = ampersand
+            self._emit(data[position:cut])
+            position = cut
+
+        self.pending = data[position:]
+        if len(self.pending) > MAX_HTML_CARRY:
+            # HTML mal formé : on abandonne le fragment plutôt que de grossir sans fin
+            self.pending = ''
+
+    def close(self):
+        if self.pending and not HTML_TOKEN.match(self.pending):
+            self._emit(self.pending)
+        self.pending = ''
+
+    def _emit(self, text):
+        if text:
+            self.on_text(html.unescape(text) if '&' in text else text)
+
+class _JSONStringStream:
+    """Extrait les chaînes d'un flux JSON ou JSON Lines bloc par bloc, clés exclues
+
+    Seules les chaînes sont analysées (le reste n'est que ponctuation, nombres et
+    littéraux) : aucun document n'est chargé en entier. Une chaîne plus longue que
+    MAX_JSON_CARRY est comptée par morceaux, comme une valeur.
+    """
+
+    def __init__(self, on_text):
+        self.on_text = on_text
+        self.pending = ''
+        self.in_string = False
+
+    def feed(self, chunk, final=False):
+        data = self.pending + chunk
+        self.pending = ''
+        position = 0
+
+        if self.in_string:
+            match = JSON_STRING_TAIL.match(data)
+            if match is None:
+                self._emit_partial(data)
+                return
+            self._emit(match.group(1))
+            self.in_string = False
+            position = match.end()
+
+        # Hors chaîne, chaque guillemet ouvre une chaîne : les valeurs du bloc sont
+        # réunies pour un seul comptage
+        values = []
+        cut = None
+        for match in JSON_STRING.finditer(data, position):
+            if data.find('"', position, match.start()) != -1:
+                # Chaîne non terminée : finditer a repris à l'intérieur
+                break
+            if not final and not match.group(2) and match.end() == len(data):
+                # Clé possible : le « : » éventuel est dans le bloc suivant
+                cut = match.start()
+                break
+            if not match.group(2):
+                values.append(match.group(1))
+            position = match.end()
+        self._emit(''.join(values))
+
+        start = data.find('"', position) if cut is None else cut
+        if start == -1:
+            return
+        if cut is None and len(data) - start > MAX_JSON_CARRY:
+            self.in_string = True
+            self._emit_partial(data[start + 1:])
+        else:
+            self.pending = data[start:]
+
+    def close(self):
+        self.feed('', final=True)
+        if self.pending:
+            # Document tronqué : la chaîne non terminée compte quand même
+            self._emit(self.pending[1:])
+        self.pending = ''
+        self.in_string = False
+
+    def _emit_partial(self, text):
+        # Échappement (\n, \u00e9, paire \ud83d\ude00...) coupé en fin de morceau :
+        # conservé pour le bloc suivant
+        match = JSON_ESCAPE_TAIL.search(text)
+        if match and (match.start() - len(text[:match.start()].rstrip('\\'))) % 2 == 0:
+            text, self.pending = text[:match.start()], match.group(0)
+        self._emit(text)
+
+    def _emit(self, text):
+        if '\\' in text:
+            try:
+                text = json.loads(f'"{text}"', strict=False)
+            except ValueError:
+                pass  # Échappement invalide : texte brut
+        if text:
+            self.on_text(text)
+
+class GlyphUsageProfile:
+    """Histogrammes de points de code par locale"""
+
+    def __init__(self):
+        self.histograms = {}
+        self.files = Counter()
+        self.bytes_read = 0
+
+    def add_text(self, locale, text):
+        """Comptabilise un fragment de texte (Counter compte en C, sans boucle Python)"""
+        histogram = self.histograms.get(locale)
+        if histogram is None:
+            histogram = self.histograms[locale] = Counter()
+        histogram.update(text)
+
+    def scan_file(self, path, locale):
+        """Lit un fichier par blocs et alimente l'histogramme de sa locale"""
+        path = Path(path)
+        suffix = path.suffix.lower()
+        self.files[locale] += 1
+
+        if suffix in HTML_EXTENSIONS:
+            parser = _HTMLTextStream(lambda text: self.add_text(locale, text))
+            for chunk in self._iter_chunks(path):
+                parser.feed(chunk)
+            parser.close()
+        elif suffix in JSON_EXTENSIONS:
+            # Seules les chaînes JSON (clés exclues) sont comptées, en flux comme le HTML
+            parser = _JSONStringStream(lambda text: self.add_text(locale, text))
+            for chunk in self._iter_chunks(path):
+                parser.feed(chunk)
+            parser.close()
+        else:
+            for chunk in self._iter_chunks(path):
+                self.add_text(locale, chunk)
+
+    def _iter_chunks(self, path):
+        """Blocs de texte décodés ; le décodeur incrémental gère les séquences UTF-8 coupées"""
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        with open(path, 'rb') as f:
+            while True:
+                raw = f.read(CHUNK_SIZE)
+                self.bytes_read += len(raw)
+                if not raw:
+                    break
+                yield decoder.decode(raw)
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
+
+    def merge(self, other):
+        """Fusionne un autre profil (utile pour paralléliser par lots de fichiers)"""
+        for locale, histogram in other.histograms.items():
+            self.histograms.setdefault(locale, Counter()).update(histogram)
+        self.files.update(other.files)
+        self.bytes_read += other.bytes_read
+
+    def codepoints(self, locale, coverage=1.0):
+        """Points de code nécessaires pour couvrir la proportion d'occurrences demandée"""
+        histogram = self.histograms.get(locale, Counter())
+        # Caractères de contrôle et espaces exclus, l'espace simple est toujours gardé
+        counts = [(ord(char), count) for char, count in histogram.items()
+                  if char == ' ' or (char.isprintable() and not char.isspace())]
+        counts.sort(key=lambda item: -item[1])
+
+        total = sum(count for _, count in counts)
+        selected = set()
+        running = 0
+        for codepoint, count in counts:
+            if total and running / total >= coverage:
+                break
+            selected.add(codepoint)
+            running += count
+        return selected
+
+    def to_dict(self, coverage=1.0):
+        """Profil sérialisable : histogramme trié et unicode-range par locale"""
+        locales = {}
+        for locale in sorted(self.histograms):
+            histogram = self.histograms[locale]
+            selected = self.codepoints(locale, coverage)
+            locales[locale] = {
+                'files': self.files[locale],
+                'total_chars': sum(histogram.values()),
+                'distinct_chars': len(histogram),
+                'selected_chars': len(selected),
+                'unicode_range': format_unicode_range(selected),
+                'histogram': [[ord(char), count] for char, count in sorted(histogram.items())]
+            }
+        return {'coverage': coverage, 'bytes_read': self.bytes_read, 'locales': locales}
+
+def detect_locale(path, root, default='und'):
+    """Locale déduite du premier segment de chemin qui ressemble à un code de langue"""
+    try:
+        parts = Path(path).relative_to(root).parts[:-1]
+    except ValueError:
+        parts = Path(path).parts[:-1]
+    for part in parts:
+        if LOCALE_PATTERN.match(part):
+            return part.replace('_', '-')
+    return default
+
+def iter_corpus_files(inputs):
+    """(fichier, racine) pour chaque document du corpus, dans un ordre stable"""
+    extensions = TEXT_EXTENSIONS | HTML_EXTENSIONS | JSON_EXTENSIONS
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            files = sorted(f for f in path.rglob('*') if f.suffix.lower() in extensions and f.is_file())
+            for f in files:
+                yield f, path
+        elif path.is_file():
+            yield path, path.parent
+        else:
+            for match in sorted(glob.glob(item, recursive=True)):
+                if Path(match).suffix.lower() in extensions:
+                    yield Path(match), Path('.')
+
+def compare_woff2_savings(font_path, codepoints, baseline_profile='latin'):
+    """Taille WOFF2 du sous-ensemble corpus comparée au sous-ensemble par profil fixe"""
+    import tempfile
+    from batch_optimizer import FontSource, UNICODE_PROFILES, optimize_font_for_web
+
+    source = FontSource(font_path)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        plan = {'baseline': UNICODE_PROFILES[baseline_profile],
+                'corpus': format_unicode_range(codepoints)}
+        shards = optimize_font_for_web(source, Path(tmp_dir) / 'compare', plan)
+        sizes = {shard['name']: Path(shard['path']).stat().st_size for shard in shards}
+
+    baseline = sizes.get('baseline', 0)
+    corpus = sizes.get('corpus', 0)
+    return {
+        'baseline_profile': baseline_profile,
+        'baseline_bytes': baseline,
+        'corpus_bytes': corpus,
+        'savings_percent': round((1 - corpus / baseline) * 100, 1) if baseline else 0
+    }
+
+def main():
+    """Point d'entrée principal"""
+    parser = argparse.ArgumentParser(description="Profileur d'usage des caractères d'un corpus")
+    parser.add_argument('inputs', nargs='+', help='Dossiers, fichiers ou motifs glob du corpus')
+    parser.add_argument('--output', '-o', default='glyph_profile.json', help='Profil JSON généré')
+    parser.add_argument('--locale', help='Force une locale unique (sinon déduite des dossiers : fr/, en-US/...)')
+    parser.add_argument('--coverage', type=float, default=1.0,
+                        help="Part des occurrences à couvrir (ex: 0.9999 ignore les caractères rarissimes)")
+    parser.add_argument('--compare-font', help='Police pour mesurer le gain WOFF2 face au sous-ensemble fixe')
+    parser.add_argument('--baseline', default='latin', help='Profil fixe de référence pour --compare-font')
+
+    args = parser.parse_args()
+
+    print("Profilage du corpus")
+    print("=" * 50)
+
+    profile = GlyphUsageProfile()
+    start = time.perf_counter()
+    file_count = 0
+
+    for path, root in iter_corpus_files(args.inputs):
+        locale = args.locale or detect_locale(path, root)
+        try:
+            profile.scan_file(path, locale)
+        except (OSError, ValueError) as e:
+            print(f"  ✗ {path}: {e}")
+            continue
+        file_count += 1
+        if file_count % 1000 == 0:
+            print(f"  {file_count} fichiers, {profile.bytes_read / 1e6:.1f} Mo lus")
+
+    elapsed = time.perf_counter() - start
+    if not file_count:
+        print("Aucun fichier de corpus trouvé")
+        sys.exit(1)
+
+    data = profile.to_dict(args.coverage)
+
+    if args.compare_font:
+        data['woff2_comparison'] = {}
+        for locale in data['locales']:
+            data['woff2_comparison'][locale] = compare_woff2_savings(
+                args.compare_font, profile.codepoints(locale, args.coverage), args.baseline)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+    print(f"{file_count} fichiers, {profile.bytes_read / 1e6:.1f} Mo en {elapsed:.2f}s "
+          f"({profile.bytes_read / 1e6 / elapsed if elapsed > 0 else 0:.1f} Mo/s)")
+    for locale, info in data['locales'].items():
+        print(f"  {locale}: {info['distinct_chars']} caractères distincts, "
+              f"{info['selected_chars']} retenus ({info['files']} fichiers)")
+        comparison = data.get('woff2_comparison', {}).get(locale)
+        if comparison:
+            print(f"    WOFF2: {comparison['corpus_bytes']} octets contre {comparison['baseline_bytes']} "
+                  f"({comparison['baseline_profile']}), gain {comparison['savings_percent']}%")
+    print(f"\nProfil généré: {args.output}")
+
+if __name__ == "__main__":
+    main()
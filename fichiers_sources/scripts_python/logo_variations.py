@@ -13,6 +13,10 @@ from pathlib import Path
 import random
 import colorsys
 
+import numpy as np
+
+from color_engine import hex_to_hsl, hsl_to_hex
+
 class LogoVariationGenerator:
     def __init__(self, input_svg):
         self.input_svg = input_svg
@@ -24,27 +28,30 @@ class LogoVariationGenerator:
         """Génère des variations de couleurs harmonieuses"""
         variations = []
 
-        for i in range(variation_count):
-            variation = {}
-
-            for color_name, hex_color in base_colors.items():
-                # Conversion hex vers HSL pour manipulation
-                hsl = self._hex_to_hsl(hex_color)
+        # Conversion hex vers HSL de toutes les couleurs d'origine en une passe
+        originals = list(base_colors)
+        if not originals:
+            return [{} for _ in range(variation_count)]
+        hsl = hex_to_hsl(originals)
 
-                # Variations subtiles
-                if i == 0:
-                    # Version plus claire
-                    new_hsl = (hsl[0], hsl[1] * 0.8, min(1.0, hsl[2] * 1.2))
-                elif i == 1:
-                    # Version plus foncée
-                    new_hsl = (hsl[0], hsl[1] * 1.2, hsl[2] * 0.8)
-                else:
-                    # Version avec teinte modifiée
-                    new_hsl = ((hsl[0] + 30) % 360, hsl[1], hsl[2])
+        for i in range(variation_count):
+            new_hsl = hsl.copy()
 
-                variation[color_name] = self._hsl_to_hex(new_hsl)
+            # Variations subtiles
+            if i == 0:
+                # Version plus claire
+                new_hsl[:, 1] *= 0.8
+                new_hsl[:, 2] = np.minimum(1.0, hsl[:, 2] * 1.2)
+            elif i == 1:
+                # Version plus foncée
+                new_hsl[:, 1] = np.minimum(1.0, hsl[:, 1] * 1.2)
+                new_hsl[:, 2] *= 0.8
+            else:
+                # Version avec teinte modifiée
+                new_hsl[:, 0] = (hsl[:, 0] + 30) % 360
 
-            variations.append(variation)
+            # Couleur d'origine -> nouvelle couleur, pour _apply_colors
+            variations.append(dict(zip(originals, hsl_to_hex(new_hsl).tolist())))
 
         return variations
 
@@ -153,58 +160,6 @@ class LogoVariationGenerator:
                 svg.set('width', str(size))
                 svg.set('height', str(size))
 
-    def _hex_to_hsl(self, hex_color):
-        """Convertit hex en HSL"""
-        hex_color = hex_color.lstrip('#')
-        r = int(hex_color[0:2], 16) / 255.0
-        g = int(hex_color[2:4], 16) / 255.0
-        b = int(hex_color[4:6], 16) / 255.0
-
-        max_val = max(r, g, b)
-        min_val = min(r, g, b)
-        diff = max_val - min_val
-
-        # Lightness
-        l = (max_val + min_val) / 2
-
-        if diff == 0:
-            h = s = 0
-        else:
-            s = diff / (2 - max_val - min_val) if l > 0.5 else diff / (max_val + min_val)
-
-            if max_val == r:
-                h = (60 * ((g - b) / diff) + 360) % 360
-            elif max_val == g:
-                h = (60 * ((b - r) / diff) + 120) % 360
-            else:
-                h = (60 * ((r - g) / diff) + 240) % 360
-
-        return (h, s, l)
-
-    def _hsl_to_hex(self, hsl):
-        """Convertit HSL en hex"""
-        h, s, l = hsl
-
-        if s == 0:
-            r = g = b = int(l * 255)
-        else:
-            def hue_to_rgb(p, q, t):
-                if t < 0: t += 1
-                if t > 1: t -= 1
-                if t < 1/6: return p + (q - p) * 6 * t
-                if t < 1/2: return q
-                if t < 2/3: return p + (q - p) * (2/3 - t) * 6
-                return p
-
-            q = l * (1 + s) if l < 0.5 else l + s - l * s
-            p = 2 * l - q
-
-            r = hue_to_rgb(p, q, h / 360 + 1/3)
-            g = hue_to_rgb(p, q, h / 360)
-            b = hue_to_rgb(p, q, h / 360 - 1/3)
-
-        return f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
-
     def save_variation(self, svg_element, filename, colors=None):
         """Sauvegarde une variation SVG"""
         if colors:
@@ -255,7 +210,7 @@ class LogoVariationGenerator:
         for color_var in color_variations:
             for style_var in style_variations:
                 for comp_var in composition_variations:
-                    filename = output_path / f"variation_{variation_index"03d"}.svg"
+                    filename = output_path / f"variation_{variation_index:03d}.svg"
 
                     # Appliquer les couleurs à la variation de style
                     working_svg = ET.fromstring(ET.tostring(style_var))
@@ -266,7 +221,7 @@ class LogoVariationGenerator:
                         'index': variation_index,
                         'filename': filename.name,
                         'colors': color_var,
-                        'style': 'outline' if 'stroke' in ET.tostring(style_var) else 'filled'
+                        'style': 'outline' if 'stroke' in ET.tostring(style_var, encoding='unicode') else 'filled'
                     })
 
                     variation_index += 1
@@ -345,15 +300,14 @@ def main():
     print(f"📊 Rapport détaillé: {report_file}")
 
     # Affichage d'un résumé
-    print("
-Variations créées:"    for var in variations[:5]:  # Afficher les 5 premières
+    print("\nVariations créées:")
+    for var in variations[:5]:  # Afficher les 5 premières
         print(f"  - {var['filename']} ({var['style']})")
 
     if len(variations) > 5:
         print(f"  ... et {len(variations) - 5} autres")
 
-    print("
-💡 Conseils d'utilisation:")
+    print("\n💡 Conseils d'utilisation:")
     print(f"  - Utilisez les variations comme base pour vos projets")
     print(f"  - Testez chaque variation dans son contexte d'usage")
     print(f"  - Conservez les variations prometteuses pour itération")
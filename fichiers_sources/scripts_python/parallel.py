@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Pool de processus partagé par les traitements par lots
+
+batch_optimizer.py, font_analyzer.py, color_generator.py et accessibility_crawl.py
+répartissent leurs éléments (polices, blocs de marques, fichiers) sur un
+ProcessPoolExecutor avec les mêmes garanties :
+- résultats produits dans l'ordre d'entrée, au fil de l'eau ;
+- nombre de tâches en vol borné : la mémoire ne dépend pas du nombre d'éléments ;
+- un élément qui échoue, ou dont le processus de travail meurt (mémoire, signal...),
+  devient un résultat d'erreur au lieu d'interrompre le lot. Après la mort d'un
+  processus le pool est inutilisable : les éléments restants sont en erreur.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+def iter_pool_results(fn, items, jobs, on_error, max_in_flight=None):
+    """fn(élément) pour chaque élément, dans l'ordre d'entrée, sur jobs processus
+
+    fn doit être sérialisable (fonction de module ou functools.partial) ;
+    on_error(élément, exception) construit le résultat d'un élément en échec.
+    Au plus max_in_flight tâches en vol (jobs * 2 par défaut). Avec jobs <= 1,
+    fn est appelée dans le processus courant et ses exceptions remontent.
+    """
+    if jobs <= 1:
+        for item in items:
+            yield fn(item)
+        return
+
+    max_in_flight = max_in_flight or jobs * 2
+    pending = deque()
+    item_iter = iter(items)
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        def submit(item):
+            try:
+                return executor.submit(fn, item)
+            except BrokenProcessPool as e:
+                # Pool inutilisable après la mort d'un processus : les éléments restants sont en erreur
+                failed = Future()
+                failed.set_exception(e)
+                return failed
+
+        for item in item_iter:
+            pending.append((item, submit(item)))
+            if len(pending) >= max_in_flight:
+                break
+
+        while pending:
+            item, future = pending.popleft()
+            try:
+                yield future.result()
+            except Exception as e:
+                yield on_error(item, e)
+
+            for next_item in item_iter:
+                pending.append((next_item, submit(next_item)))
+                break
+
+def error_message(error):
+    """'Type: message' d'une exception, pour les résultats en erreur"""
+    return f"{type(error).__name__}: {error}" if str(error) else type(error).__name__
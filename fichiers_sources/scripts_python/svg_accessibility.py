@@ -0,0 +1,894 @@
+#!/usr/bin/env python3
+"""
+Audit d'accessibilité des textes d'un SVG (contraste réel texte / fond)
+Usage: python svg_accessibility.py exemple_logo.svg --background "#ffffff"
+
+Le fichier est parcouru en flux (iterparse) : styles calculés (attributs de
+présentation, blocs <style>, attribut style, héritage), dégradés, opacités et
+transformations. Chaque forme peinte est rangée dans une grille bornée ; le fond
+d'un texte est recomposé à partir des formes situées sous lui, puis comparé à
+la couleur effective du texte.
+
+Limites : seuls les sélecteurs CSS simples (type, .classe, #id combinés) sont
+appliqués, une règle <style> ne s'applique qu'aux éléments qui la suivent, et
+les courbes de chemins sont approchées par leur polygone de contrôle.
+"""
+
+import re
+import sys
+import json
+import math
+import argparse
+from array import array
+from collections import deque
+from functools import lru_cache
+import xml.etree.ElementTree as ET
+
+from accessibility_tester import AccessibilityTester
+from color_engine import COLOR_CACHE_SIZE, parse_color, parse_color_alpha, relative_luminance, contrast_ratio
+
+# Grille de rangement des formes peintes : mémoire bornée quelle que soit la taille du fichier
+GRID_SIZE = 64
+MAX_SHAPES_PER_CELL = 32
+# Largeur moyenne d'un caractère, en fraction de la taille de police
+TEXT_WIDTH_FACTOR = 0.55
+MAX_TEXT_LENGTH = 80
+
+NON_RENDERED = {'defs', 'clipPath', 'mask', 'symbol', 'pattern', 'marker', 'metadata',
+                'title', 'desc', 'style', 'filter', 'linearGradient', 'radialGradient'}
+SHAPES = {'rect', 'circle', 'ellipse', 'polygon', 'polyline', 'path', 'image'}
+TEXT_ELEMENTS = {'text', 'tspan', 'textPath'}
+GRADIENTS = {'linearGradient', 'radialGradient'}
+
+INHERITED = {'fill', 'fill-opacity', 'font-size', 'font-weight', 'visibility', 'color', 'text-anchor'}
+PROPERTIES = INHERITED | {'opacity', 'display', 'stop-color', 'stop-opacity'}
+INITIAL_STYLE = {'fill': 'black', 'fill-opacity': '1', 'font-size': 16.0, 'font-weight': 'normal',
+                 'visibility': 'visible', 'color': 'black', 'text-anchor': 'start'}
+RESET_STYLE = {'opacity': '1', 'display': 'inline', 'stop-color': 'black', 'stop-opacity': '1'}
+FONT_SIZE_KEYWORDS = {'xx-small': 9.0, 'x-small': 10.0, 'small': 13.0, 'medium': 16.0,
+                      'large': 18.0, 'x-large': 24.0, 'xx-large': 32.0}
+
+IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+_NUMBER = r'[-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?'
+_PATH_TOKEN = re.compile(r'[MmLlHhVvCcSsQqTtAaZz]|' + _NUMBER)
+_PATH_ARGUMENTS = {'m': 2, 'l': 2, 'h': 1, 'v': 1, 'c': 6, 's': 4, 'q': 4, 't': 2, 'a': 7, 'z': 0}
+
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+def parse_declarations(text):
+    """'fill:#fff; opacity:.5' -> {'fill': '#fff', 'opacity': '.5'}"""
+    declarations = {}
+    for declaration in text.split(';'):
+        if ':' in declaration:
+            name, value = declaration.split(':', 1)
+            declarations[name.strip().lower()] = value.replace('!important', '').strip()
+    return declarations
+
+def _strip_at_rules(css_text):
+    """Retire les règles @ (et leurs blocs imbriqués), non prises en charge"""
+    output = []
+    position = 0
+    while True:
+        start = css_text.find('@', position)
+        if start < 0:
+            output.append(css_text[position:])
+            return ''.join(output)
+        output.append(css_text[position:start])
+        semicolon = css_text.find(';', start)
+        brace = css_text.find('{', start)
+        if brace < 0 or (0 <= semicolon < brace):
+            position = semicolon + 1 if semicolon >= 0 else len(css_text)
+            continue
+        depth = 0
+        position = brace
+        while position < len(css_text):
+            if css_text[position] == '{':
+                depth += 1
+            elif css_text[position] == '}':
+                depth -= 1
+                if depth == 0:
+                    break
+            position += 1
+        position += 1
+
+class SvgStyleSheet:
+    """Règles des blocs <style> indexées par id, classe et type d'élément"""
+
+    SELECTOR = re.compile(r'^(\*|[a-zA-Z][\w-]*)?((?:[.#][\w-]+)*)$')
+
+    def __init__(self):
+        self._index = {}
+        self._order = 0
+        self.skipped_selectors = 0
+
+    def add(self, css_text):
+        css_text = _strip_at_rules(re.sub(r'/\*.*?\*/', '', css_text, flags=re.S))
+        for selectors, body in re.findall(r'([^{}]+)\{([^{}]*)\}', css_text):
+            declarations = {name: value for name, value in parse_declarations(body).items()
+                            if name in PROPERTIES}
+            for selector in selectors.split(','):
+                selector = selector.strip()
+                match = self.SELECTOR.match(selector)
+                if not selector or not match:
+                    self.skipped_selectors += 1
+                    continue
+                tag = match.group(1) if match.group(1) != '*' else None
+                parts = re.findall(r'([.#])([\w-]+)', match.group(2))
+                ids = frozenset(name for kind, name in parts if kind == '#')
+                classes = frozenset(name for kind, name in parts if kind == '.')
+                specificity = (len(ids), len(classes), 1 if tag else 0)
+                key = ('#' + min(ids)) if ids else ('.' + min(classes)) if classes else (tag or '*')
+                self._index.setdefault(key, []).append((specificity, self._order, tag, ids, classes, declarations))
+                self._order += 1
+
+    def match(self, tag, element_id, classes):
+        """Déclarations applicables, dans l'ordre de la cascade (spécificité puis ordre)"""
+        if not self._index:
+            return {}
+        candidates = self._index.get('*', []) + self._index.get(tag, [])
+        if element_id:
+            candidates = candidates + self._index.get('#' + element_id, [])
+        for name in classes:
+            candidates = candidates + self._index.get('.' + name, [])
+
+        element_ids = {element_id} if element_id else set()
+        matched = sorted((rule for rule in candidates
+                          if (rule[2] is None or rule[2] == tag) and rule[3] <= element_ids and rule[4] <= classes),
+                         key=lambda rule: (rule[0], rule[1]))
+        declarations = {}
+        for rule in matched:
+            declarations.update(rule[5])
+        return declarations
+
+# ---------------------------------------------------------------------------
+# Géométrie : transformations affines (a, b, c, d, e, f) et formes
+# ---------------------------------------------------------------------------
+
+def multiply(m1, m2):
+    """Composition m1 × m2 (m2 appliquée en premier)"""
+    a1, b1, c1, d1, e1, f1 = m1
+    a2, b2, c2, d2, e2, f2 = m2
+    return (a1 * a2 + c1 * b2, b1 * a2 + d1 * b2,
+            a1 * c2 + c1 * d2, b1 * c2 + d1 * d2,
+            a1 * e2 + c1 * f2 + e1, b1 * e2 + d1 * f2 + f1)
+
+def apply(matrix, x, y):
+    a, b, c, d, e, f = matrix
+    return a * x + c * y + e, b * x + d * y + f
+
+def invert(matrix):
+    a, b, c, d, e, f = matrix
+    determinant = a * d - b * c
+    if determinant == 0:
+        return None
+    return (d / determinant, -b / determinant, -c / determinant, a / determinant,
+            (c * f - d * e) / determinant, (b * e - a * f) / determinant)
+
+def parse_transform(text):
+    """Attribut transform -> matrice affine"""
+    matrix = IDENTITY
+    for name, arguments in re.findall(r'(\w+)\s*\(([^)]*)\)', text or ''):
+        values = [float(value) for value in re.findall(_NUMBER, arguments)]
+        if name == 'matrix' and len(values) == 6:
+            step = tuple(values)
+        elif name == 'translate' and values:
+            step = (1, 0, 0, 1, values[0], values[1] if len(values) > 1 else 0)
+        elif name == 'scale' and values:
+            step = (values[0], 0, 0, values[1] if len(values) > 1 else values[0], 0, 0)
+        elif name == 'rotate' and values:
+            angle = math.radians(values[0])
+            cos, sin = math.cos(angle), math.sin(angle)
+            step = (cos, sin, -sin, cos, 0, 0)
+            if len(values) == 3:
+                step = multiply(multiply((1, 0, 0, 1, values[1], values[2]), step),
+                                (1, 0, 0, 1, -values[1], -values[2]))
+        elif name == 'skewX' and values:
+            step = (1, 0, math.tan(math.radians(values[0])), 1, 0, 0)
+        elif name == 'skewY' and values:
+            step = (1, math.tan(math.radians(values[0])), 0, 1, 0, 0)
+        else:
+            continue
+        matrix = multiply(matrix, step)
+    return matrix
+
+def _number(value, default=0.0):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        match = re.match(_NUMBER, (value or '').strip())
+        return float(match.group(0)) if match else default
+
+def path_polygons(d):
+    """Sous-chemins d'un attribut d, approchés par leurs points (extrémités et contrôles)"""
+    polygons = []
+    current = []
+    x = y = start_x = start_y = 0.0
+    command = None
+    tokens = _PATH_TOKEN.findall(d or '')
+    position = 0
+
+    while position < len(tokens):
+        token = tokens[position]
+        if token.isalpha():
+            command = token
+            position += 1
+            if command in 'Zz':
+                if current:
+                    polygons.append(current)
+                current = []
+                x, y = start_x, start_y
+                continue
+        elif command is None:
+            break
+
+        count = _PATH_ARGUMENTS[command.lower()]
+        arguments = tokens[position:position + count]
+        if len(arguments) < count:
+            break
+        position += count
+        values = [float(value) for value in arguments]
+        relative = command.islower()
+        lower = command.lower()
+
+        if lower == 'h':
+            x = values[0] + (x if relative else 0)
+            points = [(x, y)]
+        elif lower == 'v':
+            y = values[0] + (y if relative else 0)
+            points = [(x, y)]
+        elif lower == 'a':
+            x, y = (values[5] + x, values[6] + y) if relative else (values[5], values[6])
+            points = [(x, y)]
+        else:
+            points = []
+            for index in range(0, count, 2):
+                px, py = values[index], values[index + 1]
+                points.append((px + x, py + y) if relative else (px, py))
+            x, y = points[-1]
+
+        if lower == 'm':
+            if current:
+                polygons.append(current)
+            current = []
+            start_x, start_y = x, y
+            # Paires suivant un M : lignes implicites
+            command = 'l' if relative else 'L'
+        current.extend(points)
+
+    if current:
+        polygons.append(current)
+    return [polygon for polygon in polygons if len(polygon) >= 3]
+
+def _polygon_contains(polygons, x, y):
+    """Règle pair-impair sur l'ensemble des sous-chemins (coordonnées x, y à plat)"""
+    inside = False
+    for polygon in polygons:
+        previous_x, previous_y = polygon[-2], polygon[-1]
+        for index in range(0, len(polygon), 2):
+            point_x, point_y = polygon[index], polygon[index + 1]
+            if (point_y > y) != (previous_y > y):
+                crossing = (previous_x - point_x) * (y - point_y) / (previous_y - point_y) + point_x
+                if x < crossing:
+                    inside = not inside
+            previous_x, previous_y = point_x, point_y
+    return inside
+
+class PaintedShape:
+    """Forme peinte : géométrie locale, transformation inverse et peinture de remplissage"""
+
+    __slots__ = ('kind', 'geometry', 'inverse', 'paint', 'alpha', 'bbox', 'opaque')
+
+    def __init__(self, kind, geometry, inverse, paint, alpha, bbox):
+        self.kind = kind
+        self.geometry = geometry
+        self.inverse = inverse
+        self.paint = paint
+        self.alpha = alpha
+        self.bbox = bbox
+        self.opaque = False
+
+    def contains_local(self, x, y):
+        bx, by, width, height = self.bbox
+        if not (bx <= x <= bx + width and by <= y <= by + height):
+            return False
+        if self.kind == 'circle':
+            cx, cy, r = self.geometry
+            return (x - cx) ** 2 + (y - cy) ** 2 <= r * r
+        if self.kind == 'ellipse':
+            cx, cy, rx, ry = self.geometry
+            return ((x - cx) / rx) ** 2 + ((y - cy) / ry) ** 2 <= 1
+        if self.kind == 'polygon':
+            return _polygon_contains(self.geometry, x, y)
+        return True  # rect, image
+
+    def contains(self, x, y):
+        return self.contains_local(*apply(self.inverse, x, y))
+
+    @property
+    def convex(self):
+        return self.kind in ('rect', 'circle', 'ellipse', 'image')
+
+def _shape_geometry(tag, elem):
+    """(type, géométrie, boîte englobante locale) d'une forme, ou None si vide"""
+    if tag in ('rect', 'image'):
+        x, y = _number(elem.get('x')), _number(elem.get('y'))
+        width, height = _number(elem.get('width')), _number(elem.get('height'))
+        if width <= 0 or height <= 0:
+            return None
+        return 'rect', None, (x, y, width, height)
+    if tag == 'circle':
+        cx, cy, r = _number(elem.get('cx')), _number(elem.get('cy')), _number(elem.get('r'))
+        if r <= 0:
+            return None
+        return 'circle', (cx, cy, r), (cx - r, cy - r, 2 * r, 2 * r)
+    if tag == 'ellipse':
+        cx, cy = _number(elem.get('cx')), _number(elem.get('cy'))
+        rx, ry = _number(elem.get('rx')), _number(elem.get('ry'))
+        if rx <= 0 or ry <= 0:
+            return None
+        return 'ellipse', (cx, cy, rx, ry), (cx - rx, cy - ry, 2 * rx, 2 * ry)
+
+    if tag == 'path':
+        polygons = path_polygons(elem.get('d'))
+    else:
+        values = [float(value) for value in re.findall(_NUMBER, elem.get('points', ''))]
+        polygons = [list(zip(values[0::2], values[1::2]))]
+        polygons = [polygon for polygon in polygons if len(polygon) >= 3]
+    if not polygons:
+        return None
+    xs = [point[0] for polygon in polygons for point in polygon]
+    ys = [point[1] for polygon in polygons for point in polygon]
+    # Stockage compact : un tableau de doubles par sous-chemin
+    flat = tuple(array('d', [value for point in polygon for value in point]) for polygon in polygons)
+    return 'polygon', flat, (min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys))
+
+def _transformed_bounds(matrix, bbox):
+    """Boîte (x0, y0, x1, y1) dans le repère racine d'une boîte locale (x, y, largeur, hauteur)"""
+    a, b, c, d, e, f = matrix
+    bx, by, width, height = bbox
+    x0, y0 = a * bx + c * by + e, b * bx + d * by + f
+    if b == 0 and c == 0:
+        x1, y1 = x0 + a * width, y0 + d * height
+        return min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)
+    xs = (x0, x0 + a * width, x0 + c * height, x0 + a * width + c * height)
+    ys = (y0, y0 + b * width, y0 + d * height, y0 + b * width + d * height)
+    return min(xs), min(ys), max(xs), max(ys)
+
+@lru_cache(maxsize=COLOR_CACHE_SIZE)
+def _solid_paint(rgb, alpha):
+    """Peinture unie partagée par toutes les formes de même couleur"""
+    return ('color', tuple(channel / 255.0 for channel in rgb), alpha)
+
+def blend(rgb, alpha, backdrop):
+    """Composition d'une couleur (0-1) d'opacité alpha sur le fond backdrop"""
+    return tuple(alpha * channel + (1 - alpha) * below for channel, below in zip(rgb, backdrop))
+
+def to_hex(rgb):
+    """RGB (0-1) -> '#rrggbb'"""
+    return '#%02x%02x%02x' % tuple(round(min(max(channel, 0.0), 1.0) * 255) for channel in rgb)
+
+def _contrast(rgb_a, rgb_b):
+    return float(contrast_ratio(relative_luminance(rgb_a), relative_luminance(rgb_b)))
+
+class SvgAudit:
+    """Parcours en flux d'un SVG et mesure du contraste de chaque texte avec son fond"""
+
+    def __init__(self, tester=None, background='#ffffff', cell_capacity=MAX_SHAPES_PER_CELL):
+        self.tester = tester or AccessibilityTester()
+        self.cell_capacity = cell_capacity
+        self.background = tuple(channel / 255.0 for channel in parse_color(background))
+        self.stylesheet = SvgStyleSheet()
+        self.gradients = {}
+        self.colors_found = set()
+        self.warnings = set()
+        self.texts = []
+        self.text_elements = 0
+        self.shapes_painted = 0
+        self._text_order = 0
+
+        self._cells = {}
+        self._overflowed = set()
+        self._inverses = {}
+        self._extent = (0.0, 0.0, 1000.0, 1000.0)
+
+    # --- Parcours ---------------------------------------------------------
+
+    def run(self, source):
+        """source : chemin ou fichier ouvert ; renvoie le rapport d'audit"""
+        stack = []
+        for event, elem in ET.iterparse(source, events=('start', 'end')):
+            tag = _local_name(elem.tag)
+            if event == 'start':
+                stack.append(self._start(tag, elem, stack[-1] if stack else None))
+                continue
+
+            frame = stack.pop()
+            parent = stack[-1] if stack else None
+            self._end(tag, elem, frame, parent)
+
+            # Les éléments traités sont libérés : seule la branche courante reste en mémoire.
+            # Les enfants d'un texte restent jusqu'à la fin du texte (leurs queues en font partie).
+            if parent is not None and parent['tag'] not in TEXT_ELEMENTS:
+                elem.clear()
+                parent['elem'].remove(elem)
+
+        return self.report()
+
+    def _start(self, tag, elem, parent):
+        if parent is None:
+            self._set_extent(elem)
+            parent_style = dict(INITIAL_STYLE)
+            parent_frame = {'ctm': IDENTITY, 'alpha': 1.0, 'hidden': False, 'rendered': True,
+                            'text_position': (0.0, 0.0)}
+        else:
+            parent_style = parent['style']
+            parent_frame = parent
+
+        style = self._computed_style(tag, elem, parent_style)
+        ctm = parent_frame['ctm']
+        if 'transform' in elem.attrib:
+            ctm = multiply(ctm, parse_transform(elem.get('transform')))
+        if tag == 'svg' and parent is not None:
+            ctm = multiply(ctm, (1, 0, 0, 1, _number(elem.get('x')), _number(elem.get('y'))))
+
+        frame = {
+            'tag': tag,
+            'elem': elem,
+            'style': style,
+            'ctm': ctm,
+            'alpha': parent_frame['alpha'] * parse_opacity(style['opacity']),
+            'hidden': parent_frame['hidden'] or style['display'] == 'none',
+            'rendered': parent_frame['rendered'] and tag not in NON_RENDERED,
+            'text_position': parent_frame['text_position']
+        }
+
+        if tag in TEXT_ELEMENTS:
+            # Les textes se terminent après leurs tspan : l'ordre du document est noté à l'ouverture
+            frame['order'] = self._text_order
+            self._text_order += 1
+            x, y = frame['text_position']
+            x = _number(elem.get('x'), x) if elem.get('x') else x
+            y = _number(elem.get('y'), y) if elem.get('y') else y
+            frame['text_position'] = (x, y)
+        if tag in GRADIENTS:
+            frame['stops'] = []
+        if tag == 'use':
+            self.warnings.add("éléments <use> non résolus")
+        if tag in SHAPES and frame['rendered'] and not frame['hidden']:
+            self._paint_shape(tag, elem, frame)
+        return frame
+
+    def _end(self, tag, elem, frame, parent):
+        if tag == 'style':
+            self.stylesheet.add(''.join(elem.itertext()))
+        elif tag == 'stop' and parent is not None and 'stops' in parent:
+            self._add_stop(elem, frame, parent)
+        elif tag in GRADIENTS and elem.get('id'):
+            self.gradients[elem.get('id')] = {
+                'kind': tag,
+                'attrs': dict(elem.attrib),
+                'stops': frame['stops']
+            }
+        elif tag in TEXT_ELEMENTS:
+            if tag == 'text':
+                self.text_elements += 1
+            # Caractères propres à l'élément : son texte et la queue de ses enfants
+            chars = (elem.text or '') + ''.join(child.tail or '' for child in elem)
+            if frame['rendered'] and not frame['hidden']:
+                self._check_text(elem, frame, chars)
+
+    def _set_extent(self, root):
+        view_box = [float(value) for value in re.findall(_NUMBER, root.get('viewBox', ''))]
+        if len(view_box) == 4 and view_box[2] > 0 and view_box[3] > 0:
+            self._extent = tuple(view_box)
+        else:
+            width, height = _number(root.get('width')), _number(root.get('height'))
+            if width > 0 and height > 0:
+                self._extent = (0.0, 0.0, width, height)
+
+    # --- Styles -----------------------------------------------------------
+
+    def _computed_style(self, tag, elem, parent_style):
+        style = {name: parent_style[name] for name in INHERITED}
+        style.update(RESET_STYLE)
+
+        specified = {name: value for name, value in elem.attrib.items() if name in PROPERTIES}
+        classes = frozenset(elem.get('class', '').split())
+        specified.update(self.stylesheet.match(tag, elem.get('id'), classes))
+        if 'style' in elem.attrib:
+            specified.update((name, value) for name, value in parse_declarations(elem.get('style')).items()
+                             if name in PROPERTIES)
+
+        for name, value in specified.items():
+            value = value.strip()
+            if value == 'inherit':
+                style[name] = parent_style.get(name, INITIAL_STYLE.get(name, RESET_STYLE.get(name)))
+            elif name == 'font-size':
+                style[name] = parse_font_size(value, parent_style['font-size'])
+            else:
+                style[name] = value
+        return style
+
+    def _paint(self, value, style):
+        """Valeur de fill/stop-color -> None, ('color', rgb, alpha), ('url', id, repli) ou ('unknown', texte)
+
+        L'alpha d'une couleur rgba()/#rrggbbaa/transparent s'ajoute à fill-opacity
+        et stop-opacity au lieu d'être ignoré.
+        """
+        value = value.strip()
+        lowered = value.lower()
+        if lowered == 'none':
+            return None
+        if lowered.startswith('url('):
+            match = re.match(r'url\(\s*["\']?#([^)"\']+)["\']?\s*\)\s*(.*)$', value)
+            if not match:
+                return ('unknown', value)
+            fallback = self._paint(match.group(2), style) if match.group(2) else None
+            return ('url', match.group(1), fallback)
+        if lowered == 'currentcolor':
+            value = style['color']
+        try:
+            rgb, alpha = parse_color_alpha(value)
+        except ValueError:
+            self.warnings.add(f"couleur non reconnue: {value}")
+            return ('unknown', value)
+        if alpha > 0:
+            self.colors_found.add('#%02x%02x%02x' % rgb)
+        return _solid_paint(rgb, alpha)
+
+    # --- Dégradés ---------------------------------------------------------
+
+    def _add_stop(self, elem, frame, gradient_frame):
+        offset_text = elem.get('offset', '0').strip()
+        offset = _number(offset_text) / 100 if offset_text.endswith('%') else _number(offset_text)
+        stops = gradient_frame['stops']
+        offset = min(max(offset, stops[-1][0] if stops else 0.0), 1.0)
+        paint = self._paint(frame['style']['stop-color'], frame['style'])
+        rgb, alpha = (paint[1], paint[2]) if paint and paint[0] == 'color' else (None, 1.0)
+        stops.append((offset, rgb, alpha * parse_opacity(frame['style']['stop-opacity'])))
+
+    def _resolve_gradient(self, gradient_id):
+        """Attributs et arrêts d'un dégradé, en suivant les références href"""
+        attrs = {}
+        stops = None
+        kind = None
+        seen = set()
+        while gradient_id and gradient_id not in seen:
+            seen.add(gradient_id)
+            gradient = self.gradients.get(gradient_id)
+            if gradient is None:
+                break
+            kind = kind or gradient['kind']
+            for name, value in gradient['attrs'].items():
+                attrs.setdefault(name, value)
+            if stops is None and gradient['stops']:
+                stops = gradient['stops']
+            href = gradient['attrs'].get('href') or gradient['attrs'].get('{http://www.w3.org/1999/xlink}href', '')
+            gradient_id = href[1:] if href.startswith('#') else None
+        if kind is None or not stops or any(rgb is None for _, rgb, _ in stops):
+            return None
+        return kind, attrs, stops
+
+    def _gradient_color(self, gradient_id, x, y, bbox):
+        """(rgb, alpha) du dégradé au point local (x, y) d'un élément de boîte bbox"""
+        gradient = self._resolve_gradient(gradient_id)
+        if gradient is None:
+            return None
+        kind, attrs, stops = gradient
+
+        if attrs.get('gradientUnits', 'objectBoundingBox') == 'objectBoundingBox':
+            bx, by, width, height = bbox
+            x = (x - bx) / width if width else 0.0
+            y = (y - by) / height if height else 0.0
+            reference = (1.0, 1.0)
+        else:
+            reference = (self._extent[2], self._extent[3])
+        if 'gradientTransform' in attrs:
+            inverse = invert(parse_transform(attrs['gradientTransform']))
+            if inverse:
+                x, y = apply(inverse, x, y)
+
+        def length(name, default, axis):
+            value = attrs.get(name, default).strip()
+            if value.endswith('%'):
+                scale = reference[axis] if axis < 2 else math.hypot(*reference) / math.sqrt(2)
+                return _number(value) / 100 * scale
+            return _number(value)
+
+        if kind == 'linearGradient':
+            x1, y1 = length('x1', '0%', 0), length('y1', '0%', 1)
+            x2, y2 = length('x2', '100%', 0), length('y2', '0%', 1)
+            dx, dy = x2 - x1, y2 - y1
+            denominator = dx * dx + dy * dy
+            t = ((x - x1) * dx + (y - y1) * dy) / denominator if denominator else 0.0
+        else:
+            cx, cy, r = length('cx', '50%', 0), length('cy', '50%', 1), length('r', '50%', 2)
+            t = math.hypot(x - cx, y - cy) / r if r else 1.0
+
+        spread = attrs.get('spreadMethod', 'pad')
+        if spread == 'repeat':
+            t %= 1.0
+        elif spread == 'reflect':
+            t = 1 - abs(t % 2 - 1)
+        t = min(max(t, 0.0), 1.0)
+
+        previous = stops[0]
+        for stop in stops:
+            if t <= stop[0]:
+                span = stop[0] - previous[0]
+                ratio = (t - previous[0]) / span if span > 0 else 1.0
+                rgb = tuple(a + (b - a) * ratio for a, b in zip(previous[1], stop[1]))
+                return rgb, previous[2] + (stop[2] - previous[2]) * ratio
+            previous = stop
+        return previous[1], previous[2]
+
+    def _paint_at(self, paint, alpha, local_x, local_y, bbox):
+        """(rgb, alpha) d'une peinture en un point, ou None si indéterminée"""
+        if paint is None:
+            return None
+        if paint[0] == 'color':
+            return paint[1], paint[2] * alpha
+        if paint[0] == 'url':
+            color = self._gradient_color(paint[1], local_x, local_y, bbox)
+            if color is not None:
+                return color[0], color[1] * alpha
+            if paint[2] is not None:
+                return self._paint_at(paint[2], alpha, local_x, local_y, bbox)
+            self.warnings.add(f"dégradé introuvable ou défini après usage: #{paint[1]}")
+        return None
+
+    # --- Formes et fonds --------------------------------------------------
+
+    def _inverse(self, ctm):
+        """Inverse partagée par les formes d'un même repère"""
+        inverse = self._inverses.get(ctm)
+        if inverse is None:
+            if len(self._inverses) >= COLOR_CACHE_SIZE:
+                self._inverses.clear()
+            inverse = self._inverses[ctm] = invert(ctm)
+        return inverse
+
+    def _cell_index(self, x, y):
+        min_x, min_y, width, height = self._extent
+        column = int((x - min_x) / width * GRID_SIZE)
+        row = int((y - min_y) / height * GRID_SIZE)
+        return min(max(column, 0), GRID_SIZE - 1), min(max(row, 0), GRID_SIZE - 1)
+
+    def _cell_rect(self, column, row):
+        min_x, min_y, width, height = self._extent
+        cell_width, cell_height = width / GRID_SIZE, height / GRID_SIZE
+        x, y = min_x + column * cell_width, min_y + row * cell_height
+        return x, y, x + cell_width, y + cell_height
+
+    def _covers_cell(self, shape, bounds, column, row):
+        """La forme (convexe, opaque) recouvre-t-elle entièrement la cellule ?"""
+        x0, y0, x1, y1 = self._cell_rect(column, row)
+        if x0 < bounds[0] or y0 < bounds[1] or x1 > bounds[2] or y1 > bounds[3]:
+            return False
+        return all(shape.contains(x, y) for x, y in ((x0, y0), (x1, y0), (x0, y1), (x1, y1)))
+
+    def _paint_shape(self, tag, elem, frame):
+        geometry = _shape_geometry(tag, elem)
+        inverse = self._inverse(frame['ctm'])
+        if geometry is None or inverse is None:
+            return
+        style = frame['style']
+        if style['visibility'] in ('hidden', 'collapse'):
+            return
+
+        if tag == 'image':
+            paint = ('unknown', 'image')
+            alpha = frame['alpha']
+        else:
+            paint = self._paint(style['fill'], style)
+            if paint is None or paint[0] == 'color' and paint[2] <= 0:
+                return
+            alpha = frame['alpha'] * parse_opacity(style['fill-opacity'])
+
+        kind, shape_geometry, bbox = geometry
+        shape = PaintedShape(kind, shape_geometry, inverse, paint, alpha, bbox)
+        if alpha >= 1:
+            if paint[0] == 'color':
+                shape.opaque = paint[2] >= 1
+            elif paint[0] == 'url':
+                gradient = self._resolve_gradient(paint[1])
+                shape.opaque = gradient is not None and all(opacity >= 1 for _, _, opacity in gradient[2])
+        self.shapes_painted += 1
+
+        bounds = _transformed_bounds(frame['ctm'], bbox)
+        first = self._cell_index(bounds[0], bounds[1])
+        last = self._cell_index(bounds[2], bounds[3])
+        may_cover = shape.opaque and shape.convex
+
+        for column in range(first[0], last[0] + 1):
+            for row in range(first[1], last[1] + 1):
+                cell = self._cells.get((column, row))
+                if cell is None:
+                    cell = self._cells[(column, row)] = deque(maxlen=self.cell_capacity)
+                elif may_cover and self._covers_cell(shape, bounds, column, row):
+                    # Tout ce qui est dessous est masqué dans cette cellule
+                    cell.clear()
+                    self._overflowed.discard((column, row))
+                if len(cell) == self.cell_capacity:
+                    self._overflowed.add((column, row))
+                cell.append(shape)
+
+    def backdrop_at(self, x, y):
+        """Couleur composée sous le point (x, y) du repère racine, et indicateur d'approximation"""
+        index = self._cell_index(x, y)
+        layers = []
+        approximate = False
+        for shape in reversed(self._cells.get(index, ())):
+            local_x, local_y = apply(shape.inverse, x, y)
+            if not shape.contains_local(local_x, local_y):
+                continue
+            layer = self._paint_at(shape.paint, shape.alpha, local_x, local_y, shape.bbox)
+            if layer is None:
+                approximate = True
+                continue
+            layers.append(layer)
+            if layer[1] >= 1:
+                break
+        else:
+            # Formes les plus anciennes évincées de la cellule : le fond peut être incomplet
+            approximate = approximate or index in self._overflowed
+
+        color = self.background
+        for rgb, alpha in reversed(layers):
+            color = blend(rgb, alpha, color)
+        return color, approximate
+
+    # --- Textes -----------------------------------------------------------
+
+    def _check_text(self, elem, frame, chars):
+        text = ' '.join(chars.split())
+        style = frame['style']
+        if not text or style['visibility'] in ('hidden', 'collapse'):
+            return
+        paint = self._paint(style['fill'], style)
+        if paint is None or paint[0] == 'color' and paint[2] <= 0:
+            return
+
+        font_size = style['font-size']
+        x, y = frame['text_position']
+        width = TEXT_WIDTH_FACTOR * font_size * len(text)
+        anchor = style['text-anchor']
+        left = x - width / 2 if anchor == 'middle' else x - width if anchor == 'end' else x
+        bbox = (left, y - font_size, width, font_size)
+
+        ctm = frame['ctm']
+        scale = math.sqrt(abs(ctm[0] * ctm[3] - ctm[1] * ctm[2]))
+        alpha = frame['alpha'] * parse_opacity(style['fill-opacity'])
+
+        # Plusieurs points le long du texte, à mi-hauteur des minuscules : le pire est retenu
+        worst = None
+        approximate = False
+        for fraction in (0.1, 0.5, 0.9):
+            local_x, local_y = left + width * fraction, y - 0.35 * font_size
+            backdrop, backdrop_approximate = self.backdrop_at(*apply(ctm, local_x, local_y))
+            color = self._paint_at(paint, alpha, local_x, local_y, bbox)
+            if color is None:
+                approximate = True
+                continue
+            foreground = blend(color[0], color[1], backdrop)
+            ratio = _contrast(foreground, backdrop)
+            approximate = approximate or backdrop_approximate
+            if worst is None or ratio < worst[0]:
+                worst = (ratio, foreground, backdrop)
+
+        if worst is None:
+            self.warnings.add(f"texte non évalué (couleur indéterminée): {text[:MAX_TEXT_LENGTH]}")
+            return
+
+        ratio, foreground, backdrop = worst
+        font_size_px = {'value': round(font_size * scale, 2), 'unit': 'px'}
+        is_large = self.tester.is_large_text(font_size_px)
+        compliance = {level: ratio >= thresholds['large' if is_large else 'small']
+                      for level, thresholds in self.tester.wcag_levels.items()}
+
+        self.texts.append((frame['order'], {
+            'text': text[:MAX_TEXT_LENGTH],
+            'element': frame['tag'],
+            'id': elem.get('id'),
+            'fill': style['fill'],
+            'font_size': font_size_px,
+            'is_large_text': is_large,
+            'foreground': to_hex(foreground),
+            'backdrop': to_hex(backdrop),
+            'contrast_ratio': round(ratio, 2),
+            'wcag_compliance': compliance,
+            'overall_compliant': all(compliance.values()),
+            'approximate': approximate
+        }))
+
+    def report(self):
+        texts = [text for _, text in sorted(self.texts, key=lambda entry: entry[0])]
+        checked = len(texts)
+        return {
+            'colors_found': sorted(self.colors_found),
+            'text_elements': self.text_elements,
+            'has_colors': bool(self.colors_found),
+            'background': to_hex(self.background),
+            'texts': texts,
+            'summary': {
+                'texts_checked': checked,
+                'aa_compliant': sum(1 for text in texts if text['wcag_compliance']['AA']),
+                'aaa_compliant': sum(1 for text in texts if text['wcag_compliance']['AAA']),
+                'approximate': sum(1 for text in texts if text['approximate']),
+                'shapes_painted': self.shapes_painted,
+                'unsupported_selectors': self.stylesheet.skipped_selectors
+            },
+            'warnings': sorted(self.warnings)
+        }
+
+def parse_opacity(value):
+    """Opacité CSS/SVG ('0.5' ou '50%') -> [0, 1], 1 si illisible"""
+    value = str(value).strip()
+    number = _number(value, 1.0) / (100 if value.endswith('%') else 1)
+    return min(max(number, 0.0), 1.0)
+
+def parse_font_size(value, parent_size):
+    """Taille de police CSS/SVG -> px, relative à celle du parent"""
+    value = value.strip().lower()
+    if value in FONT_SIZE_KEYWORDS:
+        return FONT_SIZE_KEYWORDS[value]
+    if value == 'larger':
+        return parent_size * 1.2
+    if value == 'smaller':
+        return parent_size / 1.2
+    number = _number(value, None)
+    if number is None:
+        return parent_size
+    if value.endswith('%'):
+        return parent_size * number / 100
+    if value.endswith(('em', 'rem')):
+        return parent_size * number if value.endswith('em') and not value.endswith('rem') else 16.0 * number
+    if value.endswith('pt'):
+        return number * 1.333
+    return number
+
+def audit_svg(source, tester=None, background='#ffffff', cell_capacity=MAX_SHAPES_PER_CELL):
+    """Rapport d'accessibilité des textes d'un SVG (chemin ou fichier ouvert)
+
+    cell_capacity borne la mémoire : au plus GRID_SIZE² × cell_capacity formes
+    sont conservées, les plus anciennes (dessous) étant évincées en premier.
+    """
+    return SvgAudit(tester, background, cell_capacity).run(source)
+
+def main():
+    """Point d'entrée principal"""
+    parser = argparse.ArgumentParser(description="Audit de contraste des textes d'un SVG")
+    parser.add_argument('svg_file', help='Fichier SVG à analyser')
+    parser.add_argument('--background', default='#ffffff', help='Couleur de la page sous le SVG')
+    parser.add_argument('--output', '-o', help='Rapport JSON')
+    parser.add_argument('--cell-capacity', type=int, default=MAX_SHAPES_PER_CELL,
+                        help=f'Formes conservées par cellule de la grille {GRID_SIZE}×{GRID_SIZE} (borne mémoire)')
+
+    args = parser.parse_args()
+
+    try:
+        report = audit_svg(args.svg_file, background=args.background, cell_capacity=args.cell_capacity)
+    except (OSError, ET.ParseError, ValueError) as e:
+        print(f"Erreur: {e}")
+        sys.exit(1)
+
+    summary = report['summary']
+    print(f"🔍 {args.svg_file}: {summary['texts_checked']} textes, {summary['shapes_painted']} formes peintes")
+    for text in report['texts']:
+        level = "✅ AAA" if text['wcag_compliance']['AAA'] else "✅ AA" if text['wcag_compliance']['AA'] else "❌"
+        approximate = " (fond approché)" if text['approximate'] else ""
+        print(f"  {level} «{text['text']}» {text['foreground']} sur {text['backdrop']} - "
+              f"Ratio: {text['contrast_ratio']} ({text['font_size']['value']}px){approximate}")
+    for warning in report['warnings']:
+        print(f"  ⚠️  {warning}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if summary['aa_compliant'] < summary['texts_checked']:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()